@@ -8,14 +8,25 @@ This example shows how to:
 """
 
 import asyncio
+import heapq
+import sys
+from collections import defaultdict
 from datetime import datetime
+from typing import List, NamedTuple, Tuple
 
 from jaiminho_notificacoes.processing.agents import (
     get_classification_agent,
+    ClassificationAgent,
     ClassificationResult
 )
 from jaiminho_notificacoes.processing.urgency_engine import UrgencyDecision
 from jaiminho_notificacoes.processing.orchestrator import get_orchestrator
+from jaiminho_notificacoes.processing.categories import (
+    CAT_DELIVERY,
+    CAT_FAMILY,
+    CAT_FINANCE,
+    CAT_HEALTH,
+)
 from jaiminho_notificacoes.persistence.models import (
     NormalizedMessage,
     MessageContent,
@@ -26,45 +37,93 @@ from jaiminho_notificacoes.persistence.models import (
 )
 
 
+class CategorySample(NamedTuple):
+    """Sample message with the category the agent should assign."""
+    text: str
+    sender: str
+    phone: str
+    expected_category: str
+
+
+# Sample messages from different categories
+CATEGORY_SAMPLES: Tuple[CategorySample, ...] = (
+    CategorySample(
+        "Seu pedido #12345 foi enviado! Código rastreio: BR987654321",
+        "Loja Online", "5511888888888", CAT_DELIVERY
+    ),
+    CategorySample(
+        "Boleto de R$ 350,00 vence amanhã. Pague via PIX: chave@email.com",
+        "Banco XYZ", "5511777777777", CAT_FINANCE
+    ),
+    CategorySample(
+        "Mamãe, vou chegar tarde hoje. Beijos!",
+        "Filho", "5511666666666", CAT_FAMILY
+    ),
+    CategorySample(
+        "Resultado do seu exame está disponível no portal. Consulta dia 10.",
+        "Dr. Paulo", "5511555555555", CAT_HEALTH
+    ),
+)
+
+# Same limit as the WhatsApp digest (UserDigest.to_whatsapp_text)
+DIGEST_MESSAGES_PER_CATEGORY = 3
+
+# Shared sub-models for every sample message; only the per-message
+# fields are built in create_sample_message
+_DEMO_SOURCE = MessageSource(platform="wapi", instance_id="demo_instance")
+_DEMO_SECURITY = MessageSecurity(
+    validated_at=datetime.now().isoformat(),
+    validation_passed=True,
+    instance_verified=True,
+    tenant_resolved=True,
+    phone_ownership_verified=True
+)
+
+
 def create_sample_message(
     text: str,
     sender_name: str,
     sender_phone: str,
-    is_group: bool = False
+    is_group: bool = False,
+    validate: bool = False
 ) -> NormalizedMessage:
-    """Create a sample normalized message for testing."""
-    return NormalizedMessage(
-        message_id=f"msg_{datetime.now().timestamp()}",
+    """
+    Create a sample normalized message for testing.
+    
+    Demo inputs are known-valid, so Pydantic validation is skipped unless
+    validate=True.
+    """
+    ts = datetime.now().timestamp()
+    
+    if validate:
+        content = MessageContent(text=text)
+        metadata = MessageMetadata(is_group=is_group)
+        build = NormalizedMessage
+    else:
+        content = MessageContent.model_construct(text=text)
+        metadata = MessageMetadata.model_construct(is_group=is_group)
+        build = NormalizedMessage.model_construct
+    
+    return build(
+        message_id=f"msg_{ts}",
         tenant_id="demo_tenant",
         user_id="demo_user",
         sender_phone=sender_phone,
         sender_name=sender_name,
-        message_type=MessageType.TEXT,
-        content=MessageContent(text=text),
-        timestamp=int(datetime.now().timestamp()),
-        source=MessageSource(
-            platform="wapi",
-            instance_id="demo_instance"
-        ),
-        metadata=MessageMetadata(is_group=is_group),
-        security=MessageSecurity(
-            validated_at=datetime.now().isoformat(),
-            validation_passed=True,
-            instance_verified=True,
-            tenant_resolved=True,
-            phone_ownership_verified=True
-        )
+        message_type=MessageType.TEXT.value,
+        content=content,
+        timestamp=int(ts),
+        source=_DEMO_SOURCE,
+        metadata=metadata,
+        security=_DEMO_SECURITY
     )
 
 
-async def example_basic_classification():
+async def example_basic_classification(agent: ClassificationAgent, out: List[str]):
     """Example 1: Basic classification with the agent."""
-    print("\n" + "="*80)
-    print("Example 1: Basic Message Classification")
-    print("="*80)
-    
-    # Create agent
-    agent = get_classification_agent()
+    out.append("\n" + "="*80)
+    out.append("Example 1: Basic Message Classification")
+    out.append("="*80)
     
     # Create sample message
     message = create_sample_message(
@@ -81,81 +140,54 @@ async def example_basic_classification():
     )
     
     # Display results
-    print(f"\n📋 Classificação:")
-    print(f"   Categoria: {result.category}")
-    print(f"   Resumo: {result.summary}")
-    print(f"   Roteamento: {result.routing}")
-    print(f"   Confiança: {result.confidence:.2f}")
-    print(f"   Justificativa: {result.reasoning}")
+    out.append(f"\n📋 Classificação:")
+    out.append(f"   Categoria: {result.category}")
+    out.append(f"   Resumo: {result.summary}")
+    out.append(f"   Roteamento: {result.routing}")
+    out.append(f"   Confiança: {result.confidence:.2f}")
+    out.append(f"   Justificativa: {result.reasoning}")
 
 
-async def example_multiple_categories():
+async def example_multiple_categories(agent: ClassificationAgent, out: List[str]):
     """Example 2: Classify messages across different categories."""
-    print("\n" + "="*80)
-    print("Example 2: Multiple Category Classification")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("Example 2: Multiple Category Classification")
+    out.append("="*80)
     
-    agent = get_classification_agent()
+    out.append("\n📊 Classificando mensagens:\n")
     
-    # Sample messages from different categories
-    test_messages = [
-        {
-            "text": "Seu pedido #12345 foi enviado! Código rastreio: BR987654321",
-            "sender": "Loja Online",
-            "phone": "5511888888888",
-            "expected_category": "📦 Entregas e Compras"
-        },
-        {
-            "text": "Boleto de R$ 350,00 vence amanhã. Pague via PIX: chave@email.com",
-            "sender": "Banco XYZ",
-            "phone": "5511777777777",
-            "expected_category": "💰 Financeiro"
-        },
-        {
-            "text": "Mamãe, vou chegar tarde hoje. Beijos!",
-            "sender": "Filho",
-            "phone": "5511666666666",
-            "expected_category": "👨‍👩‍👧 Família e Amigos"
-        },
-        {
-            "text": "Resultado do seu exame está disponível no portal. Consulta dia 10.",
-            "sender": "Dr. Paulo",
-            "phone": "5511555555555",
-            "expected_category": "🏥 Saúde"
-        }
+    messages = [
+        create_sample_message(
+            text=sample.text,
+            sender_name=sample.sender,
+            sender_phone=sample.phone
+        )
+        for sample in CATEGORY_SAMPLES
     ]
     
-    print("\n📊 Classificando mensagens:\n")
+    # Single LLM call for the whole batch
+    results = await agent.run_batch(
+        messages,
+        [UrgencyDecision.NOT_URGENT] * len(messages),
+        [0.7] * len(messages)
+    )
     
-    for idx, msg_data in enumerate(test_messages, 1):
-        message = create_sample_message(
-            text=msg_data["text"],
-            sender_name=msg_data["sender"],
-            sender_phone=msg_data["phone"]
-        )
+    for idx, (sample, result) in enumerate(zip(CATEGORY_SAMPLES, results), 1):
+        # Categories are the shared interned constants, so exact equality applies
+        match = "✅" if result.category == sample.expected_category else "❌"
         
-        result = await agent.run(
-            message=message,
-            urgency_decision=UrgencyDecision.NOT_URGENT,
-            urgency_confidence=0.7
-        )
-        
-        match = "✅" if msg_data["expected_category"] in result.category else "❌"
-        
-        print(f"{idx}. {msg_data['sender']}")
-        print(f"   Categoria: {result.category} {match}")
-        print(f"   Resumo: {result.summary}")
-        print(f"   Roteamento: {result.routing}")
-        print()
+        out.append(f"{idx}. {sample.sender}")
+        out.append(f"   Categoria: {result.category} {match}")
+        out.append(f"   Resumo: {result.summary}")
+        out.append(f"   Roteamento: {result.routing}")
+        out.append("")
 
 
-async def example_urgent_routing():
+async def example_urgent_routing(agent: ClassificationAgent, out: List[str]):
     """Example 3: Urgent message routing."""
-    print("\n" + "="*80)
-    print("Example 3: Urgent Message Routing")
-    print("="*80)
-    
-    agent = get_classification_agent()
+    out.append("\n" + "="*80)
+    out.append("Example 3: Urgent Message Routing")
+    out.append("="*80)
     
     # Urgent message
     message = create_sample_message(
@@ -171,19 +203,19 @@ async def example_urgent_routing():
         urgency_confidence=0.9
     )
     
-    print(f"\n🚨 Mensagem Urgente:")
-    print(f"   Categoria: {result.category}")
-    print(f"   Resumo: {result.summary}")
-    print(f"   Roteamento: {result.routing} {'✅ (immediate)' if result.routing == 'immediate' else '❌'}")
-    print(f"   Confiança: {result.confidence:.2f}")
-    print(f"   Ação: {'Enviar notificação imediata via SendPulse' if result.routing == 'immediate' else 'Adicionar ao digest'}")
+    out.append(f"\n🚨 Mensagem Urgente:")
+    out.append(f"   Categoria: {result.category}")
+    out.append(f"   Resumo: {result.summary}")
+    out.append(f"   Roteamento: {result.routing} {'✅ (immediate)' if result.routing == 'immediate' else '❌'}")
+    out.append(f"   Confiança: {result.confidence:.2f}")
+    out.append(f"   Ação: {'Enviar notificação imediata via SendPulse' if result.routing == 'immediate' else 'Adicionar ao digest'}")
 
 
-async def example_full_orchestration():
+async def example_full_orchestration(agent: ClassificationAgent, out: List[str]):
     """Example 4: Full orchestration pipeline."""
-    print("\n" + "="*80)
-    print("Example 4: Full Orchestration Pipeline")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("Example 4: Full Orchestration Pipeline")
+    out.append("="*80)
     
     orchestrator = get_orchestrator()
     
@@ -194,40 +226,35 @@ async def example_full_orchestration():
         sender_phone="5511333333333"
     )
     
-    print("\n📨 Processando mensagem através do pipeline completo...\n")
+    out.append("\n📨 Processando mensagem através do pipeline completo...\n")
     
     # Process through full pipeline
     result = await orchestrator.process(message)
     
-    print(f"✅ Processamento Completo!")
-    print(f"\n📊 Resultados:")
-    print(f"   Decisão Final: {result.decision.value}")
-    print(f"   Rule Engine: {result.rule_engine_decision}")
-    print(f"   LLM Usado: {result.llm_used}")
-    print(f"   Confiança: {result.rule_confidence:.2f}")
+    out.append(f"✅ Processamento Completo!")
+    out.append(f"\n📊 Resultados:")
+    out.append(f"   Decisão Final: {result.decision.value}")
+    out.append(f"   Rule Engine: {result.rule_engine_decision}")
+    out.append(f"   LLM Usado: {result.llm_used}")
+    out.append(f"   Confiança: {result.rule_confidence:.2f}")
     
     # Find classification step in audit trail
-    classification_step = next(
-        (step for step in result.audit_trail if step.get("step") == "classification_agent"),
-        None
-    )
+    classification_step = result.audit_by_step.get("classification_agent")
     
     if classification_step:
-        print(f"\n🏷️  Classificação:")
-        print(f"   Categoria: {classification_step.get('category', 'N/A')}")
-        print(f"   Resumo: {classification_step.get('summary', 'N/A')}")
-        print(f"   Roteamento: {classification_step.get('routing', 'N/A')}")
+        out.append(f"\n🏷️  Classificação:")
+        out.append(f"   Categoria: {classification_step.get('category', 'N/A')}")
+        out.append(f"   Resumo: {classification_step.get('summary', 'N/A')}")
+        out.append(f"   Roteamento: {classification_step.get('routing', 'N/A')}")
 
 
-async def example_tenant_isolation():
+async def example_tenant_isolation(agent: ClassificationAgent, out: List[str]):
     """Example 5: Demonstrate tenant isolation."""
-    print("\n" + "="*80)
-    print("Example 5: Tenant Isolation (Security)")
-    print("="*80)
-    
-    agent = get_classification_agent()
+    out.append("\n" + "="*80)
+    out.append("Example 5: Tenant Isolation (Security)")
+    out.append("="*80)
     
-    print("\n🔒 Demonstrando isolamento de tenant:\n")
+    out.append("\n🔒 Demonstrando isolamento de tenant:\n")
     
     # Valid message with proper tenant isolation
     valid_message = create_sample_message(
@@ -242,16 +269,17 @@ async def example_tenant_isolation():
             urgency_decision=UrgencyDecision.NOT_URGENT,
             urgency_confidence=0.7
         )
-        print("✅ Mensagem válida processada com sucesso")
-        print(f"   Tenant: {valid_message.tenant_id}")
-        print(f"   User: {valid_message.user_id}")
-        print(f"   Categoria: {result.category}")
+        out.append("✅ Mensagem válida processada com sucesso")
+        out.append(f"   Tenant: {valid_message.tenant_id}")
+        out.append(f"   User: {valid_message.user_id}")
+        out.append(f"   Categoria: {result.category}")
     except Exception as e:
-        print(f"❌ Erro: {e}")
+        out.append(f"❌ Erro: {e}")
     
     # Invalid message without tenant_id
-    print("\n🚫 Testando mensagem SEM tenant_id (deve falhar):")
-    invalid_message = valid_message.model_copy(update={"tenant_id": ""})
+    out.append("\n🚫 Testando mensagem SEM tenant_id (deve falhar):")
+    # Shallow copy without revalidation: the nested sub-models are shared
+    invalid_message = valid_message.model_copy(update={"tenant_id": ""}, deep=False)
     
     try:
         result = await agent.run(
@@ -259,19 +287,17 @@ async def example_tenant_isolation():
             urgency_decision=UrgencyDecision.NOT_URGENT,
             urgency_confidence=0.7
         )
-        print("❌ ERRO: Mensagem inválida foi processada (não deveria)")
+        out.append("❌ ERRO: Mensagem inválida foi processada (não deveria)")
     except ValueError as e:
-        print(f"✅ Validação funcionou corretamente!")
-        print(f"   Erro capturado: {str(e)}")
+        out.append(f"✅ Validação funcionou corretamente!")
+        out.append(f"   Erro capturado: {str(e)}")
 
 
-async def example_digest_generation():
+async def example_digest_generation(agent: ClassificationAgent, out: List[str]):
     """Example 6: Generate digest summaries."""
-    print("\n" + "="*80)
-    print("Example 6: Digest Summary Generation")
-    print("="*80)
-    
-    agent = get_classification_agent()
+    out.append("\n" + "="*80)
+    out.append("Example 6: Digest Summary Generation")
+    out.append("="*80)
     
     # Multiple messages for digest
     messages = [
@@ -281,48 +307,68 @@ async def example_digest_generation():
         ("Oi tudo bem? Vamos marcar um café", "Amigo", "5511111111114"),
     ]
     
-    print("\n📧 Gerando resumos para digest diário:\n")
-    print("="*80)
+    out.append("\n📧 Gerando resumos para digest diário:\n")
+    out.append("="*80)
     
-    categories_digest = {}
+    categories_digest = defaultdict(list)
     
-    for text, sender, phone in messages:
-        message = create_sample_message(text, sender, phone)
-        
-        result = await agent.run(
-            message=message,
-            urgency_decision=UrgencyDecision.NOT_URGENT,
-            urgency_confidence=0.8
-        )
-        
-        # Group by category
-        if result.category not in categories_digest:
-            categories_digest[result.category] = []
-        
-        categories_digest[result.category].append(result.summary)
+    digest_messages = [
+        create_sample_message(text, sender, phone)
+        for text, sender, phone in messages
+    ]
+    
+    # Single LLM call for the whole batch
+    results = await agent.run_batch(
+        digest_messages,
+        [UrgencyDecision.NOT_URGENT] * len(digest_messages),
+        [0.8] * len(digest_messages)
+    )
+    
+    # Group by category, keeping only the most recent summaries per category
+    # in a bounded min-heap so memory stays fixed regardless of volume
+    for seq, (message, result) in enumerate(zip(digest_messages, results)):
+        heap = categories_digest[result.category]
+        entry = (message.timestamp, seq, result.summary)
+        if len(heap) < DIGEST_MESSAGES_PER_CATEGORY:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heappushpop(heap, entry)
     
     # Display as digest
-    print("\n📬 Seu Digest Diário\n")
+    out.append("\n📬 Seu Digest Diário\n")
     
-    for category, summaries in categories_digest.items():
-        print(f"\n{category}")
-        print("-" * 60)
-        for summary in summaries:
-            print(f"  • {summary}")
+    for category, heap in categories_digest.items():
+        out.append(f"\n{category}")
+        out.append("-" * 60)
+        for _, _, summary in sorted(heap, reverse=True):
+            out.append(f"  • {summary}")
     
-    print("\n" + "="*80)
+    out.append("\n" + "="*80)
 
 
 async def main():
     """Run all examples."""
     print("\n" + "🤖 CLASSIFICATION AGENT - EXAMPLES 🤖".center(80))
     
-    await example_basic_classification()
-    await example_multiple_categories()
-    await example_urgent_routing()
-    # await example_full_orchestration()  # Requires AWS DynamoDB setup
-    await example_tenant_isolation()
-    await example_digest_generation()
+    # Warm the agent singleton once and share it across examples
+    agent = get_classification_agent()
+    
+    examples = [
+        example_basic_classification,
+        example_multiple_categories,
+        example_urgent_routing,
+        # example_full_orchestration,  # Requires AWS DynamoDB setup
+        example_tenant_isolation,
+        example_digest_generation,
+    ]
+    
+    # Examples are independent, so run them concurrently. Each one collects
+    # its output lines, written in order with a single write at the end
+    outputs: List[List[str]] = [[] for _ in examples]
+    await asyncio.gather(
+        *(example(agent, out) for example, out in zip(examples, outputs))
+    )
+    sys.stdout.write("".join("\n".join(out) + "\n" for out in outputs))
     
     print("\n" + "="*80)
     print("✅ All examples completed successfully!")
@@ -9,13 +9,27 @@ This example shows how to:
 """
 
 import asyncio
+import sys
 from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Tuple
 
+from jaiminho_notificacoes.core.tenant import TenantContext
 from jaiminho_notificacoes.processing.digest_generator import (
     get_digest_agent,
     DigestAgent,
     UserDigest
 )
+from jaiminho_notificacoes.processing.categories import (
+    CAT_AUTOMATION,
+    CAT_DELIVERY,
+    CAT_EVENTS,
+    CAT_FAMILY,
+    CAT_FINANCE,
+    CAT_GENERAL,
+    CAT_HEALTH,
+    CAT_OTHER,
+    CAT_WORK,
+)
 from jaiminho_notificacoes.persistence.models import (
     NormalizedMessage,
     MessageContent,
@@ -26,6 +40,48 @@ from jaiminho_notificacoes.persistence.models import (
 )
 
 
+class CategorySample(NamedTuple):
+    """One sample message per digest category."""
+    category: str
+    text: str
+    sender: str
+
+
+CATEGORY_SAMPLES: Tuple[CategorySample, ...] = (
+    CategorySample(CAT_WORK, "Reunião amanhã", "Chefe"),
+    CategorySample(CAT_FAMILY, "Tudo bem?", "Primo"),
+    CategorySample(CAT_DELIVERY, "Pedido enviado", "Loja"),
+    CategorySample(CAT_FINANCE, "Fatura vencendo", "Banco"),
+    CategorySample(CAT_HEALTH, "Consulta marcada", "Clínica"),
+    CategorySample(CAT_EVENTS, "Festa sábado", "Amigo"),
+    CategorySample(CAT_GENERAL, "Notícia importante", "Canal"),
+    CategorySample(CAT_AUTOMATION, "Alerta sistema", "Bot"),
+    CategorySample(CAT_OTHER, "Mensagem qualquer", "Desconhecido"),
+)
+
+# Shared sub-models for every sample message; only the per-message
+# fields are built in create_sample_message
+_DEMO_SOURCE = MessageSource(platform="wapi", instance_id="demo_instance")
+_DEMO_SECURITY = MessageSecurity(
+    validated_at=datetime.now().isoformat(),
+    validation_passed=True,
+    instance_verified=True,
+    tenant_resolved=True,
+    phone_ownership_verified=True
+)
+
+
+def _tenant_context(user_id: str) -> TenantContext:
+    """Build the verified tenant context for a demo user."""
+    return TenantContext(
+        tenant_id="demo_tenant",
+        user_id=user_id,
+        instance_id="demo_instance",
+        phone_number="5511900000000",
+        status="active"
+    )
+
+
 def create_sample_message(
     message_id: str,
     text: str,
@@ -34,46 +90,99 @@ def create_sample_message(
     user_id: str,
     category: str,
     summary: str,
-    timestamp_offset: int = 0
+    timestamp_offset: int = 0,
+    base_time: Optional[int] = None,
+    validate: bool = False
 ) -> NormalizedMessage:
-    """Create a sample normalized message for testing."""
-    base_time = int(datetime.now().timestamp()) + timestamp_offset
+    """
+    Create a sample normalized message for testing.
+    
+    Demo inputs are known-valid, so Pydantic validation is skipped unless
+    validate=True.
+    """
+    if base_time is None:
+        base_time = int(datetime.now().timestamp())
     
-    msg = NormalizedMessage(
+    if validate:
+        content = MessageContent(text=text)
+        metadata = MessageMetadata(is_group=False)
+        build = NormalizedMessage
+    else:
+        content = MessageContent.model_construct(text=text)
+        metadata = MessageMetadata.model_construct(is_group=False)
+        build = NormalizedMessage.model_construct
+    
+    return build(
         message_id=message_id,
         tenant_id="demo_tenant",
         user_id=user_id,
         sender_phone=sender_phone,
         sender_name=sender_name,
-        message_type=MessageType.TEXT,
-        content=MessageContent(text=text),
-        timestamp=base_time,
-        source=MessageSource(
-            platform="wapi",
-            instance_id="demo_instance"
-        ),
-        metadata=MessageMetadata(is_group=False),
-        security=MessageSecurity(
-            validated_at=datetime.now().isoformat(),
-            validation_passed=True,
-            instance_verified=True,
-            tenant_resolved=True,
-            phone_ownership_verified=True
-        )
+        message_type=MessageType.TEXT.value,
+        content=content,
+        timestamp=base_time + timestamp_offset,
+        source=_DEMO_SOURCE,
+        metadata=metadata,
+        security=_DEMO_SECURITY,
+        # Classification data
+        classification_category=category,
+        classification_summary=summary
     )
-    
-    # Add classification data
-    msg.classification_category = category
-    msg.classification_summary = summary
-    
-    return msg
 
 
-async def example_basic_digest():
+def _build_category_messages() -> List[NormalizedMessage]:
+    """Build one sample message per category for user_1."""
+    # Build one prototype and shallow-copy it per category; source,
+    # metadata and security sub-models are shared by every copy
+    prototype = create_sample_message(
+        "msg_cat_prototype", "", "", "5511999999900", "user_1", CAT_OTHER, ""
+    )
+    return [
+        prototype.model_copy(
+            update={
+                "message_id": f"msg_cat_{i}",
+                "content": MessageContent.model_construct(text=text),
+                "sender_name": sender,
+                "sender_phone": f"55119999999{i:02d}",
+                "classification_category": category,
+                "classification_summary": f"{sender}: {text}",
+            },
+            deep=False
+        )
+        for i, (category, text, sender) in enumerate(CATEGORY_SAMPLES)
+    ]
+
+
+def _build_user_batches(
+    user_count: int
+) -> List[Tuple[TenantContext, List[NormalizedMessage]]]:
+    """Build (tenant_context, messages) pairs for synthetic users."""
+    return [
+        (
+            _tenant_context(f"user_{u}"),
+            [
+                create_sample_message(
+                    f"msg_{u}_{i}",
+                    f"Mensagem {i}",
+                    f"Contato {i}",
+                    f"55119{u:04d}{i:04d}",
+                    f"user_{u}",
+                    CAT_GENERAL,
+                    f"Contato {i}: Mensagem {i}",
+                    timestamp_offset=-i*600
+                )
+                for i in range(5)
+            ]
+        )
+        for u in range(user_count)
+    ]
+
+
+async def example_basic_digest(agent: DigestAgent, out: List[str]):
     """Example 1: Generate a basic daily digest."""
-    print("\n" + "="*80)
-    print("Example 1: Basic Daily Digest Generation")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("Example 1: Basic Daily Digest Generation")
+    out.append("="*80)
     
     # Create sample messages for a user
     messages = [
@@ -83,7 +192,7 @@ async def example_basic_digest():
             "João Silva", 
             "5511999999999",
             "user_1",
-            "💼 Trabalho e Negócios",
+            CAT_WORK,
             "João Silva: Reunião de projeto amanhã às 14h"
         ),
         create_sample_message(
@@ -92,7 +201,7 @@ async def example_basic_digest():
             "Loja Online",
             "5511888888888",
             "user_1",
-            "📦 Entregas e Compras",
+            CAT_DELIVERY,
             "Loja Online: Seu pedido #12345 foi enviado"
         ),
         create_sample_message(
@@ -101,31 +210,29 @@ async def example_basic_digest():
             "Mãe",
             "5511777777777",
             "user_1",
-            "👨‍👩‍👧 Família e Amigos",
+            CAT_FAMILY,
             "Mãe: Oi filho, tudo bem?"
         ),
     ]
     
     # Generate digest
-    agent = get_digest_agent()
     digest = await agent.generate_digest(
-        user_id="user_1",
-        tenant_id="demo_tenant",
+        tenant_context=_tenant_context("user_1"),
         messages=messages
     )
     
     # Display WhatsApp-formatted text
-    print(f"\n📧 Digest para user_1 ({digest.total_messages} mensagens):\n")
-    print(digest.to_whatsapp_text())
+    out.append(f"\n📧 Digest para user_1 ({digest.total_messages} mensagens):\n")
+    out.append(digest.to_whatsapp_text())
 
 
-async def example_multiple_messages_same_category():
+async def example_multiple_messages_same_category(agent: DigestAgent, out: List[str]):
     """Example 2: Digest with multiple messages in same category."""
-    print("\n" + "="*80)
-    print("Example 2: Multiple Messages Per Category")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("Example 2: Multiple Messages Per Category")
+    out.append("="*80)
     
-    # Create several work messages
+    # Several work messages plus a few from other categories
     messages = [
         create_sample_message(
             f"msg_work_{i}",
@@ -133,22 +240,20 @@ async def example_multiple_messages_same_category():
             f"Colega{i}",
             f"551199999999{i}",
             "user_1",
-            "💼 Trabalho e Negócios",
+            CAT_WORK,
             f"Colega{i}: Mensagem de trabalho {i}",
             timestamp_offset=i*3600  # Each message 1 hour apart
         )
         for i in range(1, 6)
-    ]
-    
-    # Add messages from other categories
-    messages.extend([
+    ] + [
+        # Messages from other categories
         create_sample_message(
             "msg_delivery",
             "Pacote chegou",
             "Correios",
             "5511888888888",
             "user_1",
-            "📦 Entregas e Compras",
+            CAT_DELIVERY,
             "Correios: Pacote chegou"
         ),
         create_sample_message(
@@ -157,30 +262,28 @@ async def example_multiple_messages_same_category():
             "Irmã",
             "5511777777777",
             "user_1",
-            "👨‍👩‍👧 Família e Amigos",
+            CAT_FAMILY,
             "Irmã: Jantar domingo?"
         ),
-    ])
+    ]
     
     # Generate digest
-    agent = get_digest_agent()
     digest = await agent.generate_digest(
-        user_id="user_1",
-        tenant_id="demo_tenant",
+        tenant_context=_tenant_context("user_1"),
         messages=messages
     )
     
-    print(f"\n📧 Digest com {digest.total_messages} mensagens:\n")
-    print(digest.to_whatsapp_text())
+    out.append(f"\n📧 Digest com {digest.total_messages} mensagens:\n")
+    out.append(digest.to_whatsapp_text())
     
-    print("\n💡 Note: Only first 3 messages per category are shown!")
+    out.append("\n💡 Note: Only first 3 messages per category are shown!")
 
 
-async def example_user_isolation():
+async def example_user_isolation(agent: DigestAgent, out: List[str]):
     """Example 3: Demonstrate user isolation."""
-    print("\n" + "="*80)
-    print("Example 3: User Isolation (Security)")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("Example 3: User Isolation (Security)")
+    out.append("="*80)
     
     # Messages for user_1
     user1_messages = [
@@ -190,7 +293,7 @@ async def example_user_isolation():
             "Sender A",
             "5511111111111",
             "user_1",
-            "📰 Informação Geral",
+            CAT_GENERAL,
             "Sender A: Mensagem para user_1"
         ),
     ]
@@ -203,182 +306,178 @@ async def example_user_isolation():
             "Sender B",
             "5511222222222",
             "user_2",
-            "📰 Informação Geral",
+            CAT_GENERAL,
             "Sender B: Mensagem para user_2"
         ),
     ]
     
-    agent = get_digest_agent()
-    
     # Generate digest for user_1 - should work
-    print("\n✅ Generating digest for user_1:")
+    out.append("\n✅ Generating digest for user_1:")
     digest1 = await agent.generate_digest(
-        user_id="user_1",
-        tenant_id="demo_tenant",
+        tenant_context=_tenant_context("user_1"),
         messages=user1_messages
     )
-    print(f"Success! {digest1.total_messages} mensagem(ns) processada(s)")
+    out.append(f"Success! {digest1.total_messages} mensagem(ns) processada(s)")
     
     # Try to generate digest for user_1 with user_2's messages - should fail
-    print("\n❌ Trying to process user_2 messages for user_1 (should fail):")
+    out.append("\n❌ Trying to process user_2 messages for user_1 (should fail):")
     try:
         await agent.generate_digest(
-            user_id="user_1",
-            tenant_id="demo_tenant",
+            tenant_context=_tenant_context("user_1"),
             messages=user2_messages  # Wrong user!
         )
-        print("ERROR: Should have failed!")
+        out.append("ERROR: Should have failed!")
     except ValueError as e:
-        print(f"✅ Correctly rejected: {e}")
+        out.append(f"✅ Correctly rejected: {e}")
 
 
-async def example_empty_digest():
+async def example_empty_digest(agent: DigestAgent, out: List[str]):
     """Example 4: Empty digest (no messages)."""
-    print("\n" + "="*80)
-    print("Example 4: Empty Digest (No Messages)")
-    print("="*80)
-    
-    agent = get_digest_agent()
+    out.append("\n" + "="*80)
+    out.append("Example 4: Empty Digest (No Messages)")
+    out.append("="*80)
     
     digest = await agent.generate_digest(
-        user_id="user_1",
-        tenant_id="demo_tenant",
+        tenant_context=_tenant_context("user_1"),
         messages=[]
     )
     
-    print(f"\n📧 Digest vazio ({digest.total_messages} mensagens):\n")
-    print(digest.to_whatsapp_text())
+    out.append(f"\n📧 Digest vazio ({digest.total_messages} mensagens):\n")
+    out.append(digest.to_whatsapp_text())
 
 
-async def example_category_distribution():
+async def example_category_distribution(agent: DigestAgent, out: List[str]):
     """Example 5: Messages across all categories."""
-    print("\n" + "="*80)
-    print("Example 5: Messages Across All Categories")
-    print("="*80)
-    
-    categories = [
-        ("💼 Trabalho e Negócios", "Reunião amanhã", "Chefe"),
-        ("👨‍👩‍👧 Família e Amigos", "Tudo bem?", "Primo"),
-        ("📦 Entregas e Compras", "Pedido enviado", "Loja"),
-        ("💰 Financeiro", "Fatura vencendo", "Banco"),
-        ("🏥 Saúde", "Consulta marcada", "Clínica"),
-        ("🎉 Eventos e Convites", "Festa sábado", "Amigo"),
-        ("📰 Informação Geral", "Notícia importante", "Canal"),
-        ("🤖 Automação e Bots", "Alerta sistema", "Bot"),
-        ("❓ Outros", "Mensagem qualquer", "Desconhecido"),
-    ]
+    out.append("\n" + "="*80)
+    out.append("Example 5: Messages Across All Categories")
+    out.append("="*80)
     
-    messages = []
-    for i, (category, text, sender) in enumerate(categories):
-        messages.append(
-            create_sample_message(
-                f"msg_cat_{i}",
-                text,
-                sender,
-                f"55119999999{i:02d}",
-                "user_1",
-                category,
-                f"{sender}: {text}"
-            )
-        )
+    # Fixture building is CPU work; keep it off the event loop so the
+    # other examples running concurrently are not blocked
+    messages = await asyncio.to_thread(_build_category_messages)
     
-    agent = get_digest_agent()
     digest = await agent.generate_digest(
-        user_id="user_1",
-        tenant_id="demo_tenant",
+        tenant_context=_tenant_context("user_1"),
         messages=messages
     )
     
-    print(f"\n📧 Digest com todas as {len(categories)} categorias:\n")
-    print(digest.to_whatsapp_text())
+    out.append(f"\n📧 Digest com todas as {len(CATEGORY_SAMPLES)} categorias:\n")
+    out.append(digest.to_whatsapp_text())
     
-    print(f"\n📊 Estatísticas:")
-    print(f"   Total de mensagens: {digest.total_messages}")
-    print(f"   Total de categorias: {len(digest.categories)}")
+    out.append(f"\n📊 Estatísticas:")
+    out.append(f"   Total de mensagens: {digest.total_messages}")
+    out.append(f"   Total de categorias: {len(digest.categories)}")
 
 
-async def example_realistic_day():
+async def example_realistic_day(agent: DigestAgent, out: List[str]):
     """Example 6: Realistic daily digest."""
-    print("\n" + "="*80)
-    print("Example 6: Realistic Daily Digest")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("Example 6: Realistic Daily Digest")
+    out.append("="*80)
     
-    # Simulate a realistic day with various messages
+    # Simulate a realistic day with various messages, offsets from one clock read
+    base = int(datetime.now().timestamp())
     messages = [
         # Morning - Work messages
         create_sample_message(
             "msg_1", "Bom dia! Reunião às 10h cancelada", "Gerente",
-            "5511111111111", "user_1", "💼 Trabalho e Negócios",
-            "Gerente: Bom dia! Reunião às 10h cancelada", -21600
+            "5511111111111", "user_1", CAT_WORK,
+            "Gerente: Bom dia! Reunião às 10h cancelada", -21600, base_time=base
         ),
         create_sample_message(
             "msg_2", "Relatório mensal precisa ser entregue hoje", "RH",
-            "5511111111112", "user_1", "💼 Trabalho e Negócios",
-            "RH: Relatório mensal precisa ser entregue hoje", -18000
+            "5511111111112", "user_1", CAT_WORK,
+            "RH: Relatório mensal precisa ser entregue hoje", -18000, base_time=base
         ),
         
         # Afternoon - Personal
         create_sample_message(
             "msg_3", "Almoço amanhã?", "Amigo João",
-            "5511222222221", "user_1", "👨‍👩‍👧 Família e Amigos",
-            "Amigo João: Almoço amanhã?", -10800
+            "5511222222221", "user_1", CAT_FAMILY,
+            "Amigo João: Almoço amanhã?", -10800, base_time=base
         ),
         create_sample_message(
             "msg_4", "Seu pedido chegará amanhã entre 14h e 18h", "Mercado Livre",
-            "5511333333331", "user_1", "📦 Entregas e Compras",
-            "Mercado Livre: Seu pedido chegará amanhã entre 14h e 18h", -7200
+            "5511333333331", "user_1", CAT_DELIVERY,
+            "Mercado Livre: Seu pedido chegará amanhã entre 14h e 18h", -7200, base_time=base
         ),
         
         # Evening - Financial and health
         create_sample_message(
             "msg_5", "Fatura do cartão: R$ 1.250,00. Vence dia 15", "Banco Inter",
-            "5511444444441", "user_1", "💰 Financeiro",
-            "Banco Inter: Fatura do cartão R$ 1.250,00. Vence dia 15", -3600
+            "5511444444441", "user_1", CAT_FINANCE,
+            "Banco Inter: Fatura do cartão R$ 1.250,00. Vence dia 15", -3600, base_time=base
         ),
         create_sample_message(
             "msg_6", "Resultado do exame disponível no app", "Laboratório",
-            "5511555555551", "user_1", "🏥 Saúde",
-            "Laboratório: Resultado do exame disponível no app", -1800
+            "5511555555551", "user_1", CAT_HEALTH,
+            "Laboratório: Resultado do exame disponível no app", -1800, base_time=base
         ),
         
         # Late - Family
         create_sample_message(
             "msg_7", "Jantar domingo em casa?", "Mãe",
-            "5511666666661", "user_1", "👨‍👩‍👧 Família e Amigos",
-            "Mãe: Jantar domingo em casa?", 0
+            "5511666666661", "user_1", CAT_FAMILY,
+            "Mãe: Jantar domingo em casa?", 0, base_time=base
         ),
     ]
     
-    agent = get_digest_agent()
     digest = await agent.generate_digest(
-        user_id="user_1",
-        tenant_id="demo_tenant",
+        tenant_context=_tenant_context("user_1"),
         messages=messages,
         date=datetime.now().strftime("%Y-%m-%d")
     )
     
-    print(f"\n📧 Seu Digest do Dia ({digest.total_messages} mensagens):\n")
-    print(digest.to_whatsapp_text())
+    out.append(f"\n📧 Seu Digest do Dia ({digest.total_messages} mensagens):\n")
+    out.append(digest.to_whatsapp_text())
     
-    print("\n" + "="*80)
-    print("💡 Este digest está pronto para ser enviado via WhatsApp!")
-    print("   - Formatação otimizada para mobile")
-    print("   - Emojis para identificação rápida")
-    print("   - Agrupamento por categoria")
-    print("   - Máximo 3 mensagens por categoria")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("💡 Este digest está pronto para ser enviado via WhatsApp!")
+    out.append("   - Formatação otimizada para mobile")
+    out.append("   - Emojis para identificação rápida")
+    out.append("   - Agrupamento por categoria")
+    out.append("   - Máximo 3 mensagens por categoria")
+    out.append("="*80)
+
+
+async def example_batch_users(agent: DigestAgent, out: List[str]):
+    """Example 7: Nightly digest job for several users."""
+    out.append("\n" + "="*80)
+    out.append("Example 7: Batch Digest Generation (5 users)")
+    out.append("="*80)
+    
+    user_batches = _build_user_batches(5)
+    digests = await agent.generate_digests_for_users(user_batches)
+    
+    out.append(f"\n📧 {len(digests)} digests gerados")
+    for digest in digests:
+        out.append(f"   {digest.user_id}: {digest.total_messages} mensagem(ns)")
 
 
 async def main():
     """Run all examples."""
     print("\n" + "🗓️  DAILY DIGEST AGENT - EXAMPLES 🗓️".center(80))
     
-    await example_basic_digest()
-    await example_multiple_messages_same_category()
-    await example_user_isolation()
-    await example_empty_digest()
-    await example_category_distribution()
-    await example_realistic_day()
+    # Warm the agent singleton once and share it across examples
+    agent = get_digest_agent()
+    
+    examples = [
+        example_basic_digest,
+        example_multiple_messages_same_category,
+        example_user_isolation,
+        example_empty_digest,
+        example_category_distribution,
+        example_realistic_day,
+        example_batch_users,
+    ]
+    
+    # Examples are independent, so run them concurrently. Each one collects
+    # its output lines, written in order with a single write at the end
+    outputs: List[List[str]] = [[] for _ in examples]
+    await asyncio.gather(
+        *(example(agent, out) for example, out in zip(examples, outputs))
+    )
+    sys.stdout.write("".join("\n".join(out) + "\n" for out in outputs))
     
     print("\n" + "="*80)
     print("✅ All examples completed successfully!")
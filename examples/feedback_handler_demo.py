@@ -10,7 +10,13 @@ Demonstrates:
 
 import asyncio
 import json
-from datetime import datetime
+import logging
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from jaiminho_notificacoes.processing.feedback_handler import (
     get_feedback_handler,
@@ -19,6 +25,26 @@ from jaiminho_notificacoes.processing.feedback_handler import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Cap for event reprs echoed to the console
+MAX_EVENT_PREVIEW = 200
+
+
+def _encode_body(payload):
+    """Encode a webhook body as API Gateway would deliver it."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
+
+
+def _decode_body(body):
+    """Decode a webhook body (str or bytes)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 # Example 1: Process a Single Feedback Event
 async def example_single_feedback():
     """Process a single button click feedback."""
@@ -35,7 +61,7 @@ async def example_single_feedback():
             'id': 'important',
             'title': '🔴 Important'
         },
-        'timestamp': int(datetime.utcnow().timestamp()),
+        'timestamp': int(datetime.now(timezone.utc).timestamp()),
         'metadata': {
             'message_id': 'jaiminho_notif_456',
             'user_id': 'user_alice',
@@ -44,7 +70,8 @@ async def example_single_feedback():
     }
 
     print("\nWebhook Event:")
-    print(json.dumps(webhook_event, indent=2))
+    print(f"  {repr(webhook_event)[:MAX_EVENT_PREVIEW]}")
+    logger.debug("Webhook event: %s", webhook_event)
 
     # Get handler
     handler = get_feedback_handler()
@@ -85,7 +112,7 @@ async def example_validation():
             'id': 'not_important',
             'title': '⚪ Not Important'
         },
-        'timestamp': int(datetime.utcnow().timestamp()),
+        'timestamp': int(datetime.now(timezone.utc).timestamp()),
         'metadata': {
             'message_id': 'jaiminho_notif_789',
             'user_id': 'user_bob',
@@ -108,7 +135,7 @@ async def example_validation():
             'id': 'important',
             'title': 'Important'
         },
-        'timestamp': int(datetime.utcnow().timestamp())
+        'timestamp': int(datetime.now(timezone.utc).timestamp())
         # Missing metadata!
     }
 
@@ -137,6 +164,7 @@ async def example_batch_processing():
 
     # Create 5 webhook events
     events = []
+    base_ts = int(datetime.now(timezone.utc).timestamp())
     for i in range(5):
         event = {
             'event': 'message.reaction',
@@ -146,7 +174,7 @@ async def example_batch_processing():
                 'id': 'important' if i % 2 == 0 else 'not_important',
                 'title': 'Important' if i % 2 == 0 else 'Not Important'
             },
-            'timestamp': int(datetime.utcnow().timestamp()) + i,
+            'timestamp': base_ts + i,
             'metadata': {
                 'message_id': f'jaiminho_notif_{i}',
                 'user_id': f'user_{i}',
@@ -160,26 +188,27 @@ async def example_batch_processing():
     # Process batch
     results = await handler.handle_batch_webhooks(events)
 
-    # Summary
-    successful = sum(1 for r in results if r.success)
+    # Count successes while building the detail lines (single pass)
+    successful = 0
+    lines = ["\nDetailed Results:"]
+    for i, result in enumerate(results):
+        successful += result.success
+        status = "✅" if result.success else "❌"
+        lines.append("  [%s] Event %d:" % (status, i))
+        lines.append("      Feedback ID: %s" % result.feedback_id)
+        lines.append("      Type: %s" % result.feedback_type)
+        lines.append("      Time: %.2fms" % result.processing_time_ms)
+
+        if not result.success:
+            lines.append("      Error: %s" % result.error)
+
     failed = len(results) - successful
 
     print(f"Results Summary:")
     print(f"  Total: {len(results)}")
     print(f"  Successful: {successful}")
     print(f"  Failed: {failed}")
-
-    print("\nDetailed Results:")
-    for i, result in enumerate(results):
-        status = "✅" if result.success else "❌"
-        print(f"  [{status}] Event {i}:")
-        print(f"      Feedback ID: {result.feedback_id}")
-        print(f"      Type: {result.feedback_type}")
-        print(f"      Time: {result.processing_time_ms:.2f}ms")
-
-        if not result.success:
-            print(f"      Error: {result.error}")
-
+    print("\n".join(lines))
     print()
 
 
@@ -213,7 +242,7 @@ async def example_error_handling():
             'id': 'custom_button',  # Not a valid type!
             'title': 'Custom'
         },
-        'timestamp': int(datetime.utcnow().timestamp()),
+        'timestamp': int(datetime.now(timezone.utc).timestamp()),
         'metadata': {
             'message_id': 'jaiminho_notif_test',
             'user_id': 'user_test',
@@ -258,18 +287,18 @@ async def example_response_time():
     print("=" * 60)
 
     # Simulate message sent 5 minutes ago
-    now = datetime.utcnow()
-    sent_dt = now.replace(minute=now.minute - 5)
-    sent_at = sent_dt.isoformat()
+    now = datetime.now(timezone.utc)
+    sent_dt = now - timedelta(minutes=5)
+    sent_ts = int(sent_dt.timestamp())
 
     response_timestamp = int(now.timestamp())
 
     response_time = UserFeedbackProcessor._calculate_response_time(
-        sent_at,
+        sent_ts,
         response_timestamp
     )
 
-    print(f"\nMessage sent: {sent_at}")
+    print(f"\nMessage sent: {sent_dt.isoformat()}")
     print(f"Response at: {now.isoformat()}")
     print(f"Response time: {response_time:.0f} seconds ({response_time / 60:.1f} minutes)")
 
@@ -287,7 +316,7 @@ async def example_api_gateway_webhook():
     api_gateway_event = {
         'resource': '/feedback/webhook',
         'httpMethod': 'POST',
-        'body': json.dumps({
+        'body': _encode_body({
             'event': 'message.reaction',
             'recipient': '+5548999887766',
             'message_id': 'sendpulse_msg_gateway',
@@ -295,7 +324,7 @@ async def example_api_gateway_webhook():
                 'id': 'important',
                 'title': '🔴 Important'
             },
-            'timestamp': int(datetime.utcnow().timestamp()),
+            'timestamp': int(datetime.now(timezone.utc).timestamp()),
             'metadata': {
                 'message_id': 'jaiminho_notif_gateway',
                 'user_id': 'user_gateway',
@@ -313,7 +342,7 @@ async def example_api_gateway_webhook():
     print(f"  Body: {api_gateway_event['body'][:50]}...")
 
     # Parse body
-    body = json.loads(api_gateway_event['body'])
+    body = _decode_body(api_gateway_event['body'])
 
     # Process
     handler = get_feedback_handler()
@@ -341,6 +370,7 @@ async def example_multi_tenant():
     # Feedback from different tenants
     tenants = ['company_acme', 'company_beta', 'company_gamma']
     results_by_tenant = {}
+    ts = int(datetime.now(timezone.utc).timestamp())
 
     for tenant_id in tenants:
         event = {
@@ -351,7 +381,7 @@ async def example_multi_tenant():
                 'id': 'important',
                 'title': 'Important'
             },
-            'timestamp': int(datetime.utcnow().timestamp()),
+            'timestamp': ts,
             'metadata': {
                 'message_id': f'jaiminho_notif_{tenant_id}',
                 'user_id': f'user_{tenant_id}',
@@ -362,10 +392,11 @@ async def example_multi_tenant():
         result = await handler.handle_webhook(event)
         results_by_tenant[tenant_id] = result
 
-    print("\nFeedback Processed by Tenant:")
+    lines = ["\nFeedback Processed by Tenant:"]
     for tenant_id, result in results_by_tenant.items():
         status = "✅" if result.success else "❌"
-        print(f"  [{status}] {tenant_id}: {result.feedback_id}")
+        lines.append("  [%s] %s: %s" % (status, tenant_id, result.feedback_id))
+    print("\n".join(lines))
 
     print()
 
@@ -6,24 +6,176 @@ into the main webhook handler pipeline.
 """
 
 import asyncio
+import json
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import boto3
+
 from jaiminho_notificacoes.persistence.models import (
     NormalizedMessage,
     ProcessingDecision
 )
 from jaiminho_notificacoes.processing.orchestrator import get_orchestrator
 from jaiminho_notificacoes.outbound.sendpulse import SendPulseNotifier
-from jaiminho_notificacoes.persistence.dynamodb import DynamoDBClient
 
 
-async def process_webhook_message(message: NormalizedMessage):
+logger = logging.getLogger(__name__)
+
+
+# Strong references to in-flight dispatch tasks (the event loop only keeps
+# weak references, so unreferenced tasks can be garbage collected mid-run)
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
+
+# Safety margin kept when flushing dispatch tasks before Lambda returns
+FLUSH_MARGIN_MS = 500
+
+
+# Retention for digest entries (7 days) and processing results (30 days)
+DIGEST_TTL_SECONDS = 604800
+RESULT_TTL_SECONDS = 2592000
+
+# BatchWriteItem limits / coalescing window
+BATCH_WRITE_MAX_ITEMS = 25
+BATCH_WRITE_MAX_WAIT_S = 0.05
+BATCH_WRITE_MAX_RETRIES = 5
+
+
+class DynamoDBWriteBatcher:
+    """
+    Coalesces put requests into DynamoDB BatchWriteItem calls.
+
+    Writes queued within BATCH_WRITE_MAX_WAIT_S (up to 25 items, across
+    tables) share one request. ``put`` resolves once its batch is written,
+    so callers keep per-write error handling.
+
+    The queue and worker belong to the event loop the batcher was created
+    on; use ``_write_batcher()`` to get the instance for the running loop.
+    """
+
+    def __init__(self, dynamodb=None):
+        self._dynamodb = dynamodb or boto3.resource("dynamodb")
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def put(self, table_name: str, item: Dict[str, Any]) -> None:
+        """Queue an item and wait until its batch is written."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((table_name, item, future))
+        await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + BATCH_WRITE_MAX_WAIT_S
+                while len(batch) < BATCH_WRITE_MAX_ITEMS:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._write(batch)
+                batch = []
+        except Exception as e:
+            logger.error("DynamoDB write batcher failed: %s", e)
+            self._fail_pending(batch, e)
+        except BaseException:
+            # Cancelled (e.g. loop shutdown): nobody may be left waiting
+            self._fail_pending(batch, RuntimeError("DynamoDB write batcher stopped"))
+            raise
+
+    def _fail_pending(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]],
+                      error: Exception) -> None:
+        """Fail the in-progress batch and every queued write."""
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _write(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]) -> None:
+        request_items: Dict[str, List[Dict[str, Any]]] = {}
+        for table_name, item, _ in batch:
+            request_items.setdefault(table_name, []).append({"PutRequest": {"Item": item}})
+
+        error: Optional[Exception] = None
+        try:
+            for attempt in range(BATCH_WRITE_MAX_RETRIES):
+                response = await asyncio.to_thread(
+                    self._dynamodb.batch_write_item,
+                    RequestItems=request_items
+                )
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    break
+                await asyncio.sleep(BATCH_WRITE_MAX_WAIT_S * (2 ** attempt))
+            else:
+                error = RuntimeError("BatchWriteItem left unprocessed items after retries")
+        except Exception as e:
+            error = e
+
+        for _, _, future in batch:
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+
+# One batcher per event loop: a warm Lambda container runs each invocation
+# on a fresh loop, and asyncio queues/tasks cannot cross loops
+_WRITE_BATCHERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DynamoDBWriteBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+_DYNAMODB = None
+
+
+def _write_batcher() -> DynamoDBWriteBatcher:
+    """Get or create the write batcher for the running event loop."""
+    global _DYNAMODB
+    loop = asyncio.get_running_loop()
+    batcher = _WRITE_BATCHERS.get(loop)
+    if batcher is None:
+        if _DYNAMODB is None:
+            _DYNAMODB = boto3.resource("dynamodb")
+        batcher = DynamoDBWriteBatcher(_DYNAMODB)
+        _WRITE_BATCHERS[loop] = batcher
+    return batcher
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Schedule a dispatch coroutine and keep it referenced until done."""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+
+async def process_webhook_message(message: NormalizedMessage) -> Set[asyncio.Task]:
     """
     Main webhook message processing pipeline.
     
     Flow:
     1. Message already validated for tenant isolation
     2. Get orchestrator and process
-    3. Route based on final decision
-    4. Persist processing result for audit
+    3. Route based on final decision (background task)
+    4. Persist processing result for audit (background task)
+    
+    Routing and persistence are not awaited here, so ingress latency does
+    not include the slowest sink. Callers that must flush before returning
+    (e.g. Lambda, which freezes after the response) can wait on the
+    returned tasks.
     """
     
     # Get orchestrator (singleton)
@@ -37,27 +189,39 @@ async def process_webhook_message(message: NormalizedMessage):
     # - Generate complete audit trail
     processing_result = await orchestrator.process(message)
     
-    print(f"Processing Result:")
-    print(f"  Message ID: {processing_result.message_id}")
-    print(f"  Tenant ID: {processing_result.tenant_id}")
-    print(f"  User ID: {processing_result.user_id}")
-    print(f"  Decision: {processing_result.decision.value}")
-    print(f"  Rule Engine: {processing_result.rule_engine_decision}")
-    print(f"  LLM Used: {processing_result.llm_used}")
-    print(f"  Audit Steps: {len(processing_result.audit_trail)}")
+    logger.info(
+        "Processing result: message_id=%s tenant_id=%s user_id=%s decision=%s "
+        "rule_engine=%s llm_used=%s audit_steps=%d",
+        processing_result.message_id,
+        processing_result.tenant_id,
+        processing_result.user_id,
+        processing_result.decision.value,
+        processing_result.rule_engine_decision,
+        processing_result.llm_used,
+        len(processing_result.audit_trail),
+    )
+    
+    tasks = set()
+    now_s = int(time.time())
     
     # Route based on decision
     if processing_result.decision == ProcessingDecision.IMMEDIATE:
-        await send_immediate_notification(message, processing_result)
+        tasks.add(_spawn(send_immediate_notification(message, processing_result)))
     
     elif processing_result.decision == ProcessingDecision.DIGEST:
-        await add_to_daily_digest(message, processing_result)
+        tasks.add(_spawn(add_to_daily_digest(
+            message, processing_result, ttl=now_s + DIGEST_TTL_SECONDS
+        )))
     
     elif processing_result.decision == ProcessingDecision.SPAM:
-        await filter_as_spam(message, processing_result)
+        tasks.add(_spawn(filter_as_spam(message, processing_result)))
     
     # Always persist the result for audit trail
-    await persist_processing_result(message, processing_result)
+    tasks.add(_spawn(persist_processing_result(
+        message, processing_result, ttl=now_s + RESULT_TTL_SECONDS
+    )))
+    
+    return tasks
 
 
 async def send_immediate_notification(message: NormalizedMessage, processing_result):
@@ -84,19 +248,17 @@ async def send_immediate_notification(message: NormalizedMessage, processing_res
         # Send via SendPulse
         result = await notifier.send_notification(notification)
         
-        print(f"✓ Sent immediate notification: {result}")
+        logger.info("Sent immediate notification: %s", result)
         
     except Exception as e:
-        print(f"✗ Failed to send notification: {e}")
+        logger.error("Failed to send notification: %s", e)
         raise
 
 
-async def add_to_daily_digest(message: NormalizedMessage, processing_result):
+async def add_to_daily_digest(message: NormalizedMessage, processing_result, ttl: int):
     """Add message to daily digest queue."""
     
     try:
-        db = DynamoDBClient()
-        
         # Store in digest table
         digest_entry = {
             "message_id": message.message_id,
@@ -108,18 +270,15 @@ async def add_to_daily_digest(message: NormalizedMessage, processing_result):
             "urgency_decision": processing_result.rule_engine_decision,
             "timestamp": message.timestamp,
             "processing_decision": processing_result.decision.value,
-            "ttl": int(time.time()) + (86400 * 7)  # 7 days
+            "ttl": ttl
         }
         
-        await db.put_item(
-            table_name="jaiminho-digest-messages",
-            item=digest_entry
-        )
+        await _write_batcher().put("jaiminho-digest-messages", digest_entry)
         
-        print(f"✓ Added to daily digest: {message.message_id}")
+        logger.info("Added to daily digest: %s", message.message_id)
         
     except Exception as e:
-        print(f"✗ Failed to add to digest: {e}")
+        logger.error("Failed to add to digest: %s", e)
         raise
 
 
@@ -127,8 +286,6 @@ async def filter_as_spam(message: NormalizedMessage, processing_result):
     """Filter message as spam."""
     
     try:
-        db = DynamoDBClient()
-        
         # Log spam message
         spam_entry = {
             "message_id": message.message_id,
@@ -140,24 +297,19 @@ async def filter_as_spam(message: NormalizedMessage, processing_result):
             "timestamp": message.timestamp,
         }
         
-        await db.put_item(
-            table_name="jaiminho-spam-messages",
-            item=spam_entry
-        )
+        await _write_batcher().put("jaiminho-spam-messages", spam_entry)
         
-        print(f"✓ Filtered as spam: {message.message_id}")
+        logger.info("Filtered as spam: %s", message.message_id)
         
     except Exception as e:
-        print(f"✗ Failed to filter spam: {e}")
+        logger.error("Failed to filter spam: %s", e)
         raise
 
 
-async def persist_processing_result(message: NormalizedMessage, processing_result):
+async def persist_processing_result(message: NormalizedMessage, processing_result, ttl: int):
     """Persist processing result for audit trail."""
     
     try:
-        db = DynamoDBClient()
-        
         # Store processing result
         result_entry = {
             "message_id": message.message_id,
@@ -169,21 +321,49 @@ async def persist_processing_result(message: NormalizedMessage, processing_resul
             "llm_used": processing_result.llm_used,
             "audit_trail": processing_result.audit_trail,
             "processed_at": processing_result.processed_at,
-            "ttl": int(time.time()) + (86400 * 30)  # 30 days retention
+            "ttl": ttl
         }
         
-        await db.put_item(
-            table_name="jaiminho-processing-results",
-            item=result_entry
-        )
+        await _write_batcher().put("jaiminho-processing-results", result_entry)
         
-        print(f"✓ Persisted processing result: {message.message_id}")
+        logger.info("Persisted processing result: %s", message.message_id)
         
     except Exception as e:
-        print(f"✗ Failed to persist result: {e}")
+        logger.error("Failed to persist result: %s", e)
         raise
 
 
+# Recently processed messages, kept per warm Lambda container so retried
+# deliveries of the same webhook skip the orchestrator and the writes
+DEDUP_MAX_ENTRIES = 1024
+DEDUP_TTL_SECONDS = 300
+_RECENT_MESSAGES: "OrderedDict[Tuple[str, str, str], float]" = OrderedDict()
+
+_DUPLICATE_RESPONSE = {
+    "statusCode": 200,
+    "body": json.dumps({"status": "duplicate"})
+}
+
+
+def _is_duplicate(key: Tuple[str, str, str], now: float) -> bool:
+    """Check whether a message was processed within the dedup TTL."""
+    expires_at = _RECENT_MESSAGES.get(key)
+    if expires_at is None:
+        return False
+    if expires_at <= now:
+        del _RECENT_MESSAGES[key]
+        return False
+    return True
+
+
+def _remember(key: Tuple[str, str, str], now: float) -> None:
+    """Record a processed message, evicting the oldest entries."""
+    _RECENT_MESSAGES[key] = now + DEDUP_TTL_SECONDS
+    _RECENT_MESSAGES.move_to_end(key)
+    while len(_RECENT_MESSAGES) > DEDUP_MAX_ENTRIES:
+        _RECENT_MESSAGES.popitem(last=False)
+
+
 # Example usage in AWS Lambda handler
 async def lambda_handler(event, context):
     """AWS Lambda handler integrating the orchestrator."""
@@ -195,16 +375,48 @@ async def lambda_handler(event, context):
         # Validate tenant isolation (already done by tenant middleware)
         message = await validate_tenant_isolation(message)
         
-        # Process through orchestrator
-        await process_webhook_message(message)
+        # Skip duplicate deliveries (keyed per tenant/user, never globally)
+        dedup_key = (message.tenant_id, message.user_id, message.message_id)
+        now = time.monotonic()
+        if _is_duplicate(dedup_key, now):
+            return _DUPLICATE_RESPONSE
+        
+        # Process through orchestrator; dispatch runs in the background
+        tasks = await process_webhook_message(message)
+        
+        # Lambda freezes the runtime once the handler returns, so flush
+        # dispatch within the remaining invocation time
+        pending: Set[asyncio.Task] = set()
+        failed: List[asyncio.Task] = []
+        if tasks:
+            remaining_ms = context.get_remaining_time_in_millis() - FLUSH_MARGIN_MS
+            done, pending = await asyncio.wait(tasks, timeout=max(remaining_ms, 0) / 1000)
+            failed = [
+                task for task in done
+                if task.cancelled() or task.exception() is not None
+            ]
+        
+        # Failed or unfinished dispatch is reported as an error so the
+        # delivery is retried (and is not recorded as a duplicate)
+        if failed or pending:
+            logger.error(
+                "Dispatch incomplete for %s: failed=%d pending=%d",
+                message.message_id, len(failed), len(pending),
+            )
+            return {
+                "statusCode": 504 if pending and not failed else 500,
+                "body": json.dumps({"status": "dispatch_failed"})
+            }
+        
+        _remember(dedup_key, now)
         
         return {
-            "statusCode": 200,
-            "body": json.dumps({"status": "processed"})
+            "statusCode": 202,
+            "body": json.dumps({"status": "accepted"})
         }
         
     except Exception as e:
-        print(f"Error processing webhook: {e}")
+        logger.error("Error processing webhook: %s", e)
         return {
             "statusCode": 500,
             "body": json.dumps({"error": str(e)})
@@ -212,8 +424,6 @@ async def lambda_handler(event, context):
 
 
 if __name__ == "__main__":
-    import time
-    
     # Example: Create a test message
     from jaiminho_notificacoes.persistence.models import (
         MessageContent,
@@ -7,6 +7,8 @@ Demonstrates usage of the SendPulse WhatsApp adapter for:
 """
 
 import asyncio
+import time
+from bisect import bisect_left
 from typing import List
 
 from jaiminho_notificacoes.outbound.sendpulse import (
@@ -17,16 +19,81 @@ from jaiminho_notificacoes.outbound.sendpulse import (
 )
 
 
+# Button templates are immutable, so they are built once and shared
+FEEDBACK_BUTTONS = (
+    SendPulseButton(id='important', title='Important', action='reply'),
+    SendPulseButton(id='not_important', title='Not Important', action='reply')
+)
+
+LEARNING_FEEDBACK_BUTTONS = (
+    SendPulseButton(id='is_important', title='Important', action='reply'),
+    SendPulseButton(id='not_important', title='Not Important', action='reply')
+)
+
+# (score floor, notification type, prefix), sorted by floor; a score must
+# exceed a tier's floor to reach it
+_URGENCY_TABLE = (
+    (float('-inf'), NotificationType.DIGEST, "ℹ️ FYI:"),
+    (0.5, NotificationType.URGENT, "⚠️ MEDIUM PRIORITY:"),
+    (0.8, NotificationType.URGENT, "🚨 HIGH PRIORITY:"),
+)
+_URGENCY_THRESHOLDS = tuple(floor for floor, _, _ in _URGENCY_TABLE)
+
+# Message bodies are static, so they are stripped once at import
+_DIGEST_TEMPLATE = """
+📅 Daily Digest - January 15, 2024
+
+📊 Stats:
+- New messages: 12
+- Urgent items: 2
+- Completed tasks: 8
+
+🔔 Urgent:
+1. Database migration scheduled for tomorrow
+2. Security patch available for review
+
+📝 Recent Activity:
+- Team meeting at 3 PM
+- Q1 planning session
+- New feature deployment
+
+👉 Reply to this message for more details.
+""".strip()
+
+_MAINTENANCE_TEMPLATE = """
+🎉 System Maintenance Window
+
+We'll be performing scheduled maintenance tomorrow:
+⏰ 2:00 AM - 4:00 AM (UTC)
+
+Expected downtime: ~2 hours
+Systems affected:
+- API endpoints
+- Dashboard
+- Mobile app
+
+Thank you for your patience!
+""".strip()
+
+_BUDGET_REVIEW_TEMPLATE = """
+📬 Message from John Smith
+
+Subject: Q1 Budget Review
+
+Dear team, please review the attached budget proposal for Q1 review...
+
+Is this message important to you?
+""".strip()
+
+
 # ============================================================================
 # Example 1: Sending Urgent Notification
 # ============================================================================
 
-async def example_urgent_notification():
+async def example_urgent_notification(manager: SendPulseManager):
     """Send an urgent notification immediately."""
     print("=== Example 1: Urgent Notification ===\n")
 
-    manager = SendPulseManager()
-
     response = await manager.send_notification(
         tenant_id='acme_corp',
         user_id='user_123',
@@ -45,36 +112,14 @@ async def example_urgent_notification():
 # Example 2: Sending Daily Digest
 # ============================================================================
 
-async def example_daily_digest():
+async def example_daily_digest(manager: SendPulseManager):
     """Send a daily digest with summary."""
     print("\n=== Example 2: Daily Digest ===\n")
 
-    manager = SendPulseManager()
-
-    digest_text = """
-📅 Daily Digest - January 15, 2024
-
-📊 Stats:
-- New messages: 12
-- Urgent items: 2
-- Completed tasks: 8
-
-🔔 Urgent:
-1. Database migration scheduled for tomorrow
-2. Security patch available for review
-
-📝 Recent Activity:
-- Team meeting at 3 PM
-- Q1 planning session
-- New feature deployment
-
-👉 Reply to this message for more details.
-    """.strip()
-
     response = await manager.send_notification(
         tenant_id='acme_corp',
         user_id='user_456',
-        content_text=digest_text,
+        content_text=_DIGEST_TEMPLATE,
         message_type=NotificationType.DIGEST,
         metadata={
             'digest_date': '2024-01-15',
@@ -90,23 +135,16 @@ async def example_daily_digest():
 # Example 3: Collecting Feedback with Interactive Buttons
 # ============================================================================
 
-async def example_feedback_collection():
+async def example_feedback_collection(manager: SendPulseManager):
     """Collect feedback using interactive buttons."""
     print("\n=== Example 3: Feedback Collection ===\n")
 
-    manager = SendPulseManager()
-
-    buttons = [
-        SendPulseButton(id='important', title='Important', action='reply'),
-        SendPulseButton(id='not_important', title='Not Important', action='reply')
-    ]
-
     response = await manager.send_notification(
         tenant_id='acme_corp',
         user_id='user_789',
         content_text='Was this notification helpful and important to you?',
         message_type=NotificationType.FEEDBACK,
-        buttons=buttons,
+        buttons=FEEDBACK_BUTTONS,
         metadata={
             'feedback_type': 'notification_quality',
             'notification_id': 'notif_12345'
@@ -122,12 +160,10 @@ async def example_feedback_collection():
 # Example 4: Batch Sending to Multiple Users
 # ============================================================================
 
-async def example_batch_send():
+async def example_batch_send(manager: SendPulseManager):
     """Send the same notification to multiple users."""
     print("\n=== Example 4: Batch Send ===\n")
 
-    manager = SendPulseManager()
-
     user_ids = [
         'user_001',
         'user_002',
@@ -136,33 +172,18 @@ async def example_batch_send():
         'user_005'
     ]
 
-    message_text = """
-🎉 System Maintenance Window
-
-We'll be performing scheduled maintenance tomorrow:
-⏰ 2:00 AM - 4:00 AM (UTC)
-
-Expected downtime: ~2 hours
-Systems affected:
-- API endpoints
-- Dashboard
-- Mobile app
-
-Thank you for your patience!
-    """.strip()
-
     print(f"Sending to {len(user_ids)} users...")
 
     responses = await manager.send_batch(
         tenant_id='acme_corp',
         user_ids=user_ids,
-        content_text=message_text,
+        content_text=_MAINTENANCE_TEMPLATE,
         message_type=NotificationType.URGENT
     )
 
     # Analyze results
-    successful = sum(1 for r in responses if r.success)
-    failed = len(responses) - successful
+    successful = responses.successful
+    failed = responses.failed
 
     print(f"Total: {len(responses)}")
     print(f"Successful: {successful}")
@@ -170,36 +191,27 @@ Thank you for your patience!
 
     if failed > 0:
         print("\nFailed users:")
-        for i, response in enumerate(responses):
-            if not response.success:
-                print(f"  - user_{i}: {response.error}")
+        for i, ok in enumerate(responses.success):
+            if not ok:
+                print(f"  - {user_ids[i]}: {responses.errors[i]}")
 
 
 # ============================================================================
 # Example 5: Advanced - Conditional Notification
 # ============================================================================
 
-async def example_conditional_notification():
+async def example_conditional_notification(manager: SendPulseManager):
     """Send notification with conditional logic."""
     print("\n=== Example 5: Conditional Notification ===\n")
 
-    manager = SendPulseManager()
-
     # Example data from urgency system
     urgency_score = 0.85  # 0-1 scale
     message_category = 'system_alert'
     sender_reliability = 0.95
 
     # Determine notification type based on urgency
-    if urgency_score > 0.8:
-        notification_type = NotificationType.URGENT
-        prefix = "🚨 HIGH PRIORITY:"
-    elif urgency_score > 0.5:
-        notification_type = NotificationType.URGENT
-        prefix = "⚠️ MEDIUM PRIORITY:"
-    else:
-        notification_type = NotificationType.DIGEST
-        prefix = "ℹ️ FYI:"
+    idx = bisect_left(_URGENCY_THRESHOLDS, urgency_score) - 1
+    _, notification_type, prefix = _URGENCY_TABLE[idx]
 
     content = f"{prefix} System notification\nUrgency: {urgency_score * 100:.0f}%"
 
@@ -224,42 +236,17 @@ async def example_conditional_notification():
 # Example 6: Integration with Learning Agent
 # ============================================================================
 
-async def example_learning_agent_integration():
+async def example_learning_agent_integration(manager: SendPulseManager):
     """Collect feedback to feed Learning Agent."""
     print("\n=== Example 6: Learning Agent Integration ===\n")
 
-    manager = SendPulseManager()
-
     # Send message with feedback buttons for Learning Agent
-    buttons = [
-        SendPulseButton(
-            id='is_important',
-            title='Important',
-            action='reply'
-        ),
-        SendPulseButton(
-            id='not_important',
-            title='Not Important',
-            action='reply'
-        )
-    ]
-
-    message = """
-📬 Message from John Smith
-
-Subject: Q1 Budget Review
-
-Dear team, please review the attached budget proposal for Q1 review...
-
-Is this message important to you?
-    """.strip()
-
     response = await manager.send_notification(
         tenant_id='acme_corp',
         user_id='user_manager_001',
-        content_text=message,
+        content_text=_BUDGET_REVIEW_TEMPLATE,
         message_type=NotificationType.FEEDBACK,
-        buttons=buttons,
+        buttons=LEARNING_FEEDBACK_BUTTONS,
         metadata={
             'sender': 'john.smith@acme.com',
             'subject': 'Q1 Budget Review',
@@ -277,12 +264,10 @@ Is this message important to you?
 # Example 7: Error Handling
 # ============================================================================
 
-async def example_error_handling():
+async def example_error_handling(manager: SendPulseManager):
     """Demonstrate error handling."""
     print("\n=== Example 7: Error Handling ===\n")
 
-    manager = SendPulseManager()
-
     test_cases = [
         {
             'name': 'Valid message',
@@ -322,11 +307,18 @@ async def example_error_handling():
         },
     ]
 
-    for test in test_cases:
+    # Cases are independent, so send them concurrently and report in order
+    responses = await asyncio.gather(
+        *(manager.send_notification(**test['params']) for test in test_cases),
+        return_exceptions=True
+    )
+
+    for test, response in zip(test_cases, responses):
         print(f"Testing: {test['name']}")
-        response = await manager.send_notification(**test['params'])
 
-        if test['expect_error']:
+        if isinstance(response, Exception):
+            print(f"  ! Exception: {response}")
+        elif test['expect_error']:
             assert not response.success, "Should have failed"
             print(f"  ✓ Error (expected): {response.error}")
         else:
@@ -342,19 +334,16 @@ async def example_error_handling():
 # Example 8: Performance - Batch Processing
 # ============================================================================
 
-async def example_batch_performance():
+async def example_batch_performance(manager: SendPulseManager):
     """Demonstrate batch processing performance."""
     print("\n=== Example 8: Batch Processing ===\n")
 
-    manager = SendPulseManager()
-
     # Simulate large batch
     user_ids = [f'user_{i:05d}' for i in range(100)]
 
     message = "Daily digest summary"
 
-    import time
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     responses = await manager.send_batch(
         tenant_id='acme_corp',
@@ -363,9 +352,9 @@ async def example_batch_performance():
         message_type=NotificationType.DIGEST
     )
 
-    elapsed = time.time() - start_time
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
 
-    successful = sum(1 for r in responses if r.success)
+    successful = responses.successful
 
     print(f"Batch size: {len(user_ids)}")
     print(f"Successful: {successful}")
@@ -377,6 +366,28 @@ async def example_batch_performance():
 # Main: Run All Examples
 # ============================================================================
 
+EXAMPLES = (
+    example_urgent_notification,
+    example_daily_digest,
+    example_feedback_collection,
+    example_batch_send,
+    example_conditional_notification,
+    example_learning_agent_integration,
+    example_error_handling,
+    example_batch_performance,
+)
+
+
+async def _run_example(example, manager: SendPulseManager) -> None:
+    """Run one example, reporting (not raising) its failure."""
+    try:
+        await example(manager)
+    except Exception as e:
+        print(f"\n❌ Error in {example.__name__}: {e}")
+        print("\nNote: Ensure SendPulse credentials are configured in Secrets Manager")
+        print("Environment variable: SENDPULSE_SECRET_ARN")
+
+
 async def main():
     """Run all examples."""
     print("=" * 70)
@@ -386,20 +397,19 @@ async def main():
     # Note: Some examples may fail if SendPulse credentials are not configured
     # They demonstrate the correct usage patterns
 
+    # One manager for all examples: a single pooled session, token and
+    # user-phone cache
+    manager = SendPulseManager()
+
+    # Examples use independent users, so they run concurrently; a failure
+    # in one is reported without cancelling the others
     try:
-        await example_urgent_notification()
-        await example_daily_digest()
-        await example_feedback_collection()
-        await example_batch_send()
-        await example_conditional_notification()
-        await example_learning_agent_integration()
-        await example_error_handling()
-        await example_batch_performance()
+        async with asyncio.TaskGroup() as tg:
+            for example in EXAMPLES:
+                tg.create_task(_run_example(example, manager))
 
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        print("\nNote: Ensure SendPulse credentials are configured in Secrets Manager")
-        print("Environment variable: SENDPULSE_SECRET_ARN")
+    finally:
+        await manager.aclose()
 
 
 if __name__ == '__main__':
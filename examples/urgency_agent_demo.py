@@ -6,8 +6,14 @@ a urgência de mensagens do WhatsApp.
 
 import asyncio
 import json
+import time
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from jaiminho_notificacoes.processing.agents import (
     UrgencyAgent,
     HistoricalInterruptionData,
@@ -22,6 +28,50 @@ from jaiminho_notificacoes.persistence.models import (
 )
 
 
+# Máximo de execuções simultâneas do agente (rate limit do provedor)
+MAX_CONCURRENT_RUNS = 4
+
+
+def _pretty(data) -> str:
+    """Pretty-print a result dict as JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# Template for sample messages; only the varying fields are replaced per
+# call. model_copy is shallow, so source/security are shared (read-only).
+_TEMPLATE = NormalizedMessage(
+    message_id="msg-template",
+    tenant_id="tenant-example",
+    user_id="user-123",
+    sender_phone="5511999999999",
+    sender_name="João Silva",
+    message_type=MessageType.TEXT,
+    content=MessageContent(text="template"),
+    timestamp=0,
+    source=MessageSourceModel(
+        platform="wapi",
+        instance_id="instance-001"
+    ),
+    metadata=MessageMetadata(is_group=False, from_me=False),
+    security=MessageSecurity(
+        validated_at=datetime.now().isoformat(),
+        validation_passed=True,
+        instance_verified=True,
+        tenant_resolved=True,
+        phone_ownership_verified=True
+    )
+)
+
+_METADATA = {
+    is_group: MessageMetadata(is_group=is_group, from_me=False)
+    for is_group in (False, True)
+}
+
+
 def create_sample_message(
     text: str,
     sender_phone: str = "5511999999999",
@@ -29,28 +79,15 @@ def create_sample_message(
     is_group: bool = False
 ) -> NormalizedMessage:
     """Create a sample message for testing."""
-    return NormalizedMessage(
-        message_id=f"msg-{datetime.now().timestamp()}",
-        tenant_id="tenant-example",
-        user_id="user-123",
-        sender_phone=sender_phone,
-        sender_name=sender_name,
-        message_type=MessageType.TEXT,
-        content=MessageContent(text=text),
-        timestamp=int(datetime.now().timestamp()),
-        source=MessageSourceModel(
-            platform="wapi",
-            instance_id="instance-001"
-        ),
-        metadata=MessageMetadata(is_group=is_group, from_me=False),
-        security=MessageSecurity(
-            validated_at=datetime.now().isoformat(),
-            validation_passed=True,
-            instance_verified=True,
-            tenant_resolved=True,
-            phone_ownership_verified=True
-        )
-    )
+    now = time.time()
+    return _TEMPLATE.model_copy(update={
+        'message_id': f"msg-{now}",
+        'sender_phone': sender_phone,
+        'sender_name': sender_name,
+        'content': MessageContent(text=text),
+        'timestamp': int(now),
+        'metadata': _METADATA[is_group],
+    })
 
 
 async def main():
@@ -64,113 +101,108 @@ async def main():
     # Criar instância do agente
     agent = UrgencyAgent()
     
-    # Exemplo 1: Mensagem financeira urgente
-    print("1. ALERTA FINANCEIRO")
-    print("-" * 80)
-    msg1 = create_sample_message(
-        "ALERTA: Transação suspeita de R$ 5.000,00 detectada em sua conta. "
-        "Código de verificação: 123456. Expira em 5 minutos."
-    )
-    
-    # Criar dados históricos simulados (remetente confiável)
-    history1 = HistoricalInterruptionData(
-        sender_phone="5511999999999",
-        total_messages=15,
-        urgent_count=12,
-        not_urgent_count=3,
-        avg_response_time_seconds=300.0
-    )
-    
-    result1 = await agent.run(msg1, history1)
-    print(f"Mensagem: {msg1.content.text[:100]}...")
-    print(f"Resultado: {json.dumps(result1.to_json(), indent=2, ensure_ascii=False)}")
-    print()
-    
-    # Exemplo 2: Marketing/Promoção (não urgente)
-    print("2. MENSAGEM DE MARKETING")
-    print("-" * 80)
-    msg2 = create_sample_message(
-        "🎉 PROMOÇÃO ESPECIAL! 50% de desconto em todos os produtos! "
-        "Não perca essa oportunidade incrível! Compre 2 leve 3!",
-        sender_phone="5511888888888",
-        sender_name="Loja ABC"
-    )
-    
-    # Histórico com baixa taxa de urgência
-    history2 = HistoricalInterruptionData(
-        sender_phone="5511888888888",
-        total_messages=30,
-        urgent_count=1,
-        not_urgent_count=29
-    )
-    
-    result2 = await agent.run(msg2, history2)
-    print(f"Mensagem: {msg2.content.text[:100]}...")
-    print(f"Resultado: {json.dumps(result2.to_json(), indent=2, ensure_ascii=False)}")
-    print()
-    
-    # Exemplo 3: Mensagem de grupo (conservador)
-    print("3. MENSAGEM DE GRUPO")
-    print("-" * 80)
-    msg3 = create_sample_message(
-        "Pessoal, reunião urgente amanhã às 9h! Por favor confirmar presença.",
-        is_group=True
-    )
-    
-    result3 = await agent.run(msg3)
-    print(f"Mensagem: {msg3.content.text}")
-    print(f"Resultado: {json.dumps(result3.to_json(), indent=2, ensure_ascii=False)}")
-    print()
-    
-    # Exemplo 4: Primeiro contato (muito conservador)
-    print("4. PRIMEIRO CONTATO")
-    print("-" * 80)
-    msg4 = create_sample_message(
-        "Olá! Vi seu anúncio e tenho interesse no produto. Podemos conversar?",
-        sender_phone="5511777777777",
-        sender_name="Desconhecido"
-    )
-    
-    # Sem histórico (primeiro contato)
-    history4 = HistoricalInterruptionData(sender_phone="5511777777777")
-    
-    result4 = await agent.run(msg4, history4)
-    print(f"Mensagem: {msg4.content.text}")
-    print(f"Resultado: {json.dumps(result4.to_json(), indent=2, ensure_ascii=False)}")
-    print()
-    
-    # Exemplo 5: Mensagem muito curta
-    print("5. MENSAGEM CURTA")
-    print("-" * 80)
-    msg5 = create_sample_message("Ok")
+    # Casos de exemplo: (título, mensagem, histórico, truncar texto)
+    cases = [
+        # Exemplo 1: Mensagem financeira urgente (remetente confiável)
+        (
+            "1. ALERTA FINANCEIRO",
+            create_sample_message(
+                "ALERTA: Transação suspeita de R$ 5.000,00 detectada em sua conta. "
+                "Código de verificação: 123456. Expira em 5 minutos."
+            ),
+            HistoricalInterruptionData(
+                sender_phone="5511999999999",
+                total_messages=15,
+                urgent_count=12,
+                not_urgent_count=3,
+                avg_response_time_seconds=300.0
+            ),
+            True,
+        ),
+        # Exemplo 2: Marketing/Promoção (baixa taxa de urgência)
+        (
+            "2. MENSAGEM DE MARKETING",
+            create_sample_message(
+                "🎉 PROMOÇÃO ESPECIAL! 50% de desconto em todos os produtos! "
+                "Não perca essa oportunidade incrível! Compre 2 leve 3!",
+                sender_phone="5511888888888",
+                sender_name="Loja ABC"
+            ),
+            HistoricalInterruptionData(
+                sender_phone="5511888888888",
+                total_messages=30,
+                urgent_count=1,
+                not_urgent_count=29
+            ),
+            True,
+        ),
+        # Exemplo 3: Mensagem de grupo (conservador)
+        (
+            "3. MENSAGEM DE GRUPO",
+            create_sample_message(
+                "Pessoal, reunião urgente amanhã às 9h! Por favor confirmar presença.",
+                is_group=True
+            ),
+            None,
+            False,
+        ),
+        # Exemplo 4: Primeiro contato (sem histórico, muito conservador)
+        (
+            "4. PRIMEIRO CONTATO",
+            create_sample_message(
+                "Olá! Vi seu anúncio e tenho interesse no produto. Podemos conversar?",
+                sender_phone="5511777777777",
+                sender_name="Desconhecido"
+            ),
+            HistoricalInterruptionData(sender_phone="5511777777777"),
+            False,
+        ),
+        # Exemplo 5: Mensagem muito curta
+        (
+            "5. MENSAGEM CURTA",
+            create_sample_message("Ok"),
+            None,
+            False,
+        ),
+        # Exemplo 6: Código de verificação (urgente)
+        (
+            "6. CÓDIGO DE VERIFICAÇÃO",
+            create_sample_message(
+                "Seu código de verificação é: 987654\n"
+                "Não compartilhe este código com ninguém.\n"
+                "Válido por 10 minutos.",
+                sender_phone="551133334444",
+                sender_name="Banco XYZ"
+            ),
+            HistoricalInterruptionData(
+                sender_phone="551133334444",
+                total_messages=8,
+                urgent_count=7,
+                not_urgent_count=1
+            ),
+            True,
+        ),
+    ]
     
-    result5 = await agent.run(msg5)
-    print(f"Mensagem: {msg5.content.text}")
-    print(f"Resultado: {json.dumps(result5.to_json(), indent=2, ensure_ascii=False)}")
-    print()
+    # Os casos são independentes: executar em paralelo, limitado pelo
+    # rate limit do provedor de LLM
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
     
-    # Exemplo 6: Código de verificação (urgente)
-    print("6. CÓDIGO DE VERIFICAÇÃO")
-    print("-" * 80)
-    msg6 = create_sample_message(
-        "Seu código de verificação é: 987654\n"
-        "Não compartilhe este código com ninguém.\n"
-        "Válido por 10 minutos.",
-        sender_phone="551133334444",
-        sender_name="Banco XYZ"
-    )
+    async def run_case(message, history):
+        async with semaphore:
+            return await agent.run(message, history)
     
-    history6 = HistoricalInterruptionData(
-        sender_phone="551133334444",
-        total_messages=8,
-        urgent_count=7,
-        not_urgent_count=1
+    results = await asyncio.gather(
+        *(run_case(message, history) for _, message, history, _ in cases)
     )
     
-    result6 = await agent.run(msg6, history6)
-    print(f"Mensagem: {msg6.content.text[:100]}...")
-    print(f"Resultado: {json.dumps(result6.to_json(), indent=2, ensure_ascii=False)}")
-    print()
+    for (title, message, _, truncate), result in zip(cases, results):
+        print(title)
+        print("-" * 80)
+        text = message.content.text
+        print(f"Mensagem: {text[:100]}..." if truncate else f"Mensagem: {text}")
+        print(f"Resultado: {_pretty(result.to_json())}")
+        print()
     
     print("=" * 80)
     print("DEMONSTRAÇÃO CONCLUÍDA")
@@ -4,24 +4,71 @@ This script helps bootstrap the tenant isolation system by creating
 the initial mappings between W-API instances and tenants.
 
 SECURITY CRITICAL: This mapping is the foundation of tenant isolation.
+
+API keys are stored as SHA-256 hex digests (the format TenantResolver
+compares against). Digests are memoized, since bulk onboarding often
+reuses the same key across many instances.
 """
 
 import argparse
+import functools
 import hashlib
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 import boto3
 from botocore.exceptions import ClientError
 
 
+# Lazy-loaded DynamoDB resource, shared by all commands
+_dynamodb = None
+
+
+def get_dynamodb():
+    """Get or create DynamoDB resource."""
+    global _dynamodb
+    if _dynamodb is None:
+        _dynamodb = boto3.resource('dynamodb')
+    return _dynamodb
+
+
+@functools.lru_cache(maxsize=4096)
 def hash_api_key(api_key: str) -> str:
-    """Hash API key using SHA-256."""
+    """Hash API key using SHA-256 (memoized per key)."""
     return hashlib.sha256(api_key.encode()).hexdigest()
 
 
+def _build_item(
+    tenant_id: str,
+    user_id: str,
+    instance_id: str,
+    instance_name: str,
+    phone_number: str,
+    api_key: str,
+    status: str = "active",
+    metadata: Dict[str, Any] = None,
+    now: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a tenant-instance mapping item (API key is hashed)."""
+    if now is None:
+        now = datetime.utcnow().isoformat()
+    return {
+        'instance_id': instance_id,  # Partition key
+        'tenant_id': tenant_id,
+        'user_id': user_id,
+        'instance_name': instance_name,
+        'phone_number': phone_number,
+        'api_key_hash': hash_api_key(api_key),
+        'status': status,
+        'created_at': now,
+        'updated_at': now,
+        'metadata': metadata or {}
+    }
+
+
 def create_tenant_mapping(
     dynamodb_table_name: str,
     tenant_id: str,
@@ -51,25 +98,18 @@ def create_tenant_mapping(
         True if successful, False otherwise
     """
     try:
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(dynamodb_table_name)
-        
-        # Hash the API key
-        api_key_hash = hash_api_key(api_key)
-        
-        # Create item
-        item = {
-            'instance_id': instance_id,  # Partition key
-            'tenant_id': tenant_id,
-            'user_id': user_id,
-            'instance_name': instance_name,
-            'phone_number': phone_number,
-            'api_key_hash': api_key_hash,
-            'status': status,
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat(),
-            'metadata': metadata or {}
-        }
+        table = get_dynamodb().Table(dynamodb_table_name)
+        
+        item = _build_item(
+            tenant_id=tenant_id,
+            user_id=user_id,
+            instance_id=instance_id,
+            instance_name=instance_name,
+            phone_number=phone_number,
+            api_key=api_key,
+            status=status,
+            metadata=metadata
+        )
         
         # Put item
         table.put_item(Item=item)
@@ -90,29 +130,115 @@ def create_tenant_mapping(
         return False
 
 
-def list_tenant_mappings(dynamodb_table_name: str):
-    """List all tenant-instance mappings."""
+def create_tenant_mappings_bulk(
+    dynamodb_table_name: str,
+    mappings: List[Dict[str, Any]]
+) -> bool:
+    """
+    Create many tenant-instance mappings with BatchWriteItem.
+    
+    The batch writer sends up to 25 items per request and retries
+    unprocessed items.
+    
+    Args:
+        dynamodb_table_name: Name of the tenants table
+        mappings: Mapping dicts with the create_tenant_mapping arguments
+            (tenant_id, user_id, instance_id, instance_name, phone_number,
+            api_key, optional status and metadata)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        table = get_dynamodb().Table(dynamodb_table_name)
+        
+        with table.batch_writer(overwrite_by_pkeys=['instance_id']) as batch:
+            for i, mapping in enumerate(mappings):
+                # One timestamp per BatchWriteItem-sized group
+                if i % 25 == 0:
+                    now = datetime.utcnow().isoformat()
+                batch.put_item(Item=_build_item(**mapping, now=now))
+        
+        print(f"✅ Successfully created {len(mappings)} mapping(s)")
+        return True
+        
+    except ClientError as e:
+        print(f"❌ DynamoDB error: {e.response['Error']['Message']}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {str(e)}")
+        return False
+
+
+# Attributes shown by the list command
+_LIST_PROJECTION = 'instance_id, tenant_id, user_id, phone_number, #s, created_at'
+_LIST_ATTRIBUTE_NAMES = {'#s': 'status'}
+
+
+def _format_mapping(item: Dict[str, Any]) -> str:
+    """Format a mapping for the list command."""
+    return (
+        f"Instance ID: {item['instance_id']}\n"
+        f"  Tenant: {item['tenant_id']}\n"
+        f"  User: {item['user_id']}\n"
+        f"  Phone: {item['phone_number']}\n"
+        f"  Status: {item['status']}\n"
+        f"  Created: {item['created_at']}\n"
+    )
+
+
+def _scan_segment(table, segment: int, total_segments: int) -> int:
+    """Scan one table segment page by page, printing items as they arrive."""
+    paginator = table.meta.client.get_paginator('scan')
+    params = {
+        'TableName': table.name,
+        'ProjectionExpression': _LIST_PROJECTION,
+        'ExpressionAttributeNames': _LIST_ATTRIBUTE_NAMES,
+    }
+    if total_segments > 1:
+        params['Segment'] = segment
+        params['TotalSegments'] = total_segments
+
+    count = 0
+    # The resource's client deserializes items to Python types
+    for page in paginator.paginate(**params):
+        for item in page.get('Items', []):
+            # One print per item keeps parallel segments from interleaving lines
+            print(_format_mapping(item))
+            count += 1
+    return count
+
+
+def list_tenant_mappings(dynamodb_table_name: str, segments: int = 1):
+    """
+    List all tenant-instance mappings.
+    
+    Follows scan pagination (a single Scan stops at 1 MB), projects only
+    the listed attributes, and optionally scans segments in parallel.
+    
+    Args:
+        dynamodb_table_name: Name of the tenants table
+        segments: Number of parallel scan segments
+    """
     try:
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(dynamodb_table_name)
+        table = get_dynamodb().Table(dynamodb_table_name)
+        
+        print("\n📋 Tenant mappings:\n")
         
-        response = table.scan()
-        items = response.get('Items', [])
+        if segments > 1:
+            with ThreadPoolExecutor(max_workers=segments) as executor:
+                total = sum(executor.map(
+                    lambda segment: _scan_segment(table, segment, segments),
+                    range(segments)
+                ))
+        else:
+            total = _scan_segment(table, 0, 1)
         
-        if not items:
+        if not total:
             print("No tenant mappings found.")
             return
         
-        print(f"\n📋 Found {len(items)} tenant mapping(s):\n")
-        
-        for item in items:
-            print(f"Instance ID: {item['instance_id']}")
-            print(f"  Tenant: {item['tenant_id']}")
-            print(f"  User: {item['user_id']}")
-            print(f"  Phone: {item['phone_number']}")
-            print(f"  Status: {item['status']}")
-            print(f"  Created: {item['created_at']}")
-            print()
+        print(f"Found {total} tenant mapping(s).")
         
     except Exception as e:
         print(f"❌ Error listing mappings: {str(e)}")
@@ -125,8 +251,7 @@ def update_tenant_status(
 ) -> bool:
     """Update tenant status."""
     try:
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(dynamodb_table_name)
+        table = get_dynamodb().Table(dynamodb_table_name)
         
         table.update_item(
             Key={'instance_id': instance_id},
@@ -171,8 +296,23 @@ def main():
     create_parser.add_argument('--status', default='active', choices=['active', 'suspended', 'disabled'])
     create_parser.add_argument('--metadata', type=json.loads, help='Additional metadata (JSON)')
     
+    # Bulk create command
+    bulk_parser = subparsers.add_parser('create-bulk', help='Create tenant mappings from a JSON file')
+    bulk_parser.add_argument(
+        '--file',
+        required=True,
+        help='JSON file with a list of mappings (tenant_id, user_id, instance_id, '
+             'instance_name, phone_number, api_key, optional status/metadata)'
+    )
+    
     # List mappings command
-    subparsers.add_parser('list', help='List all tenant mappings')
+    list_parser = subparsers.add_parser('list', help='List all tenant mappings')
+    list_parser.add_argument(
+        '--segments',
+        type=int,
+        default=1,
+        help='Parallel scan segments for large tables'
+    )
     
     # Update status command
     status_parser = subparsers.add_parser('update-status', help='Update tenant status')
@@ -200,8 +340,14 @@ def main():
         )
         return 0 if success else 1
     
+    elif args.command == 'create-bulk':
+        with open(args.file) as f:
+            mappings = json.load(f)
+        success = create_tenant_mappings_bulk(args.table, mappings)
+        return 0 if success else 1
+    
     elif args.command == 'list':
-        list_tenant_mappings(args.table)
+        list_tenant_mappings(args.table, segments=args.segments)
         return 0
     
     elif args.command == 'update-status':
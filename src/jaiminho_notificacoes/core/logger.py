@@ -1,11 +1,70 @@
 """Structured logging with tenant context."""
 
+import contextvars
 import json
 import logging
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
-from functools import wraps
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from functools import lru_cache, wraps
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# Record attributes copied into the JSON payload when present
+_EXTRA_FIELDS = ('tenant_id', 'user_id', 'instance_id', 'security_event', 'details')
+_MISSING = object()
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log payload (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(data, default=str)
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON formatter for CloudWatch."""
+
+    # (epoch second, formatted UTC prefix) for the last second seen
+    _second_cache = (None, '')
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format record.created as a UTC ISO-8601 timestamp (microseconds)."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if cached_second != second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f'{prefix}.{int((created - second) * 1_000_000):06d}'
+
+    def format(self, record):
+        log_data = {
+            'timestamp': self._format_timestamp(record.created),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        
+        # Add extra fields
+        for name in _EXTRA_FIELDS:
+            value = getattr(record, name, _MISSING)
+            if value is not _MISSING:
+                log_data[name] = value
+        
+        return _dumps(log_data)
+
+
+# Shared stdout handler; attached at most once per underlying logger
+_FORMATTER = JsonFormatter()
+_HANDLER = logging.StreamHandler(sys.stdout)
+_HANDLER.setFormatter(_FORMATTER)
 
 
 class TenantContextLogger:
@@ -15,74 +74,70 @@ class TenantContextLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
         
-        # JSON formatter for structured logging
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(self._get_json_formatter())
-        self.logger.addHandler(handler)
+        # logging.getLogger(name) is process-wide, so only attach once
+        if _HANDLER not in self.logger.handlers:
+            self.logger.addHandler(_HANDLER)
         
-        self._tenant_context: Dict[str, Any] = {}
+        # Context-local so concurrent asyncio tasks don't share tenant context
+        self._tenant_context: contextvars.ContextVar[Dict[str, Any]] = (
+            contextvars.ContextVar(f'{name}.tenant_context', default={})
+        )
     
     def _get_json_formatter(self) -> logging.Formatter:
         """Get JSON formatter for CloudWatch."""
-        class JsonFormatter(logging.Formatter):
-            def format(self, record):
-                log_data = {
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'level': record.levelname,
-                    'logger': record.name,
-                    'message': record.getMessage(),
-                }
-                
-                # Add extra fields
-                if hasattr(record, 'tenant_id'):
-                    log_data['tenant_id'] = record.tenant_id
-                if hasattr(record, 'user_id'):
-                    log_data['user_id'] = record.user_id
-                if hasattr(record, 'instance_id'):
-                    log_data['instance_id'] = record.instance_id
-                if hasattr(record, 'security_event'):
-                    log_data['security_event'] = record.security_event
-                if hasattr(record, 'details'):
-                    log_data['details'] = record.details
-                
-                return json.dumps(log_data)
-        
-        return JsonFormatter()
+        return _FORMATTER
     
     def set_context(self, **kwargs):
         """Set tenant context for subsequent logs."""
-        self._tenant_context.update(kwargs)
+        self._tenant_context.set({**self._tenant_context.get(), **kwargs})
     
     def clear_context(self):
         """Clear tenant context."""
-        self._tenant_context.clear()
+        self._tenant_context.set({})
+    
+    @contextmanager
+    def context(self, **kwargs) -> Iterator['TenantContextLogger']:
+        """
+        Scope tenant context to a block.
+        
+        Context set inside the block (including via set_context) is undone
+        on exit, restoring whatever was set before.
+        """
+        token = self._tenant_context.set({**self._tenant_context.get(), **kwargs})
+        try:
+            yield self
+        finally:
+            self._tenant_context.reset(token)
     
     def _add_context(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Add tenant context to log extra fields."""
-        log_extra = self._tenant_context.copy()
+        log_extra = self._tenant_context.get().copy()
         if extra:
             log_extra.update(extra)
         return log_extra
     
-    def info(self, message: str, **kwargs):
-        """Log info message with context."""
-        self.logger.info(message, extra=self._add_context(kwargs))
+    def info(self, message: str, *args, **kwargs):
+        """Log info message with context (%-style args are formatted lazily)."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, extra=self._add_context(kwargs))
     
-    def warning(self, message: str, **kwargs):
-        """Log warning message with context."""
-        self.logger.warning(message, extra=self._add_context(kwargs))
+    def warning(self, message: str, *args, **kwargs):
+        """Log warning message with context (%-style args are formatted lazily)."""
+        self.logger.warning(message, *args, extra=self._add_context(kwargs))
     
-    def error(self, message: str, **kwargs):
-        """Log error message with context."""
-        self.logger.error(message, extra=self._add_context(kwargs))
+    def error(self, message: str, *args, **kwargs):
+        """Log error message with context (%-style args are formatted lazily)."""
+        self.logger.error(message, *args, extra=self._add_context(kwargs))
     
-    def critical(self, message: str, **kwargs):
-        """Log critical message with context."""
-        self.logger.critical(message, extra=self._add_context(kwargs))
+    def critical(self, message: str, *args, **kwargs):
+        """Log critical message with context (%-style args are formatted lazily)."""
+        self.logger.critical(message, *args, extra=self._add_context(kwargs))
     
-    def debug(self, message: str, **kwargs):
-        """Log debug message with context."""
-        self.logger.debug(message, extra=self._add_context(kwargs))
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message with context (%-style args are formatted lazily)."""
+        # Skip building the context dict when DEBUG is off (hot paths)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args, extra=self._add_context(kwargs))
     
     def security_event(
         self,
@@ -178,9 +233,10 @@ class TenantContextLogger:
 
 def log_execution(func):
     """Decorator to log function execution."""
+    logger = get_logger(func.__module__)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = TenantContextLogger(func.__module__)
         logger.info(f'Executing {func.__name__}')
         try:
             result = func(*args, **kwargs)
@@ -196,6 +252,7 @@ def log_execution(func):
 
 
 # Global logger instance
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> TenantContextLogger:
     """Get or create logger with name."""
     return TenantContextLogger(name)
@@ -0,0 +1,18 @@
+"""Phone number normalization shared by tenant checks and persistence."""
+
+from typing import Optional
+
+
+# Deletes every ASCII non-digit; phone numbers are ASCII in practice
+_ASCII_NON_DIGITS = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+
+
+def normalize_phone(phone: Optional[str]) -> str:
+    """Normalize phone number to digits only for consistent comparisons."""
+    if not phone:
+        return ""
+    if phone.isascii():
+        return phone if phone.isdigit() else phone.translate(_ASCII_NON_DIGITS)
+    return "".join(ch for ch in phone if ch.isdigit())
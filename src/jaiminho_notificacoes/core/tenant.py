@@ -1,32 +1,127 @@
 """Tenant isolation and context management."""
 
+import asyncio
 import hashlib
-from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+import hmac
+import os
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
 
 from ..persistence.dynamodb import WAPIInstanceRepository
+from ..persistence.models import WAPIInstance
 from .logger import get_logger
+from .phone import normalize_phone
 
 logger = get_logger(__name__)
 
+# Max tenant contexts kept per resolver (least recently used evicted first)
+MAX_CACHE_SIZE = 1000
+
+# Resolved contexts are reused for POSITIVE_CACHE_TTL_SECONDS; unknown or
+# invalid-status instances are remembered briefly so a re-activated tenant
+# is picked up quickly
+POSITIVE_CACHE_TTL_SECONDS = 60
+NEGATIVE_CACHE_TTL_SECONDS = 5
+
+# Unknown instance_ids are remembered in a separate LRU of fixed-size
+# fingerprints, so a flood of bogus ids neither grows memory with
+# attacker-controlled key lengths nor evicts resolved tenant contexts
+MAX_NEGATIVE_CACHE_SIZE = 10000
+
+
+# Bound once at import. The OpenSSL constructor uses SHA-NI where the CPU
+# supports it; builds without OpenSSL fall back to the slower builtin.
+_sha256 = hashlib.sha256
+if _sha256.__module__ != '_hashlib':
+    logger.warning(
+        "hashlib.sha256 is not OpenSSL-backed; API key hashing uses the "
+        "builtin implementation"
+    )
+
+
+_STATUS_ACTIVE = sys.intern('active')
+
+# Per-process key so fingerprint collisions can't be crafted from outside
+_FINGERPRINT_KEY = os.urandom(16)
+
+
+def _instance_fingerprint(instance_id: str) -> bytes:
+    """64-bit keyed fingerprint of an instance_id for the negative cache."""
+    return hashlib.blake2b(
+        instance_id.encode('utf-8'), digest_size=8, key=_FINGERPRINT_KEY
+    ).digest()
+
+
+# Read-only validation results shared by every validate_and_resolve call
+_NO_ERRORS: Mapping[str, str] = MappingProxyType({})
+_ERRORS_INSTANCE: Mapping[str, str] = MappingProxyType(
+    {'instance_id': 'Invalid or unauthorized instance'}
+)
+_ERRORS_PHONE: Mapping[str, str] = MappingProxyType(
+    {'phone_ownership': 'Phone does not belong to this instance'}
+)
+_ERRORS_PAYLOAD: Mapping[str, str] = MappingProxyType(
+    {'payload_forbidden_fields': 'Payload attempted to override tenant/user context'}
+)
+
 
-@dataclass
+@lru_cache(maxsize=None)
+def _status_errors(status: str) -> Mapping[str, str]:
+    """Read-only error mapping for an inactive tenant status."""
+    return MappingProxyType({'status': f'Tenant status is {status}'})
+
+
+# Identity fields that must never be taken from a webhook payload
+_PAYLOAD_IDENTITY_KEYS = frozenset({'tenant_id', 'user_id'})
+
+
+# Empty context copied per hash; cheaper than constructing a new one for
+# single-block inputs like API keys
+_SHA256_BASE = _sha256()
+
+
+@lru_cache(maxsize=4096)
+def _api_key_digest(api_key: str) -> bytes:
+    """Raw SHA-256 digest of an API key (memoized; keys recur per instance)."""
+    hasher = _SHA256_BASE.copy()
+    hasher.update(api_key.encode())
+    return hasher.digest()
+
+
+@dataclass(slots=True, frozen=True)
 class TenantContext:
-    """Tenant context with verified information."""
+    """Tenant context with verified information (immutable, safe to share)."""
     tenant_id: str
     user_id: str
     instance_id: str
     phone_number: str
     status: str
+    normalized_phone: str = field(init=False, repr=False, compare=False)
     
     def is_active(self) -> bool:
         """Check if tenant is active."""
-        return self.status == 'active'
+        # Interned status makes this an identity hit; == still holds for
+        # instances that skipped __post_init__ (e.g. unpickled)
+        return self.status == _STATUS_ACTIVE
     
     def __post_init__(self):
         """Validate tenant context after initialization."""
         if not all([self.tenant_id, self.user_id, self.instance_id]):
             raise ValueError("All tenant context fields are required")
+        # Low-cardinality fields are interned so cached contexts share them
+        object.__setattr__(self, 'status', sys.intern(self.status))
+        object.__setattr__(self, 'tenant_id', sys.intern(self.tenant_id))
+        # Normalized once; reused by every ownership check on this context
+        object.__setattr__(
+            self, 'normalized_phone', normalize_phone(self.phone_number)
+        )
 
 
 class TenantResolver:
@@ -34,30 +129,87 @@ class TenantResolver:
     
     def __init__(self):
         self.rds_client = None  # Initialized on demand
-        self._cache: Dict[str, TenantContext] = {}
+        # instance_id -> (expires_at monotonic, context or None if negative,
+        # stored API key digest for re-validating keys on cache hits)
+        self._cache: OrderedDict[
+            str, Tuple[float, Optional[TenantContext], Optional[bytes]]
+        ] = OrderedDict()
+        # instance_id fingerprint -> expires_at monotonic for unknown or
+        # invalid instances
+        self._negative: OrderedDict[bytes, float] = OrderedDict()
         self.instances_repo = WAPIInstanceRepository()
+        # instance_id -> in-flight repository lookup shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     @staticmethod
     def _normalize_phone(phone: Optional[str]) -> str:
         """Normalize phone number to digits only for consistent comparisons."""
-        if not phone:
-            return ""
-        return "".join(ch for ch in phone if ch.isdigit())
+        return normalize_phone(phone)
     
     def _hash_api_key(self, api_key: str) -> str:
         """Hash API key for secure storage comparison."""
-        return hashlib.sha256(api_key.encode()).hexdigest()
+        return _api_key_digest(api_key).hex()
     
-    def _get_from_cache(self, instance_id: str) -> Optional[TenantContext]:
-        """Get tenant context from cache."""
-        return self._cache.get(instance_id)
+    def _get_from_cache(
+        self,
+        instance_id: str
+    ) -> Tuple[bool, Optional[TenantContext], Optional[bytes]]:
+        """
+        Get tenant context from cache (marks it most recently used).
+        
+        Returns:
+            (hit, context, stored API key digest); a hit with a None context
+            is a cached negative
+        """
+        entry = self._cache.get(instance_id)
+        if entry is None:
+            return self._get_negative(instance_id), None, None
+        expires_at, context, api_key_digest = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[instance_id]
+            return False, None, None
+        self._cache.move_to_end(instance_id)
+        return True, context, api_key_digest
+    
+    def _get_negative(self, instance_id: str) -> bool:
+        """Whether instance_id is a live entry in the negative cache."""
+        if not self._negative:
+            return False
+        fingerprint = _instance_fingerprint(instance_id)
+        expires_at = self._negative.get(fingerprint)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            del self._negative[fingerprint]
+            return False
+        return True
     
-    def _add_to_cache(self, instance_id: str, context: TenantContext):
-        """Add tenant context to cache."""
-        # Simple in-memory cache (consider Redis for production)
-        if len(self._cache) > 1000:  # Prevent memory leak
-            self._cache.clear()
-        self._cache[instance_id] = context
+    def _add_to_cache(
+        self,
+        instance_id: str,
+        context: Optional[TenantContext],
+        api_key_digest: Optional[bytes] = None
+    ):
+        """Cache a context (or None as a negative result), evicting the LRU."""
+        # Simple in-memory TTL + LRU (consider Redis for production)
+        if context is None:
+            self._cache.pop(instance_id, None)
+            fingerprint = _instance_fingerprint(instance_id)
+            self._negative[fingerprint] = (
+                time.monotonic() + NEGATIVE_CACHE_TTL_SECONDS
+            )
+            self._negative.move_to_end(fingerprint)
+            if len(self._negative) > MAX_NEGATIVE_CACHE_SIZE:
+                self._negative.popitem(last=False)
+            return
+        self._cache[instance_id] = (
+            time.monotonic() + POSITIVE_CACHE_TTL_SECONDS,
+            context,
+            api_key_digest
+        )
+        self._cache.move_to_end(instance_id)
+        if len(self._cache) > MAX_CACHE_SIZE:
+            self._cache.popitem(last=False)
     
     async def resolve_from_instance(
         self,
@@ -81,73 +233,183 @@ class TenantResolver:
             TenantContext if valid, None otherwise
         """
         # Check cache first
-        cached = self._get_from_cache(instance_id)
-        if cached and cached.is_active():
-            logger.debug(f"Tenant context found in cache for instance: {instance_id}")
+        hit, cached = self._get_cached_active(instance_id, api_key)
+        if hit:
             return cached
         
         try:
-            instance_record = self.instances_repo.get_by_instance_id(instance_id)
-
-            if not instance_record:
-                logger.invalid_instance(
-                    instance_id=instance_id,
-                    reason='Instance not found in database'
-                )
-                return None
-
-            # Validate API key if provided
-            if api_key:
-                api_key_hash = self._hash_api_key(api_key)
-                stored_hash = instance_record.api_key_hash
-
-                if not stored_hash or api_key_hash != stored_hash:
-                    logger.security_validation_failed(
-                        reason='API key mismatch',
-                        instance_id=instance_id,
-                        details={'provided_hash': api_key_hash[:16]}
-                    )
-                    return None
-
-            # Check status
-            status = instance_record.status
-            if status not in ('active', 'suspended'):
-                logger.invalid_instance(
-                    instance_id=instance_id,
-                    reason=f'Invalid status: {status}'
-                )
-                return None
-
-            # Create verified tenant context
-            context = TenantContext(
-                tenant_id=instance_record.tenant_id,
-                user_id=instance_record.user_id,
-                instance_id=instance_record.wapi_instance_id,
-                phone_number=instance_record.phone_number,
-                status=status
+            instance_record = await self._fetch_record(instance_id)
+        except (ClientError, BotoCoreError) as e:
+            # Transient failure, not a miss: skip the negative cache
+            logger.error(
+                f"Error looking up tenant instance: {str(e)}",
+                instance_id=instance_id,
+                details={'error_type': type(e).__name__}
             )
-
-            # Cache for future requests
-            self._add_to_cache(instance_id, context)
-
-            logger.info(
-                f"Tenant resolved successfully",
-                tenant_id=context.tenant_id,
-                user_id=context.user_id,
-                instance_id=instance_id
+            return None
+        
+        return self._context_from_record(instance_id, instance_record, api_key)
+    
+    async def resolve_many(
+        self,
+        instance_ids: List[str],
+        api_key: Optional[str] = None
+    ) -> Dict[str, Optional[TenantContext]]:
+        """
+        Resolve several instance_ids at once (e.g. a multi-message burst).
+        
+        Duplicates are resolved once and cache hits skip the repository;
+        the remaining ids are fetched in a single repository call.
+        
+        Args:
+            instance_ids: W-API instance identifiers
+            api_key: Optional API key validated against every instance
+            
+        Returns:
+            Mapping of instance_id to TenantContext (None if invalid)
+        """
+        results: Dict[str, Optional[TenantContext]] = {}
+        missing: List[str] = []
+        for instance_id in dict.fromkeys(instance_ids):
+            hit, cached = self._get_cached_active(instance_id, api_key)
+            if hit:
+                results[instance_id] = cached
+            else:
+                missing.append(instance_id)
+        
+        if not missing:
+            return results
+        
+        try:
+            records = await asyncio.to_thread(
+                self.instances_repo.get_many_by_instance_ids, missing
             )
+        except (ClientError, BotoCoreError) as e:
+            # Transient failure, not a miss: skip the negative cache
+            logger.error(
+                f"Error looking up tenant instances: {str(e)}",
+                details={'error_type': type(e).__name__, 'count': len(missing)}
+            )
+            results.update(dict.fromkeys(missing))
+            return results
+        
+        for instance_id in missing:
+            results[instance_id] = self._context_from_record(
+                instance_id, records.get(instance_id), api_key
+            )
+        return results
+    
+    async def _fetch_record(self, instance_id: str) -> Optional[WAPIInstance]:
+        """
+        Look up an instance record without blocking the event loop.
+        
+        The synchronous boto3 call runs in a worker thread; concurrent
+        callers for the same instance_id await the same lookup.
+        """
+        inflight = self._inflight.get(instance_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(asyncio.to_thread(
+                self.instances_repo.get_by_instance_id, instance_id
+            ))
+            self._inflight[instance_id] = inflight
+            inflight.add_done_callback(
+                lambda _: self._inflight.pop(instance_id, None)
+            )
+        # Shield so one cancelled caller doesn't cancel the shared lookup
+        return await asyncio.shield(inflight)
+    
+    def _get_cached_active(
+        self,
+        instance_id: str,
+        api_key: Optional[str] = None
+    ) -> Tuple[bool, Optional[TenantContext]]:
+        """Return (True, result) if the cache can answer without a lookup."""
+        hit, cached, stored_digest = self._get_from_cache(instance_id)
+        if hit:
+            if cached is None:
+                logger.debug("Negative cache hit for instance: %s", instance_id)
+                return True, None
+            # Cached contexts still require the caller's API key to match
+            if api_key and not self._api_key_matches(
+                instance_id, api_key, stored_digest
+            ):
+                return True, None
+            if cached.is_active():
+                logger.debug("Tenant context found in cache for instance: %s", instance_id)
+                return True, cached
+        return False, None
+    
+    @staticmethod
+    def _api_key_matches(
+        instance_id: str,
+        api_key: str,
+        stored_digest: Optional[bytes]
+    ) -> bool:
+        """Constant-time compare of the API key digest with the stored one."""
+        provided_digest = _api_key_digest(api_key)
+        if stored_digest and hmac.compare_digest(provided_digest, stored_digest):
+            return True
+        logger.security_validation_failed(
+            reason='API key mismatch',
+            instance_id=instance_id,
+            details={'provided_hash': provided_digest.hex()[:16]}
+        )
+        return False
+    
+    def _context_from_record(
+        self,
+        instance_id: str,
+        instance_record: Optional[WAPIInstance],
+        api_key: Optional[str]
+    ) -> Optional[TenantContext]:
+        """Validate an instance record and build (and cache) its context."""
+        if not instance_record:
+            logger.invalid_instance(
+                instance_id=instance_id,
+                reason='Instance not found in database'
+            )
+            self._add_to_cache(instance_id, None)
+            return None
 
-            return context
+        # Validate API key if provided
+        stored_digest = instance_record.api_key_digest
+        if api_key and not self._api_key_matches(
+            instance_id, api_key, stored_digest
+        ):
+            return None
 
-        except Exception as e:
-            logger.error(
-                f"Unexpected error resolving tenant: {str(e)}",
+        # Check status
+        status = instance_record.status
+        if status not in ('active', 'suspended'):
+            logger.invalid_instance(
                 instance_id=instance_id,
-                details={'error_type': type(e).__name__}
+                reason=f'Invalid status: {status}'
             )
+            self._add_to_cache(instance_id, None)
             return None
+
+        # Create verified tenant context
+        context = TenantContext(
+            tenant_id=instance_record.tenant_id,
+            user_id=instance_record.user_id,
+            instance_id=instance_record.wapi_instance_id,
+            phone_number=instance_record.phone_number,
+            status=status
+        )
+
+        # Cache for future requests (with the decoded key digest)
+        self._add_to_cache(instance_id, context, stored_digest)
+
+        logger.info(
+            "Tenant resolved successfully",
+            tenant_id=context.tenant_id,
+            user_id=context.user_id,
+            instance_id=instance_id
+        )
+
+        return context
     
-    def validate_phone_ownership(
+    async def validate_phone_ownership(
         self,
         sender_phone: str,
         tenant_context: TenantContext
@@ -166,8 +428,11 @@ class TenantResolver:
         Returns:
             True if phone belongs to tenant, False otherwise
         """
-        sanitized_sender = self._normalize_phone(sender_phone)
-        sanitized_expected = self._normalize_phone(tenant_context.phone_number)
+        # Drop any JID domain ("...@s.whatsapp.net") before keeping digits
+        sanitized_sender = self._normalize_phone(
+            sender_phone.partition('@')[0] if sender_phone else sender_phone
+        )
+        sanitized_expected = tenant_context.normalized_phone
 
         if not sanitized_sender or not sanitized_expected:
             logger.security_validation_failed(
@@ -193,7 +458,10 @@ class TenantResolver:
             )
             return False
 
-        owner_record = self.instances_repo.get_owner_by_phone(sanitized_sender)
+        # GSI query with a scan fallback; keep it off the event loop
+        owner_record = await asyncio.to_thread(
+            self.instances_repo.get_owner_by_phone, sanitized_sender
+        )
         if owner_record and owner_record.user_id != tenant_context.user_id:
             logger.security_validation_failed(
                 reason='Phone number assigned to different user',
@@ -224,6 +492,10 @@ class TenantResolver:
         Returns:
             True if attack detected, False otherwise
         """
+        # Legitimate payloads carry neither key; one C-level set op decides
+        if not payload.keys() & _PAYLOAD_IDENTITY_KEYS:
+            return False
+        
         # Check if payload tries to specify a different tenant/user
         payload_tenant = payload.get('tenant_id')
         payload_user = payload.get('user_id')
@@ -263,17 +535,16 @@ class TenantIsolationMiddleware:
         api_key: Optional[str] = None,
         sender_phone: Optional[str] = None,
         payload: Optional[Dict] = None
-    ) -> Tuple[Optional[TenantContext], Dict[str, str]]:
+    ) -> Tuple[Optional[TenantContext], Mapping[str, str]]:
         """
         Complete validation and resolution pipeline.
         
         Returns:
-            (TenantContext, errors_dict) tuple
+            (TenantContext, errors) tuple
             - TenantContext if all validations pass
-            - errors_dict contains validation failure reasons
+            - errors is a shared read-only mapping of failure reasons
+              (empty on success); copy it with dict() before mutating
         """
-        errors = {}
-        
         # Step 1: Resolve tenant from instance_id
         tenant_context = await self.resolver.resolve_from_instance(
             instance_id=instance_id,
@@ -281,30 +552,26 @@ class TenantIsolationMiddleware:
         )
         
         if not tenant_context:
-            errors['instance_id'] = 'Invalid or unauthorized instance'
-            return None, errors
+            return None, _ERRORS_INSTANCE
         
         # Step 2: Check tenant status
         if not tenant_context.is_active():
-            errors['status'] = f'Tenant status is {tenant_context.status}'
             logger.security_validation_failed(
                 reason=f'Inactive tenant status: {tenant_context.status}',
                 instance_id=instance_id,
                 tenant_id=tenant_context.tenant_id
             )
-            return None, errors
+            return None, _status_errors(tenant_context.status)
         
         # Step 3: Validate phone ownership (if sender provided)
         if sender_phone:
-            if not self.resolver.validate_phone_ownership(sender_phone, tenant_context):
-                errors['phone_ownership'] = 'Phone does not belong to this instance'
-                return None, errors
+            if not await self.resolver.validate_phone_ownership(sender_phone, tenant_context):
+                return None, _ERRORS_PHONE
         
         # Step 4: Detect cross-tenant attempts
         if payload:
             if self.resolver.detect_cross_tenant_attempt(payload, tenant_context.tenant_id):
-                errors['payload_forbidden_fields'] = 'Payload attempted to override tenant/user context'
-                return None, errors
+                return None, _ERRORS_PAYLOAD
         
-        return tenant_context, {}
+        return tenant_context, _NO_ERRORS
 
@@ -1,13 +1,14 @@
 """Message normalizer - convert W-API events to unified schema."""
 
-from datetime import datetime
-from typing import Dict, Optional
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 from pydantic import ValidationError
 
 from ..core.logger import get_logger
-from ..core.tenant import TenantContext
+from ..core.tenant import TenantContext, normalize_phone
 from ..persistence.models import (
     WAPIWebhookEvent,
+    WAPIMessageContent,
     MessageType,
     MessageContent,
     MessageMetadata,
@@ -19,97 +20,123 @@ from ..persistence.models import (
 logger = get_logger(__name__)
 
 
+def _utc_isoformat(now_ns: int) -> str:
+    """Naive UTC ISO-8601 timestamp, same shape as datetime.utcnow().isoformat()."""
+    seconds, nanos = divmod(now_ns, 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanos // 1000:06d}"
+
+
+# W-API message fields checked in order; the first one present sets the type
+_TYPE_FIELDS: Tuple[Tuple[str, MessageType], ...] = (
+    ('conversation', MessageType.TEXT),
+    ('extendedTextMessage', MessageType.TEXT),
+    ('imageMessage', MessageType.IMAGE),
+    ('videoMessage', MessageType.VIDEO),
+    ('audioMessage', MessageType.AUDIO),
+    ('documentMessage', MessageType.DOCUMENT),
+    ('locationMessage', MessageType.LOCATION),
+    ('contactMessage', MessageType.CONTACT),
+    ('contactsArrayMessage', MessageType.CONTACT),
+)
+
+_PROCESSABLE_EVENTS = frozenset({
+    'messages.upsert',
+    # Add other event types as needed
+})
+
+
 class MessageNormalizer:
     """Normalize W-API messages to unified schema."""
     
     @staticmethod
-    def _extract_message_text(message_data: Dict) -> Optional[str]:
+    def _extract_message_text(message: WAPIMessageContent) -> Optional[str]:
         """Extract text from various message formats."""
         # Direct conversation
-        if 'conversation' in message_data:
-            return message_data['conversation']
+        if message.conversation is not None:
+            return message.conversation
         
         # Extended text message
-        if 'extendedTextMessage' in message_data:
-            ext_msg = message_data['extendedTextMessage']
-            if isinstance(ext_msg, dict):
-                return ext_msg.get('text')
-        
-        # Image caption
-        if 'imageMessage' in message_data:
-            img_msg = message_data['imageMessage']
-            if isinstance(img_msg, dict):
-                return img_msg.get('caption')
-        
-        # Video caption
-        if 'videoMessage' in message_data:
-            vid_msg = message_data['videoMessage']
-            if isinstance(vid_msg, dict):
-                return vid_msg.get('caption')
+        if message.extendedTextMessage is not None:
+            return message.extendedTextMessage.get('text')
         
-        # Document caption
-        if 'documentMessage' in message_data:
-            doc_msg = message_data['documentMessage']
-            if isinstance(doc_msg, dict):
-                return doc_msg.get('caption')
+        # Image, video or document caption
+        for media in (
+            message.imageMessage,
+            message.videoMessage,
+            message.documentMessage
+        ):
+            if media is not None:
+                return media.get('caption')
         
         return None
     
     @staticmethod
-    def _detect_message_type(message_data: Dict) -> MessageType:
+    def _detect_message_type(message: WAPIMessageContent) -> MessageType:
         """Detect message type from W-API format."""
-        if 'conversation' in message_data or 'extendedTextMessage' in message_data:
-            return MessageType.TEXT
-        elif 'imageMessage' in message_data:
-            return MessageType.IMAGE
-        elif 'videoMessage' in message_data:
-            return MessageType.VIDEO
-        elif 'audioMessage' in message_data:
-            return MessageType.AUDIO
-        elif 'documentMessage' in message_data:
-            return MessageType.DOCUMENT
-        elif 'locationMessage' in message_data:
-            return MessageType.LOCATION
-        elif 'contactMessage' in message_data or 'contactsArrayMessage' in message_data:
-            return MessageType.CONTACT
-        else:
-            return MessageType.UNKNOWN
+        for field_name, message_type in _TYPE_FIELDS:
+            if getattr(message, field_name, None) is not None:
+                return message_type
+        return MessageType.UNKNOWN
     
     @staticmethod
-    def _extract_media_info(message_data: Dict, message_type: MessageType) -> Dict:
-        """Extract media information based on message type."""
-        media_info = {}
-        
-        if message_type == MessageType.IMAGE and 'imageMessage' in message_data:
-            img = message_data['imageMessage']
-            if isinstance(img, dict):
-                media_info['mime_type'] = img.get('mimetype')
-                media_info['caption'] = img.get('caption')
-                # URL would be generated/retrieved from W-API
-                media_info['media_url'] = img.get('url')
-        
-        elif message_type == MessageType.VIDEO and 'videoMessage' in message_data:
-            vid = message_data['videoMessage']
-            if isinstance(vid, dict):
-                media_info['mime_type'] = vid.get('mimetype')
-                media_info['caption'] = vid.get('caption')
-                media_info['media_url'] = vid.get('url')
-        
-        elif message_type == MessageType.DOCUMENT and 'documentMessage' in message_data:
-            doc = message_data['documentMessage']
-            if isinstance(doc, dict):
-                media_info['mime_type'] = doc.get('mimetype')
-                media_info['file_name'] = doc.get('fileName')
-                media_info['caption'] = doc.get('caption')
-                media_info['media_url'] = doc.get('url')
-        
-        elif message_type == MessageType.AUDIO and 'audioMessage' in message_data:
-            audio = message_data['audioMessage']
-            if isinstance(audio, dict):
-                media_info['mime_type'] = audio.get('mimetype')
-                media_info['media_url'] = audio.get('url')
-        
-        return media_info
+    def _text_content(message: WAPIMessageContent) -> MessageContent:
+        """Content for conversation / extendedTextMessage messages."""
+        if message.conversation is not None:
+            return MessageContent(text=message.conversation)
+        return MessageContent(text=message.extendedTextMessage.get('text'))
+    
+    @staticmethod
+    def _image_content(message: WAPIMessageContent) -> MessageContent:
+        """Content for imageMessage (caption doubles as text)."""
+        img = message.imageMessage
+        caption = img.get('caption')
+        # URL would be generated/retrieved from W-API
+        return MessageContent(
+            text=caption,
+            media_url=img.get('url'),
+            caption=caption,
+            mime_type=img.get('mimetype')
+        )
+    
+    @staticmethod
+    def _video_content(message: WAPIMessageContent) -> MessageContent:
+        """Content for videoMessage (caption doubles as text)."""
+        vid = message.videoMessage
+        caption = vid.get('caption')
+        return MessageContent(
+            text=caption,
+            media_url=vid.get('url'),
+            caption=caption,
+            mime_type=vid.get('mimetype')
+        )
+    
+    @staticmethod
+    def _document_content(message: WAPIMessageContent) -> MessageContent:
+        """Content for documentMessage (caption doubles as text)."""
+        doc = message.documentMessage
+        caption = doc.get('caption')
+        return MessageContent(
+            text=caption,
+            media_url=doc.get('url'),
+            caption=caption,
+            mime_type=doc.get('mimetype'),
+            file_name=doc.get('fileName')
+        )
+    
+    @staticmethod
+    def _audio_content(message: WAPIMessageContent) -> MessageContent:
+        """Content for audioMessage."""
+        audio = message.audioMessage
+        return MessageContent(
+            text=MessageNormalizer._extract_message_text(message),
+            media_url=audio.get('url'),
+            mime_type=audio.get('mimetype')
+        )
+    
+    @staticmethod
+    def _generic_content(message: WAPIMessageContent) -> MessageContent:
+        """Content for types without media fields (location, contact, unknown)."""
+        return MessageContent(text=MessageNormalizer._extract_message_text(message))
     
     @staticmethod
     def _extract_sender_phone(remote_jid: str, participant: Optional[str] = None) -> str:
@@ -120,11 +147,8 @@ class MessageNormalizer:
         else:
             jid = remote_jid
         
-        # Extract phone number (before @)
-        phone = jid.split('@')[0]
-        
-        # Remove any non-numeric characters
-        return ''.join(filter(str.isdigit, phone))
+        # Phone number is the part before @, digits only
+        return normalize_phone(jid.partition('@')[0])
 
     @staticmethod
     def _resolve_chat_type(event: WAPIWebhookEvent) -> Optional[str]:
@@ -142,7 +166,11 @@ class MessageNormalizer:
     def normalize(
         event: WAPIWebhookEvent,
         tenant_context: TenantContext,
-        validation_status: Dict[str, bool]
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        instance_verified: bool = False,
+        tenant_resolved: bool = False,
+        phone_verified: bool = False
     ) -> Optional[NormalizedMessage]:
         """
         Normalize W-API event to unified message format.
@@ -150,7 +178,11 @@ class MessageNormalizer:
         Args:
             event: Validated W-API webhook event
             tenant_context: Verified tenant context
-            validation_status: Security validation results
+            payload: Parsed webhook body the event was validated from,
+                kept as the raw event without re-serializing the model
+            instance_verified: instance_id was validated against the database
+            tenant_resolved: tenant/user were resolved from the instance
+            phone_verified: sender phone ownership was validated
             
         Returns:
             NormalizedMessage if successful, None otherwise
@@ -161,23 +193,12 @@ class MessageNormalizer:
             message = event.data.message
             
             # Determine message type
-            message_dict = message.dict(exclude_none=True)
-            message_type = MessageNormalizer._detect_message_type(message_dict)
+            message_type = MessageNormalizer._detect_message_type(message)
             
-            # Extract text content
-            text = MessageNormalizer._extract_message_text(message_dict)
-            
-            # Extract media info
-            media_info = MessageNormalizer._extract_media_info(message_dict, message_type)
-            
-            # Create content object
-            content = MessageContent(
-                text=text,
-                media_url=media_info.get('media_url'),
-                caption=media_info.get('caption'),
-                mime_type=media_info.get('mime_type'),
-                file_name=media_info.get('file_name')
-            )
+            # Create content object with the builder for this type
+            content = _CONTENT_BUILDERS.get(
+                message_type, MessageNormalizer._generic_content
+            )(message)
             
             # Extract sender phone
             sender_phone = MessageNormalizer._extract_sender_phone(
@@ -198,23 +219,24 @@ class MessageNormalizer:
             )
             
             # Security info
+            now_ns = time.time_ns()
             security = MessageSecurity(
-                validated_at=datetime.utcnow().isoformat(),
-                validation_passed=all(validation_status.values()),
-                instance_verified=validation_status.get('instance_verified', False),
-                tenant_resolved=validation_status.get('tenant_resolved', False),
-                phone_ownership_verified=validation_status.get('phone_verified', False)
+                validated_at=_utc_isoformat(now_ns),
+                validation_passed=instance_verified and tenant_resolved and phone_verified,
+                instance_verified=instance_verified,
+                tenant_resolved=tenant_resolved,
+                phone_ownership_verified=phone_verified
             )
             
             # Source info
             source = MessageSourceModel(
                 platform='wapi',
                 instance_id=event.instance,
-                raw_event=event.dict()
+                raw_event=payload
             )
             
             # Timestamp
-            timestamp = event.data.messageTimestamp or int(datetime.utcnow().timestamp())
+            timestamp = event.data.messageTimestamp or now_ns // 1_000_000_000
             
             # Create normalized message
             normalized = NormalizedMessage(
@@ -232,7 +254,7 @@ class MessageNormalizer:
             )
             
             logger.info(
-                f"Message normalized successfully: {key.id}",
+                "Message normalized successfully: %s", key.id,
                 message_id=key.id,
                 tenant_id=tenant_context.tenant_id,
                 user_id=tenant_context.user_id,
@@ -259,8 +281,14 @@ class MessageNormalizer:
     @staticmethod
     def should_process_event(event_type: str) -> bool:
         """Determine if event type should be processed."""
-        processable_events = [
-            'messages.upsert',
-            # Add other event types as needed
-        ]
-        return event_type in processable_events
+        return event_type in _PROCESSABLE_EVENTS
+
+
+# Content builder per message type; each reads only the fields its type uses
+_CONTENT_BUILDERS: Dict[MessageType, Callable[[WAPIMessageContent], MessageContent]] = {
+    MessageType.TEXT: MessageNormalizer._text_content,
+    MessageType.IMAGE: MessageNormalizer._image_content,
+    MessageType.VIDEO: MessageNormalizer._video_content,
+    MessageType.DOCUMENT: MessageNormalizer._document_content,
+    MessageType.AUDIO: MessageNormalizer._audio_content,
+}
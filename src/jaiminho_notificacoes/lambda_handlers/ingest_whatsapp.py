@@ -10,28 +10,79 @@ This is a SECURITY-CRITICAL component that:
 7. Rejects and logs invalid/cross-tenant payloads
 """
 
+import asyncio
 import json
 import os
-import traceback
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
 import boto3
+from botocore.config import Config
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from ..core.logger import get_logger
-from ..core.tenant import TenantIsolationMiddleware
+from ..core.tenant import TenantContext, TenantIsolationMiddleware
 from ..ingestion.normalizer import MessageNormalizer
-from ..persistence.models import WAPIWebhookEvent, NormalizedMessage
+from ..persistence.models import MessageType, NormalizedMessage, WAPIWebhookEvent
 
 logger = get_logger(__name__)
 
-# Initialize AWS clients
-sqs_client = boto3.client('sqs')
-dynamodb = boto3.resource('dynamodb')
+# Initialize AWS clients once per container; keep-alive and tight timeouts
+# keep warm invocations on the same connection
+_SQS_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=4,
+    retries={'mode': 'standard', 'total_max_attempts': 3},
+    connect_timeout=1,
+    read_timeout=2
+)
+sqs_client = boto3.client('sqs', config=_SQS_CONFIG)
 
 # Environment variables
 SQS_QUEUE_URL = os.getenv('SQS_QUEUE_URL')
 DYNAMODB_MESSAGES_TABLE = os.getenv('DYNAMODB_MESSAGES_TABLE')
 
+# Embed the original webhook payload in queued messages (debugging only;
+# it can dominate the SQS message size)
+INCLUDE_RAW_EVENT = os.getenv('INCLUDE_RAW_EVENT', 'false').lower() == 'true'
+
+# Security headers on every HTTP response; copied per response because the
+# Lambda runtime serializes the response with json
+_RESPONSE_HEADERS = MappingProxyType({
+    'Content-Type': 'application/json',
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY'
+})
+
+# SendMessageBatch accepts at most 10 entries
+SQS_BATCH_SIZE = 10
+
+
+def _loads(body: Union[str, bytes]) -> Any:
+    """Parse a JSON request body (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _dumps(body: Dict[str, Any]) -> str:
+    """Serialize a JSON response body (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(body).decode()
+    return json.dumps(body)
+
+
+def _format_traceback() -> Optional[str]:
+    """Format the current exception's traceback outside prod (None in prod)."""
+    if os.getenv('ENVIRONMENT') == 'prod':
+        return None
+    import traceback
+    return traceback.format_exc()
+
 
 class WebhookSecurityValidator:
     """Validates webhook authenticity and security for W-API only."""
@@ -54,6 +105,19 @@ class WebhookSecurityValidator:
         Returns:
             (validated_event, error_message) tuple
         """
+        webhook_event, _, error = await self.parse_request(event)
+        return webhook_event, error
+    
+    async def parse_request(
+        self,
+        event: Dict[str, Any]
+    ) -> tuple[Optional[WAPIWebhookEvent], Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Validate incoming W-API webhook request, keeping the parsed body.
+        
+        Returns:
+            (validated_event, payload, error_message) tuple
+        """
         # Extract body
         body = self._extract_body(event)
         if not body:
@@ -62,21 +126,21 @@ class WebhookSecurityValidator:
                 severity='medium',
                 message='Empty or invalid request body'
             )
-            return None, "Empty or invalid request body"
+            return None, None, "Empty or invalid request body"
         
         # Parse JSON
         try:
-            payload = json.loads(body) if isinstance(body, str) else body
-        except json.JSONDecodeError as e:
+            payload = _loads(body) if isinstance(body, (str, bytes)) else body
+        except json.JSONDecodeError as e:  # orjson's error subclasses it
             logger.security_validation_failed(
                 reason='Invalid JSON payload',
                 details={'error': str(e), 'error_type': 'json_decode'}
             )
-            return None, "Invalid JSON format"
+            return None, None, "Invalid JSON format"
         
         # Validate against W-API schema
         try:
-            webhook_event = WAPIWebhookEvent(**payload)
+            webhook_event = WAPIWebhookEvent.model_validate(payload)
         except ValidationError as e:
             logger.security_validation_failed(
                 reason='W-API schema validation failed',
@@ -86,20 +150,20 @@ class WebhookSecurityValidator:
                     'validation_error': 'payload does not conform to W-API schema'
                 }
             )
-            return None, "Invalid W-API payload format"
+            return None, None, "Invalid W-API payload format"
         
-        return webhook_event, None
+        return webhook_event, payload, None
     
     @staticmethod
-    def _extract_body(event: Dict[str, Any]) -> Optional[str]:
+    def _extract_body(event: Dict[str, Any]) -> Optional[Union[str, Dict[str, Any]]]:
         """Extract body from Lambda event."""
         # API Gateway HTTP API format
         if 'body' in event:
             return event['body']
         
-        # Direct invocation
+        # Direct invocation: the event is already the parsed payload
         if isinstance(event, dict) and 'instance' in event:
-            return json.dumps(event)
+            return event
         
         return None
 
@@ -145,138 +209,154 @@ class MessageIngestionHandler:
             HTTP response dict
         """
         request_id = context.request_id if context else 'unknown'
-        logger.set_context(request_id=request_id)
-        
-        try:
-            # Step 1: Validate webhook structure
-            logger.info("Processing webhook request")
-            webhook_event, error = await self.validator.validate_request(event)
-            
-            if error or not webhook_event:
-                return self._error_response(
-                    status_code=400,
-                    message=error or "Invalid webhook format"
+        with logger.context(request_id=request_id):
+            try:
+                # Steps 1-6: Validate, resolve tenant and normalize
+                normalized_message, tenant_context, response = (
+                    await self._validate_and_normalize(event)
                 )
+                if response is not None:
+                    return response
+                wapi_instance_id = normalized_message.source.instance_id
             
-            # Check if event type should be processed
-            if not self.normalizer.should_process_event(webhook_event.event):
-                logger.info(
-                    f"Ignoring event type: {webhook_event.event}",
-                    event_type=webhook_event.event
-                )
-                return self._success_response(message="Event ignored")
+                # Step 7: Forward to processing queue
+                success = await self._forward_to_queue(normalized_message)
             
-            # Extract W-API instance identifier and API key
-            wapi_instance_id = webhook_event.instance
-            api_key = webhook_event.apikey
-            sender_remote_jid = webhook_event.data.key.remoteJid
+                if not success:
+                    logger.error("Failed to forward message to queue")
+                    return self._error_response(
+                        status_code=500,
+                        message="Failed to queue message"
+                    )
             
-            logger.info(
-                f"Processing W-API event: {webhook_event.event}",
-                instance_id=wapi_instance_id,
-                event_type=webhook_event.event,
-                sender=sender_remote_jid
-            )
+                # Log successful processing with W-API source metadata
+                logger.message_processed(
+                    message_id=normalized_message.message_id,
+                    tenant_id=tenant_context.tenant_id,
+                    user_id=tenant_context.user_id,
+                    message_type=MessageType(normalized_message.message_type).value,
+                    source='wapi',
+                    wapi_instance_id=wapi_instance_id
+                )
             
-            # Step 2-5: Complete W-API security validation pipeline
-            # Validates: instance_id authenticity, API key, status, phone ownership, cross-tenant attempts
-            tenant_context, validation_errors = await self.middleware.validate_and_resolve(
-                instance_id=wapi_instance_id,
-                api_key=api_key,
-                sender_phone=sender_remote_jid,
-                payload=webhook_event.dict()
-            )
+                return self._success_response(
+                    message="Message processed successfully",
+                    data={'message_id': normalized_message.message_id}
+                )
             
-            if validation_errors or not tenant_context:
-                # Audit log all rejections with detailed context
-                logger.security_validation_failed(
-                    reason='W-API instance validation failed - webhook rejected',
-                    instance_id=wapi_instance_id,
+            except Exception as e:
+                logger.critical(
+                    f"Unexpected error in webhook handler: {str(e)}",
                     details={
-                        'errors': validation_errors,
-                        'sender_phone': sender_remote_jid,
-                        'validation_failures': list(validation_errors.keys()) if validation_errors else []
+                        'error_type': type(e).__name__,
+                        'traceback': _format_traceback()
                     }
                 )
-                return self._error_response(
-                    status_code=403,
-                    message="Unauthorized: Invalid or inactive W-API instance"
-                )
-            
-            # Set tenant context for all subsequent logs
-            # user_id has been verified and resolved internally - not from payload
-            logger.set_context(
-                tenant_id=tenant_context.tenant_id,
-                user_id=tenant_context.user_id,
-                instance_id=wapi_instance_id
-            )
-            
-            logger.info(
-                f"W-API instance validated successfully - user_id resolved internally",
-                user_id=tenant_context.user_id,
-                tenant_id=tenant_context.tenant_id
-            )
-            
-            # Step 6: Normalize message
-            # All security validations passed; instance and phone verified
-            validation_status = {
-                'instance_verified': True,       # Verified via resolve_from_instance
-                'tenant_resolved': True,         # Resolved from instance mapping
-                'phone_verified': True           # Verified via validate_phone_ownership
-            }
-            
-            normalized_message = self.normalizer.normalize(
-                event=webhook_event,
-                tenant_context=tenant_context,
-                validation_status=validation_status
-            )
-            
-            if not normalized_message:
-                logger.error("Message normalization failed")
-                return self._error_response(
-                    status_code=500,
-                    message="Failed to normalize message"
-                )
-            
-            # Step 7: Forward to processing queue
-            success = await self._forward_to_queue(normalized_message)
-            
-            if not success:
-                logger.error("Failed to forward message to queue")
                 return self._error_response(
                     status_code=500,
-                    message="Failed to queue message"
+                    message="Internal server error"
                 )
-            
-            # Log successful processing with W-API source metadata
-            logger.message_processed(
-                message_id=normalized_message.message_id,
-                tenant_id=tenant_context.tenant_id,
-                user_id=tenant_context.user_id,
-                message_type=normalized_message.message_type.value,
-                source='wapi',
-                wapi_instance_id=wapi_instance_id
+    
+    async def _validate_and_normalize(
+        self,
+        event: Dict[str, Any]
+    ) -> Tuple[Optional[NormalizedMessage], Optional[TenantContext], Optional[Dict[str, Any]]]:
+        """
+        Run the security pipeline (steps 1-6) for one webhook.
+        
+        Returns:
+            (normalized_message, tenant_context, None) when the message
+            should be queued, or (None, None, response) when the webhook
+            is rejected or ignored
+        """
+        # Step 1: Validate webhook structure
+        logger.info("Processing webhook request")
+        webhook_event, payload, error = await self.validator.parse_request(event)
+        
+        if error or not webhook_event:
+            return None, None, self._error_response(
+                status_code=400,
+                message=error or "Invalid webhook format"
             )
-            
-            return self._success_response(
-                message="Message processed successfully",
-                data={'message_id': normalized_message.message_id}
+        
+        # Check if event type should be processed
+        if not self.normalizer.should_process_event(webhook_event.event):
+            logger.info(
+                "Ignoring event type: %s", webhook_event.event,
+                event_type=webhook_event.event
             )
-            
-        except Exception as e:
-            logger.critical(
-                f"Unexpected error in webhook handler: {str(e)}",
+            return None, None, self._success_response(message="Event ignored")
+        
+        # Extract W-API instance identifier and API key
+        wapi_instance_id = webhook_event.instance
+        api_key = webhook_event.apikey
+        sender_remote_jid = webhook_event.data.key.remoteJid
+        
+        logger.info(
+            "Processing W-API event: %s", webhook_event.event,
+            instance_id=wapi_instance_id,
+            event_type=webhook_event.event,
+            sender=sender_remote_jid
+        )
+        
+        # Step 2-5: Complete W-API security validation pipeline
+        # Validates: instance_id authenticity, API key, status, phone ownership, cross-tenant attempts
+        tenant_context, validation_errors = await self.middleware.validate_and_resolve(
+            instance_id=wapi_instance_id,
+            api_key=api_key,
+            sender_phone=sender_remote_jid,
+            payload=payload
+        )
+        
+        if validation_errors or not tenant_context:
+            # Audit log all rejections with detailed context
+            logger.security_validation_failed(
+                reason='W-API instance validation failed - webhook rejected',
+                instance_id=wapi_instance_id,
                 details={
-                    'error_type': type(e).__name__,
-                    'traceback': traceback.format_exc()
+                    'errors': dict(validation_errors),
+                    'sender_phone': sender_remote_jid,
+                    'validation_failures': list(validation_errors.keys()) if validation_errors else []
                 }
             )
-            return self._error_response(
+            return None, None, self._error_response(
+                status_code=403,
+                message="Unauthorized: Invalid or inactive W-API instance"
+            )
+        
+        # Set tenant context for all subsequent logs
+        # user_id has been verified and resolved internally - not from payload
+        logger.set_context(
+            tenant_id=tenant_context.tenant_id,
+            user_id=tenant_context.user_id,
+            instance_id=wapi_instance_id
+        )
+        
+        logger.info(
+            "W-API instance validated successfully - user_id resolved internally",
+            user_id=tenant_context.user_id,
+            tenant_id=tenant_context.tenant_id
+        )
+        
+        # Step 6: Normalize message
+        # All security validations passed; instance and phone verified
+        normalized_message = self.normalizer.normalize(
+            event=webhook_event,
+            tenant_context=tenant_context,
+            payload=payload if INCLUDE_RAW_EVENT else None,
+            instance_verified=True,     # Verified via resolve_from_instance
+            tenant_resolved=True,       # Resolved from instance mapping
+            phone_verified=True         # Verified via validate_phone_ownership
+        )
+        
+        if not normalized_message:
+            logger.error("Message normalization failed")
+            return None, None, self._error_response(
                 status_code=500,
-                message="Internal server error"
+                message="Failed to normalize message"
             )
-        finally:
-            logger.clear_context()
+        
+        return normalized_message, tenant_context, None
     
     async def _forward_to_queue(self, message: NormalizedMessage) -> bool:
         """Forward normalized message to SQS for processing."""
@@ -286,30 +366,17 @@ class MessageIngestionHandler:
         
         try:
             # Serialize message
-            message_body = message.json()
+            message_body = message.model_dump_json(exclude_none=True)
             
             # Send to SQS
             response = sqs_client.send_message(
                 QueueUrl=SQS_QUEUE_URL,
                 MessageBody=message_body,
-                MessageAttributes={
-                    'tenant_id': {
-                        'StringValue': message.tenant_id,
-                        'DataType': 'String'
-                    },
-                    'user_id': {
-                        'StringValue': message.user_id,
-                        'DataType': 'String'
-                    },
-                    'message_type': {
-                        'StringValue': message.message_type.value,
-                        'DataType': 'String'
-                    }
-                }
+                MessageAttributes=self._message_attributes(message)
             )
             
             logger.info(
-                f"Message forwarded to SQS: {response['MessageId']}",
+                "Message forwarded to SQS: %s", response['MessageId'],
                 message_id=message.message_id,
                 sqs_message_id=response['MessageId']
             )
@@ -324,6 +391,137 @@ class MessageIngestionHandler:
             )
             return False
     
+    async def _forward_batch_to_queue(
+        self,
+        messages: List[NormalizedMessage]
+    ) -> List[bool]:
+        """
+        Forward normalized messages to SQS, up to 10 per request.
+        
+        Returns:
+            Per-message success flags, in input order
+        """
+        if not SQS_QUEUE_URL:
+            logger.error("SQS_QUEUE_URL not configured")
+            return [False] * len(messages)
+        
+        results = [True] * len(messages)
+        for start in range(0, len(messages), SQS_BATCH_SIZE):
+            chunk = messages[start:start + SQS_BATCH_SIZE]
+            entries = [
+                {
+                    'Id': str(start + offset),
+                    'MessageBody': message.model_dump_json(exclude_none=True),
+                    'MessageAttributes': self._message_attributes(message)
+                }
+                for offset, message in enumerate(chunk)
+            ]
+            try:
+                response = sqs_client.send_message_batch(
+                    QueueUrl=SQS_QUEUE_URL,
+                    Entries=entries
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to send message batch to SQS: {str(e)}",
+                    details={'error_type': type(e).__name__, 'count': len(chunk)}
+                )
+                results[start:start + len(chunk)] = [False] * len(chunk)
+                continue
+            
+            for failure in response.get('Failed', []):
+                index = int(failure['Id'])
+                results[index] = False
+                logger.error(
+                    f"Failed to send message to SQS: {failure.get('Message')}",
+                    message_id=messages[index].message_id,
+                    details={'error_code': failure.get('Code')}
+                )
+        
+        return results
+    
+    async def process_webhook_batch(
+        self,
+        records: List[Dict[str, Any]],
+        context: Any
+    ) -> Dict[str, Any]:
+        """
+        Process several webhooks and queue the accepted ones in batches.
+        
+        Each record goes through the same security pipeline as
+        process_webhook (records carry the webhook in 'body', as SQS
+        records and API Gateway events do).
+        
+        Args:
+            records: Webhook events to process
+            context: Lambda context
+            
+        Returns:
+            SQS partial batch response listing records to retry
+        """
+        request_id = context.request_id if context else 'unknown'
+        accepted: List[Tuple[int, NormalizedMessage]] = []
+        retry: List[int] = []
+        
+        for index, record in enumerate(records):
+            with logger.context(request_id=request_id):
+                try:
+                    normalized_message, _, response = (
+                        await self._validate_and_normalize(record)
+                    )
+                    if response is None:
+                        accepted.append((index, normalized_message))
+                    elif response['statusCode'] >= 500:
+                        retry.append(index)
+                except Exception as e:
+                    logger.critical(
+                        f"Unexpected error in webhook batch handler: {str(e)}",
+                        details={
+                            'error_type': type(e).__name__,
+                            'traceback': _format_traceback()
+                        }
+                    )
+                    retry.append(index)
+        
+        sent = await self._forward_batch_to_queue(
+            [message for _, message in accepted]
+        )
+        retry.extend(
+            index for (index, _), ok in zip(accepted, sent) if not ok
+        )
+        
+        queued = sum(sent)
+        logger.info(
+            "Webhook batch processed: %d/%d queued", queued, len(records),
+            details={'received': len(records), 'queued': queued, 'retry': len(retry)}
+        )
+        
+        return {
+            'batchItemFailures': [
+                {'itemIdentifier': records[index].get('messageId', str(index))}
+                for index in sorted(retry)
+            ]
+        }
+    
+    @staticmethod
+    def _message_attributes(message: NormalizedMessage) -> Dict[str, Any]:
+        """SQS message attributes used for routing and filtering."""
+        return {
+            'tenant_id': {
+                'StringValue': message.tenant_id,
+                'DataType': 'String'
+            },
+            'user_id': {
+                'StringValue': message.user_id,
+                'DataType': 'String'
+            },
+            'message_type': {
+                # use_enum_values stores the plain string on the model
+                'StringValue': MessageType(message.message_type).value,
+                'DataType': 'String'
+            }
+        }
+    
     @staticmethod
     def _success_response(
         message: str,
@@ -340,12 +538,8 @@ class MessageIngestionHandler:
         
         return {
             'statusCode': status_code,
-            'headers': {
-                'Content-Type': 'application/json',
-                'X-Content-Type-Options': 'nosniff',
-                'X-Frame-Options': 'DENY'
-            },
-            'body': json.dumps(body)
+            'headers': dict(_RESPONSE_HEADERS),
+            'body': _dumps(body)
         }
     
     @staticmethod
@@ -364,18 +558,28 @@ class MessageIngestionHandler:
         
         return {
             'statusCode': status_code,
-            'headers': {
-                'Content-Type': 'application/json',
-                'X-Content-Type-Options': 'nosniff',
-                'X-Frame-Options': 'DENY'
-            },
-            'body': json.dumps(body)
+            'headers': dict(_RESPONSE_HEADERS),
+            'body': _dumps(body)
         }
 
 
 # Lambda handler entry point
 handler_instance = None
 
+# Event loop reused across warm invocations (along with its default
+# executor, which runs the blocking tenant lookups)
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the container's event loop, creating it on first use."""
+    global _event_loop
+    
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -396,14 +600,35 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     if handler_instance is None:
         handler_instance = MessageIngestionHandler()
     
-    # Use asyncio for async operations
-    import asyncio
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(
+    return _get_event_loop().run_until_complete(
         handler_instance.process_webhook(event, context)
     )
 
 
+def batch_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    AWS Lambda entry point for batched webhooks (e.g. an SQS buffer queue).
+    
+    Accepted messages are forwarded with SendMessageBatch; records that
+    failed transiently are reported back for retry.
+    
+    Args:
+        event: Lambda event with a 'Records' list
+        context: Lambda context
+        
+    Returns:
+        SQS partial batch response
+    """
+    global handler_instance
+    
+    if handler_instance is None:
+        handler_instance = MessageIngestionHandler()
+    
+    return _get_event_loop().run_until_complete(
+        handler_instance.process_webhook_batch(event.get('Records', []), context)
+    )
+
+
 # Health check handler
 def health_check(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Health check endpoint."""
@@ -417,3 +642,31 @@ def health_check(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         })
     }
 
+
+def _prewarm() -> None:
+    """
+    Move first-touch costs into the Lambda init phase.
+    
+    Builds the handler (and with it the DynamoDB repository) and opens the
+    SQS connection so the first webhook doesn't pay the TLS handshake.
+    Only runs inside Lambda; failures are left to the first invocation.
+    """
+    global handler_instance
+    
+    try:
+        if handler_instance is None:
+            handler_instance = MessageIngestionHandler()
+        if SQS_QUEUE_URL:
+            sqs_client.get_queue_attributes(
+                QueueUrl=SQS_QUEUE_URL,
+                AttributeNames=['QueueArn']
+            )
+    except Exception as e:
+        logger.warning(
+            "Ingestion pre-warm failed: %s", e,
+            details={'error_type': type(e).__name__}
+        )
+
+
+if os.getenv('AWS_EXECUTION_ENV'):
+    _prewarm()
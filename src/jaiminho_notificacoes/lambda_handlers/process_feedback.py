@@ -122,7 +122,7 @@ async def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             logger.error(
                 "Tenant context resolution failed",
                 instance_id=request.wapi_instance_id,
-                validation_errors=validation_errors
+                validation_errors=dict(validation_errors)
             )
             return {
                 "statusCode": 403,
@@ -34,10 +34,16 @@ Returns:
 - 500: Internal server error
 """
 
+import base64
 import json
 import asyncio
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from jaiminho_notificacoes.core.logger import TenantContextLogger
 from jaiminho_notificacoes.processing.feedback_handler import get_feedback_handler
 
@@ -45,6 +51,20 @@ from jaiminho_notificacoes.processing.feedback_handler import get_feedback_handl
 logger = TenantContextLogger(__name__)
 
 
+def _parse_body(body: Any, is_base64: bool = False) -> Any:
+    """
+    Parse an API Gateway body (str or bytes) without re-encoding it.
+
+    orjson accepts bytes directly, so base64-decoded payloads go straight
+    to the parser. Both parsers raise json.JSONDecodeError subclasses.
+    """
+    if is_base64:
+        body = base64.b64decode(body)
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Process SendPulse feedback webhook.
@@ -64,8 +84,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
 
         # Parse body if needed (API Gateway wraps in body)
-        if isinstance(event.get('body'), str):
-            body = json.loads(event['body'])
+        if isinstance(event.get('body'), (str, bytes, bytearray)):
+            body = _parse_body(
+                event['body'],
+                is_base64=bool(event.get('isBase64Encoded'))
+            )
         else:
             body = event
 
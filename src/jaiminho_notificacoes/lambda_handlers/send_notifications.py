@@ -119,16 +119,19 @@ async def send_notification_async(event: Dict[str, Any]) -> Dict[str, Any]:
 
         # Send via SendPulse
         manager = SendPulseManager()
-        result = await manager.send_notification(
-            tenant_id=tenant_id,
-            user_id=user_id,
-            content_text=content_text,
-            message_type=notification_type,
-            buttons=buttons,
-            media_url=media_url,
-            metadata=metadata,
-            wapi_instance_id=wapi_instance_id
-        )
+        try:
+            result = await manager.send_notification(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                content_text=content_text,
+                message_type=notification_type,
+                buttons=buttons,
+                media_url=media_url,
+                metadata=metadata,
+                wapi_instance_id=wapi_instance_id
+            )
+        finally:
+            await manager.aclose()
 
         response_body = {
             'success': result.success,
@@ -212,16 +215,19 @@ async def send_batch_notifications_async(event: Dict[str, Any]) -> Dict[str, Any
 
         # Send batch
         manager = SendPulseManager()
-        results = await manager.send_batch(
-            tenant_id=tenant_id,
-            user_ids=user_ids,
-            content_text=content_text,
-            message_type=notification_type
-        )
-
-        # Summarize results
-        successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
+        try:
+            results = await manager.send_batch(
+                tenant_id=tenant_id,
+                user_ids=user_ids,
+                content_text=content_text,
+                message_type=notification_type
+            )
+        finally:
+            await manager.aclose()
+
+        # Summarize results from the batch's success column
+        successful = results.successful
+        failed = results.failed
 
         response_body = {
             'success': failed == 0,
@@ -10,6 +10,7 @@ from jaiminho_notificacoes.outbound.sendpulse import (
     SendPulseContent,
     SendPulseMessage,
     SendPulseResponse,
+    SendPulseBatchResult,
     # Enums
     NotificationType,
     SendPulseTemplate,
@@ -32,6 +33,7 @@ __all__ = [
     'SendPulseContent',
     'SendPulseMessage',
     'SendPulseResponse',
+    'SendPulseBatchResult',
     # Enums
     'NotificationType',
     'SendPulseTemplate',
@@ -29,15 +29,22 @@ https://sendpulse.com/api/whatsapp
 import json
 import os
 import re
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
 import asyncio
 import aiohttp
 import boto3
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from jaiminho_notificacoes.core.logger import TenantContextLogger
 
 
@@ -87,6 +94,36 @@ def get_cloudwatch():
     return _cloudwatch
 
 
+# Defaults for a manager-owned HTTP session (pool matches send_batch concurrency)
+HTTP_POOL_SIZE = 32
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_DNS_CACHE_TTL = 300
+
+# Auth caching: credentials are re-read from Secrets Manager after this TTL;
+# tokens are refreshed this many seconds before they expire
+CREDENTIALS_TTL_SECONDS = 300
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+
+@asynccontextmanager
+async def _http_session(
+    session: Optional[aiohttp.ClientSession]
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the shared session if open, else a short-lived one."""
+    if session is not None and not session.closed:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as own_session:
+            yield own_session
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
 class NotificationType(str, Enum):
     """Types of notifications SendPulse can send."""
     URGENT = "urgent"  # Immediate notification
@@ -104,9 +141,9 @@ class SendPulseTemplate(str, Enum):
     CONFIRM = "confirm"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SendPulseButton:
-    """Interactive button in SendPulse message."""
+    """Interactive button in SendPulse message (immutable, safe to share)."""
     id: str  # Unique button ID
     title: str  # Button label (max 20 chars)
     action: str  # Button action type
@@ -118,7 +155,7 @@ class SendPulseContent:
     text: str = ""  # Message text (required)
     media_url: Optional[str] = None  # Optional media
     caption: Optional[str] = None  # Media caption
-    buttons: List[SendPulseButton] = field(default_factory=list)
+    buttons: Sequence[SendPulseButton] = field(default_factory=list)
 
     def validate(self) -> tuple[bool, str]:
         """Validate content."""
@@ -207,43 +244,113 @@ class SendPulseResponse:
         return asdict(self)
 
 
+@dataclass
+class SendPulseBatchResult:
+    """
+    Responses from a batch send, plus column views for aggregation.
+
+    ``success`` and ``errors`` are parallel to ``responses`` so counts and
+    failure lookups scan plain lists instead of dereferencing each response.
+    Iterating, indexing and ``len()`` behave like the list of responses.
+    """
+    responses: List[SendPulseResponse] = field(default_factory=list)
+    success: List[bool] = field(init=False)
+    errors: List[Optional[str]] = field(init=False)
+
+    def __post_init__(self):
+        self.success = [r.success for r in self.responses]
+        self.errors = [r.error for r in self.responses]
+
+    @property
+    def successful(self) -> int:
+        """Number of successful sends."""
+        return sum(self.success)
+
+    @property
+    def failed(self) -> int:
+        """Number of failed sends."""
+        return len(self.success) - self.successful
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def __iter__(self) -> Iterator[SendPulseResponse]:
+        return iter(self.responses)
+
+    def __getitem__(self, index):
+        return self.responses[index]
+
+
 class SendPulseAuthenticator:
     """Handles SendPulse API authentication."""
 
-    def __init__(self):
-        """Initialize authenticator."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize authenticator.
+
+        Args:
+            session: Shared HTTP session (optional; one is opened per call otherwise)
+        """
+        self.session = session
         self.credentials = None
+        self.credentials_expires_at = None
         self.token = None
         self.token_expires_at = None
+        # Serialize refreshes so concurrent sends share one fetch
+        self._credentials_lock = asyncio.Lock()
+        self._token_lock = asyncio.Lock()
+
+    def _credentials_valid(self) -> bool:
+        return bool(self.credentials) and (
+            self.credentials_expires_at is None
+            or time.time() < self.credentials_expires_at
+        )
+
+    def _token_valid(self) -> bool:
+        return bool(self.token and self.token_expires_at) and (
+            time.time() < self.token_expires_at
+        )
 
     async def get_credentials(self) -> Dict[str, str]:
-        """Get SendPulse credentials from Secrets Manager."""
-        if self.credentials:
+        """Get SendPulse credentials from Secrets Manager (cached with TTL)."""
+        if self._credentials_valid():
             return self.credentials
 
-        try:
-            if not SENDPULSE_SECRET_ARN:
-                raise ValueError("SENDPULSE_SECRET_ARN not configured")
+        async with self._credentials_lock:
+            # Another task may have refreshed while we waited
+            if self._credentials_valid():
+                return self.credentials
 
-            response = get_secrets_manager().get_secret_value(SecretId=SENDPULSE_SECRET_ARN)
-            self.credentials = json.loads(response['SecretString'])
-            return self.credentials
+            try:
+                if not SENDPULSE_SECRET_ARN:
+                    raise ValueError("SENDPULSE_SECRET_ARN not configured")
 
-        except Exception as e:
-            logger.error(f"Failed to retrieve SendPulse credentials: {e}")
-            raise
+                response = get_secrets_manager().get_secret_value(SecretId=SENDPULSE_SECRET_ARN)
+                self.credentials = json.loads(response['SecretString'])
+                self.credentials_expires_at = time.time() + CREDENTIALS_TTL_SECONDS
+                return self.credentials
+
+            except Exception as e:
+                logger.error(f"Failed to retrieve SendPulse credentials: {e}")
+                raise
 
     async def get_token(self) -> str:
         """Get or refresh OAuth token from SendPulse."""
         # Check if token is still valid
-        if self.token and self.token_expires_at:
-            if datetime.utcnow().timestamp() < self.token_expires_at:
+        if self._token_valid():
+            return self.token
+
+        async with self._token_lock:
+            if self._token_valid():
                 return self.token
+            return await self._refresh_token()
 
+    async def _refresh_token(self) -> str:
+        """Fetch a new OAuth token from SendPulse."""
         credentials = await self.get_credentials()
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with _http_session(self.session) as session:
                 # Authenticate
                 auth_url = f"{credentials.get('api_url', 'https://api.sendpulse.com')}/oauth/access_token"
                 auth_data = {
@@ -259,7 +366,11 @@ class SendPulseAuthenticator:
 
                     data = await response.json()
                     self.token = data['access_token']
-                    self.token_expires_at = datetime.utcnow().timestamp() + data.get('expires_in', 3600)
+                    self.token_expires_at = (
+                        time.time()
+                        + data.get('expires_in', 3600)
+                        - TOKEN_REFRESH_MARGIN_SECONDS
+                    )
                     return self.token
 
         except Exception as e:
@@ -353,9 +464,20 @@ class SendPulseUserResolver:
 class SendPulseClient(ABC):
     """Abstract base client for SendPulse API."""
 
-    def __init__(self):
-        """Initialize client."""
-        self.authenticator = SendPulseAuthenticator()
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        authenticator: Optional[SendPulseAuthenticator] = None
+    ):
+        """
+        Initialize client.
+
+        Args:
+            session: Shared HTTP session (optional; one is opened per call otherwise)
+            authenticator: Shared authenticator holding cached credentials/token
+        """
+        self.session = session
+        self.authenticator = authenticator or SendPulseAuthenticator(session=session)
         self.resolver = SendPulseUserResolver()
 
     async def _make_request(
@@ -377,11 +499,11 @@ class SendPulseClient(ABC):
                 'Content-Type': 'application/json'
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with _http_session(self.session) as session:
                 async with session.request(
                     method,
                     url,
-                    json=data,
+                    data=_dumps(data) if data is not None else None,
                     headers=headers,
                     timeout=aiohttp.ClientTimeout(total=timeout)
                 ) as response:
@@ -720,24 +842,30 @@ class SendPulseNotificationFactory:
     """Factory for creating appropriate SendPulse sender."""
 
     @staticmethod
-    def get_sender(message_type: NotificationType) -> SendPulseClient:
+    def get_sender(
+        message_type: NotificationType,
+        session: Optional[aiohttp.ClientSession] = None,
+        authenticator: Optional[SendPulseAuthenticator] = None
+    ) -> SendPulseClient:
         """
         Get appropriate sender based on message type.
 
         Args:
             message_type: Type of notification to send
+            session: Shared HTTP session for connection reuse (optional)
+            authenticator: Shared authenticator for credential/token reuse (optional)
 
         Returns:
             SendPulseClient instance
         """
         if message_type == NotificationType.URGENT:
-            return SendPulseUrgentNotifier()
+            return SendPulseUrgentNotifier(session=session, authenticator=authenticator)
         elif message_type == NotificationType.DIGEST:
-            return SendPulseDigestSender()
+            return SendPulseDigestSender(session=session, authenticator=authenticator)
         elif message_type == NotificationType.FEEDBACK:
-            return SendPulseFeedbackSender()
+            return SendPulseFeedbackSender(session=session, authenticator=authenticator)
         else:
-            return SendPulseUrgentNotifier()  # Default
+            return SendPulseUrgentNotifier(session=session, authenticator=authenticator)  # Default
 
 
 class SendPulseManager:
@@ -747,9 +875,37 @@ class SendPulseManager:
     Coordinates notification sending with user resolution.
     """
 
-    def __init__(self):
-        """Initialize manager."""
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE):
+        """
+        Initialize manager.
+
+        Args:
+            pool_size: Max pooled connections (total and per host)
+        """
         self.resolver = SendPulseUserResolver()
+        self.pool_size = pool_size
+        self._session: Optional[aiohttp.ClientSession] = None
+        # One authenticator for all sends, so credentials/token are cached
+        self.authenticator = SendPulseAuthenticator()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the pooled HTTP session shared by all sends."""
+        if self._session is None or self._session.closed:
+            self._session = self.authenticator.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size,
+                    limit_per_host=self.pool_size,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL
+                )
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def send_notification(
         self,
@@ -757,7 +913,7 @@ class SendPulseManager:
         user_id: str,
         content_text: str,
         message_type: NotificationType = NotificationType.URGENT,
-        buttons: Optional[List[SendPulseButton]] = None,
+        buttons: Optional[Sequence[SendPulseButton]] = None,
         media_url: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         wapi_instance_id: Optional[str] = None
@@ -834,7 +990,11 @@ class SendPulseManager:
             )
 
             # Get appropriate sender
-            sender = SendPulseNotificationFactory.get_sender(message_type)
+            sender = SendPulseNotificationFactory.get_sender(
+                message_type,
+                session=self._get_session(),
+                authenticator=self.authenticator
+            )
 
             # Send
             result = await sender.send(message)
@@ -853,19 +1013,24 @@ class SendPulseManager:
         tenant_id: str,
         user_ids: List[str],
         content_text: str,
-        message_type: NotificationType = NotificationType.DIGEST
-    ) -> List[SendPulseResponse]:
+        message_type: NotificationType = NotificationType.DIGEST,
+        max_concurrency: int = 32
+    ) -> SendPulseBatchResult:
         """
         Send notification to multiple users.
 
+        Keeps up to ``max_concurrency`` sends in flight; each completed send
+        frees a slot for the next user instead of waiting on a whole chunk.
+
         Args:
             tenant_id: Tenant ID
             user_ids: List of user IDs
             content_text: Message text
             message_type: Type of notification
+            max_concurrency: Max concurrent sends
 
         Returns:
-            List of SendPulseResponse
+            SendPulseBatchResult with responses in user_ids order
         """
         try:
             logger.info(
@@ -874,18 +1039,21 @@ class SendPulseManager:
                 user_count=len(user_ids)
             )
 
-            results = []
-            for user_id in user_ids:
-                result = await self.send_notification(
-                    tenant_id=tenant_id,
-                    user_id=user_id,
-                    content_text=content_text,
-                    message_type=message_type
-                )
-                results.append(result)
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _send_one(user_id: str) -> SendPulseResponse:
+                async with semaphore:
+                    return await self.send_notification(
+                        tenant_id=tenant_id,
+                        user_id=user_id,
+                        content_text=content_text,
+                        message_type=message_type
+                    )
 
-            return results
+            return SendPulseBatchResult(
+                list(await asyncio.gather(*(_send_one(u) for u in user_ids)))
+            )
 
         except Exception as e:
             logger.error(f"Batch notification failed: {e}")
-            return []
+            return SendPulseBatchResult()
@@ -1,18 +1,70 @@
 """DynamoDB repositories with strict tenant isolation."""
 
 import os
+import threading
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import boto3
 from boto3.dynamodb.conditions import Attr, Key
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from ..core.logger import get_logger
+from ..core.phone import normalize_phone
 from .models import WAPIInstance
 
 logger = get_logger(__name__)
 
+# Larger pool than botocore's default 10 so concurrent lookups (worker
+# threads during webhook bursts) don't queue for a connection
+_BOTO_CONFIG = Config(
+	max_pool_connections=50,
+	retries={"max_attempts": 2, "mode": "adaptive"},
+)
+
+# Lazy-loaded DynamoDB resource, low-level client and tables, shared by all
+# repositories
+_dynamodb = None
+_dynamodb_client = None
+_tables: Dict[str, Any] = {}
+_dynamodb_lock = threading.Lock()
+
+
+def get_dynamodb():
+	"""Get or create the shared DynamoDB resource."""
+	global _dynamodb
+	if _dynamodb is None:
+		with _dynamodb_lock:
+			if _dynamodb is None:
+				_dynamodb = boto3.resource("dynamodb", config=_BOTO_CONFIG)
+	return _dynamodb
+
+
+def get_dynamodb_client():
+	"""Get or create the shared low-level DynamoDB client.
+
+	Unlike resource.meta.client, this client does no type (de)serialization.
+	"""
+	global _dynamodb_client
+	if _dynamodb_client is None:
+		with _dynamodb_lock:
+			if _dynamodb_client is None:
+				_dynamodb_client = boto3.client("dynamodb", config=_BOTO_CONFIG)
+	return _dynamodb_client
+
+
+def get_table(table_name: str):
+	"""Get or create the shared Table resource for table_name."""
+	table = _tables.get(table_name)
+	if table is None:
+		table = _tables.setdefault(table_name, get_dynamodb().Table(table_name))
+	return table
+
+
+# Attributes needed to resolve a tenant from an instance id
+_OWNERSHIP_PROJECTION = "tenant_id, user_id, wapi_instance_id, phone_number, #status, api_key_hash"
+
 
 def _iso(dt: datetime) -> str:
 	"""Return an ISO 8601 string with UTC assumption."""
@@ -29,15 +81,16 @@ class WAPIInstanceRepository:
 
 		self.instance_lookup_index = os.getenv("DYNAMODB_WAPI_INSTANCE_GSI", "InstanceLookupIndex")
 		self.phone_lookup_index = os.getenv("DYNAMODB_WAPI_PHONE_GSI", "PhoneLookupIndex")
-		self.dynamodb = boto3.resource("dynamodb")
-		self.table = self.dynamodb.Table(self.table_name)
+		self.dynamodb = get_dynamodb()
+		self.table = get_table(self.table_name)
+		# Low-level client for projected lookups that skip the resource
+		# layer's type deserialization
+		self.client = get_dynamodb_client()
 
 	@staticmethod
 	def _normalize_phone(phone_number: str) -> str:
 		"""Normalize phone numbers to digits-only fingerprint for lookups."""
-		if not phone_number:
-			return ""
-		return "".join(ch for ch in phone_number if ch.isdigit())
+		return normalize_phone(phone_number)
 
 	@staticmethod
 	def _serialize(instance: WAPIInstance) -> dict:
@@ -72,12 +125,34 @@ class WAPIInstanceRepository:
 			metadata=item.get("metadata", {}),
 		)
 
+	@staticmethod
+	def _deserialize_ownership(item: dict) -> WAPIInstance:
+		"""Build an instance from a projected low-level item (string attributes only)."""
+		return WAPIInstance(
+			tenant_id=item["tenant_id"]["S"],
+			user_id=item["user_id"]["S"],
+			wapi_instance_id=item["wapi_instance_id"]["S"],
+			instance_name="",
+			phone_number=item.get("phone_number", {}).get("S", ""),
+			status=item.get("status", {}).get("S", "unknown"),
+			api_key_hash=item.get("api_key_hash", {}).get("S", ""),
+		)
+
 	def _query_instance_lookup(self, wapi_instance_id: str) -> Optional[WAPIInstance]:
-		"""Query by instance id through the dedicated GSI."""
+		"""Query by instance id through the dedicated GSI (ownership fields only).
+
+		Returns None only when the index has no such instance; DynamoDB errors
+		(throttling, outages) are logged and re-raised so callers can tell them
+		apart from a genuine miss.
+		"""
 		try:
-			response = self.table.query(
+			response = self.client.query(
+				TableName=self.table_name,
 				IndexName=self.instance_lookup_index,
-				KeyConditionExpression=Key("wapi_instance_id").eq(wapi_instance_id),
+				KeyConditionExpression="wapi_instance_id = :instance_id",
+				ExpressionAttributeValues={":instance_id": {"S": wapi_instance_id}},
+				ProjectionExpression=_OWNERSHIP_PROJECTION,
+				ExpressionAttributeNames={"#status": "status"},
 				Limit=1,
 			)
 		except ClientError as exc:
@@ -86,17 +161,33 @@ class WAPIInstanceRepository:
 				instance_id=wapi_instance_id,
 				details={"error": str(exc)},
 			)
-			return None
+			raise
 
 		items = response.get("Items", [])
 		if not items:
 			return None
-		return self._deserialize(items[0])
+		return self._deserialize_ownership(items[0])
 
 	def get_by_instance_id(self, wapi_instance_id: str) -> Optional[WAPIInstance]:
-		"""Fetch instance ownership by instance id (used during webhook resolution)."""
+		"""Fetch instance ownership by instance id (used during webhook resolution).
+
+		Only the ownership fields are loaded; instance_name, timestamps and
+		metadata are left at their defaults. Raises ClientError on lookup
+		failures; None means the instance does not exist.
+		"""
 		return self._query_instance_lookup(wapi_instance_id)
 
+	def get_many_by_instance_ids(self, wapi_instance_ids: List[str]) -> Dict[str, Optional[WAPIInstance]]:
+		"""Fetch several instances by instance id, one lookup per unique id.
+
+		The table key is (user_id, wapi_instance_id), so instance ids are only
+		reachable through the lookup GSI; BatchGetItem cannot read a GSI.
+		"""
+		return {
+			instance_id: self._query_instance_lookup(instance_id)
+			for instance_id in dict.fromkeys(wapi_instance_ids)
+		}
+
 	def get_owner_by_phone(self, phone_number: str) -> Optional[WAPIInstance]:
 		"""Fetch instance ownership by normalized phone number."""
 		normalized = self._normalize_phone(phone_number)
@@ -1,10 +1,11 @@
 """Data models and schemas for storage."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class MessageType(str, Enum):
@@ -33,7 +34,8 @@ class WAPIMessageKey(BaseModel):
     id: str = Field(..., min_length=1)
     participant: Optional[str] = None
 
-    @validator('remoteJid')
+    @field_validator('remoteJid')
+    @classmethod
     def validate_remote_jid(cls, v):
         """Validate WhatsApp JID format."""
         if not (v.endswith('@s.whatsapp.net') or v.endswith('@g.us')):
@@ -75,7 +77,8 @@ class WAPIWebhookEvent(BaseModel):
     server_url: Optional[str] = None
     apikey: Optional[str] = None
 
-    @validator('event')
+    @field_validator('event')
+    @classmethod
     def validate_event_type(cls, v):
         """Validate event type."""
         allowed_events = [
@@ -108,7 +111,8 @@ class MessageMetadata(BaseModel):
     forwarded: bool = False
     quoted_message_id: Optional[str] = None
 
-    @validator('chat_type')
+    @field_validator('chat_type')
+    @classmethod
     def _normalize_chat_type(cls, value: Optional[str]) -> Optional[str]:
         """Normalize chat_type to lowercase for consistent comparisons."""
         if value is None:
@@ -152,8 +156,7 @@ class NormalizedMessage(BaseModel):
     classification_routing: Optional[str] = None
     classification_confidence: Optional[float] = None
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 # Dataclasses for Database Storage
@@ -171,6 +174,14 @@ class WAPIInstance:
     updated_at: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @cached_property
+    def api_key_digest(self) -> Optional[bytes]:
+        """Raw SHA-256 digest decoded from api_key_hash (None if invalid)."""
+        try:
+            return bytes.fromhex(self.api_key_hash) or None
+        except (TypeError, ValueError):
+            return None
+
 
 @dataclass
 class MessageRecord:
@@ -209,7 +220,7 @@ class SecurityAuditLog:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of message processing through orchestration."""
     message_id: str
@@ -221,6 +232,17 @@ class ProcessingResult:
     llm_used: bool
     audit_trail: List[Dict[str, Any]]
     processed_at: str
+    # Audit trail entries indexed by step name (first entry per step)
+    audit_by_step: Dict[str, Dict[str, Any]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.audit_by_step = {
+            entry["step"]: entry
+            for entry in reversed(self.audit_trail)
+            if "step" in entry
+        }
 
 
 # Learning Agent Models
@@ -3,6 +3,7 @@
 Components:
 - urgency_engine: Deterministic rule-based urgency detection
 - agents: LLM-powered decision agents
+- categories: Shared cognitive-friendly category constants
 - learning_agent: User feedback processing and statistics
 - learning_integration: Bridge between learning and urgency
 - feedback_handler: SendPulse webhook feedback processing
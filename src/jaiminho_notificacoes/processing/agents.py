@@ -1,11 +1,25 @@
 """LLM-based agents for message processing decisions."""
 
+import asyncio
 import json
 import os
 from typing import Tuple, Dict, List, Optional
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+from jaiminho_notificacoes.processing.categories import (
+    ALL_CATEGORIES,
+    CAT_AUTOMATION,
+    CAT_DELIVERY,
+    CAT_EVENTS,
+    CAT_FAMILY,
+    CAT_FINANCE,
+    CAT_GENERAL,
+    CAT_HEALTH,
+    CAT_OTHER,
+    CAT_WORK,
+    canonical_category,
+)
 from jaiminho_notificacoes.processing.urgency_engine import UrgencyDecision
 from jaiminho_notificacoes.core.logger import TenantContextLogger
 from jaiminho_notificacoes.persistence.models import NormalizedMessage
@@ -490,17 +504,10 @@ class ClassificationAgent(BaseAgent):
     """
     
     # Cognitive-friendly categories with emojis for better recognition
-    CATEGORIES = [
-        "💼 Trabalho e Negócios",
-        "👨‍👩‍👧 Família e Amigos",
-        "📦 Entregas e Compras",
-        "💰 Financeiro",
-        "🏥 Saúde",
-        "🎉 Eventos e Convites",
-        "📰 Informação Geral",
-        "🤖 Automação e Bots",
-        "❓ Outros"
-    ]
+    CATEGORIES = list(ALL_CATEGORIES)
+    
+    # Maximum number of messages packed into a single batched LLM call
+    MAX_BATCH_SIZE = 20
     
     async def run(
         self,
@@ -567,7 +574,127 @@ class ClassificationAgent(BaseAgent):
             logger.error(f"Classification agent error: {e}", tenant_id=message.tenant_id)
             # Conservative fallback
             return self._create_fallback_result(urgency_decision, str(e))
-    
+
+    async def run_batch(
+        self,
+        messages: List[NormalizedMessage],
+        urgency_decisions: List[UrgencyDecision],
+        urgency_confidences: List[float],
+        tenant_context: Optional[Dict] = None,
+        concurrency_limit: int = 4
+    ) -> List[ClassificationResult]:
+        """
+        Classify several messages of the same user with a single LLM call.
+
+        Batches larger than MAX_BATCH_SIZE are split into chunks that are
+        sent concurrently, at most concurrency_limit at a time.
+
+        Args:
+            messages: Normalized messages, all from the same tenant and user
+            urgency_decisions: Urgency decision for each message
+            urgency_confidences: Urgency confidence for each message
+            tenant_context: Optional tenant-specific settings (NOT cross-user data)
+            concurrency_limit: Maximum number of chunks in flight at once
+
+        Returns:
+            List of ClassificationResult in the same order as messages
+
+        Raises:
+            ValueError: If the lists differ in size or the batch mixes
+                tenants/users
+
+        Security Note:
+            A batch is a single prompt, so it may only contain messages of one
+            user. Mixing users would leak cross-user data into the LLM context.
+        """
+        if not (len(messages) == len(urgency_decisions) == len(urgency_confidences)):
+            raise ValueError(
+                "messages, urgency_decisions and urgency_confidences must have the same length"
+            )
+        if not messages:
+            return []
+
+        for message in messages:
+            self._validate_tenant_isolation(message)
+
+        tenant_id = messages[0].tenant_id
+        user_id = messages[0].user_id
+        if any(m.tenant_id != tenant_id or m.user_id != user_id for m in messages):
+            raise ValueError(
+                "ClassificationAgent.run_batch requires all messages to belong "
+                "to the same tenant_id and user_id."
+            )
+
+        logger.debug(
+            "Running batch classification agent",
+            tenant_id=tenant_id,
+            user_id=user_id,
+            batch_size=len(messages)
+        )
+
+        # Large batches are split into chunks that are classified concurrently,
+        # capped so we never exceed what the provider batches in one pass
+        semaphore = asyncio.Semaphore(concurrency_limit)
+
+        async def classify_chunk(start: int) -> List[ClassificationResult]:
+            end = start + self.MAX_BATCH_SIZE
+            async with semaphore:
+                return await self._classify_chunk(
+                    messages[start:end],
+                    urgency_decisions[start:end],
+                    urgency_confidences[start:end]
+                )
+
+        chunks = await asyncio.gather(
+            *(classify_chunk(start) for start in range(0, len(messages), self.MAX_BATCH_SIZE))
+        )
+        results = [result for chunk in chunks for result in chunk]
+
+        logger.info(
+            "Batch classification agent result",
+            tenant_id=tenant_id,
+            user_id=user_id,
+            batch_size=len(results)
+        )
+
+        return results
+
+    async def _classify_chunk(
+        self,
+        messages: List[NormalizedMessage],
+        urgency_decisions: List[UrgencyDecision],
+        urgency_confidences: List[float]
+    ) -> List[ClassificationResult]:
+        """Classify one chunk of a batch with a single LLM call."""
+        try:
+            prompt = self._build_batch_classification_prompt(
+                messages,
+                urgency_decisions,
+                urgency_confidences
+            )
+
+            response = await self._call_llm(prompt, messages)
+
+            results = self._parse_batch_classification_response(response, len(messages))
+
+            return [
+                self._apply_routing_logic(result, decision, confidence)
+                for result, decision, confidence in zip(
+                    results, urgency_decisions, urgency_confidences
+                )
+            ]
+
+        except Exception as e:
+            logger.error(
+                f"Batch classification agent error: {e}",
+                tenant_id=messages[0].tenant_id
+            )
+            # Conservative fallback for every message in the chunk
+            return [
+                self._create_fallback_result(decision, str(e))
+                for decision in urgency_decisions
+            ]
+
     def _validate_tenant_isolation(self, message: NormalizedMessage):
         """
         Validate that message contains proper tenant isolation.
@@ -665,17 +792,98 @@ Responda com APENAS um objeto JSON válido (sem markdown):
 }}"""
         
         return prompt
-    
-    async def _call_llm(self, prompt: str) -> str:
+
+    def _build_batch_classification_prompt(
+        self,
+        messages: List[NormalizedMessage],
+        urgency_decisions: List[UrgencyDecision],
+        urgency_confidences: List[float]
+    ) -> str:
+        """
+        Build a single prompt classifying several messages of one user.
+
+        Messages are embedded as a JSON array of {text, sender, urgency}
+        and the LLM must answer with a JSON array in the same order.
+        """
+        items = [
+            {
+                "index": idx,
+                "text": (message.content.text or message.content.caption or "")[:500],
+                "sender": message.sender_name or "Desconhecido",
+                "urgency": {
+                    "decision": decision.value,
+                    "confidence": round(confidence, 2)
+                }
+            }
+            for idx, (message, decision, confidence) in enumerate(
+                zip(messages, urgency_decisions, urgency_confidences)
+            )
+        ]
+
+        categories_list = "\n".join([f"- {cat}" for cat in self.CATEGORIES])
+
+        return f"""Você é um assistente de classificação de mensagens para um sistema brasileiro de notificações do WhatsApp.
+
+Classifique CADA mensagem abaixo atribuindo uma CATEGORIA COGNITIVA, um RESUMO curto
+(1-2 frases, máximo 100 caracteres) e o ROTEAMENTO (immediate, digest, spam).
+
+IMPORTANTE - ISOLAMENTO DE DADOS:
+- Todas as mensagens pertencem a UM único usuário
+- Classifique cada mensagem de forma independente
+- NUNCA use ou solicite dados de outros usuários
+
+MENSAGENS (JSON):
+{json.dumps(items, ensure_ascii=False)}
+
+CATEGORIAS DISPONÍVEIS (escolha UMA por mensagem):
+{categories_list}
+
+INSTRUÇÕES PARA ROTEAMENTO:
+- "immediate": Se urgente E confiança > 0.75
+- "digest": Para mensagens importantes mas não urgentes
+- "spam": Para mensagens claramente promocionais/spam
+- Em caso de dúvida, prefira "digest"
+
+Responda com APENAS um array JSON válido (sem markdown), com um objeto por mensagem na mesma ordem:
+[
+  {{
+    "category": "<uma das categorias listadas acima>",
+    "summary": "<resumo curto em português, 1-2 frases>",
+    "routing": "immediate" ou "digest" ou "spam",
+    "reasoning": "<breve explicação das escolhas>",
+    "confidence": <número entre 0.0 e 1.0>
+  }}
+]"""
+
+    async def _call_llm(
+        self,
+        prompt: str,
+        messages: Optional[List[NormalizedMessage]] = None
+    ) -> str:
         """
         Call LLM API for classification.
         
+        When ``messages`` is given, the prompt is a batched prompt and the
+        response is a JSON array with one classification per message.
+        
         Note: In production, this would use OpenAI or similar.
         For now, uses an intelligent fallback that analyzes the prompt content.
         """
         if not self.api_key:
             logger.warning("OPENAI_API_KEY not set - using intelligent fallback")
             
+            if messages is not None:
+                return json.dumps(
+                    [
+                        self._keyword_classification(
+                            message.content.text or message.content.caption or "",
+                            message.sender_name or "Contato"
+                        )
+                        for message in messages
+                    ],
+                    ensure_ascii=False
+                )
+            
             # Extract message info from prompt for intelligent fallback
             # This is a temporary solution until LLM API is configured
             import re
@@ -683,49 +891,15 @@ Responda com APENAS um objeto JSON válido (sem markdown):
             # Extract content from prompt
             content_match = re.search(r'CONTEÚDO DA MENSAGEM.*?:\n(.+?)(?:\n\n|$)', prompt, re.DOTALL)
             content = content_match.group(1) if content_match else ""
-            content_lower = content.lower()
-            
-            # Classify category based on keywords
-            category = "❓ Outros"
-            if any(kw in content_lower for kw in ["trabalho", "reunião", "meeting", "projeto", "prazo", "deadline", "contrato"]):
-                category = "💼 Trabalho e Negócios"
-            elif any(kw in content_lower for kw in ["família", "mãe", "pai", "filho", "amigo", "querido"]):
-                category = "👨‍👩‍👧 Família e Amigos"
-            elif any(kw in content_lower for kw in ["entrega", "pedido", "compra", "rastreio", "correios", "sedex"]):
-                category = "📦 Entregas e Compras"
-            elif any(kw in content_lower for kw in ["pagamento", "boleto", "fatura", "pix", "transferência", "banco"]):
-                category = "💰 Financeiro"
-            elif any(kw in content_lower for kw in ["médico", "consulta", "exame", "saúde", "hospital", "remédio"]):
-                category = "🏥 Saúde"
-            elif any(kw in content_lower for kw in ["evento", "festa", "convite", "aniversário", "celebração"]):
-                category = "🎉 Eventos e Convites"
-            elif any(kw in content_lower for kw in ["bot", "automático", "notificação", "alerta", "sistema"]):
-                category = "🤖 Automação e Bots"
-            else:
-                category = "📰 Informação Geral"
             
             # Extract sender name
             sender_match = re.search(r'Remetente: (.+?) \(', prompt)
             sender_name = sender_match.group(1) if sender_match else "Contato"
             
-            # Generate summary
-            summary_text = content[:80].strip()
-            if len(content) > 80:
-                summary_text += "..."
-            summary = f"{sender_name}: {summary_text}"
-            
-            # Determine routing based on urgency in prompt
-            routing = "digest"
-            if "URGENT" in prompt or "urgente" in content_lower:
-                routing = "digest"  # Will be overridden by routing logic if needed
-            
-            return f'''{{
-                "category": "{category}",
-                "summary": "{summary}",
-                "routing": "{routing}",
-                "reasoning": "Classificação baseada em análise de palavras-chave (API não configurada)",
-                "confidence": 0.7
-            }}'''
+            return json.dumps(
+                self._keyword_classification(content, sender_name),
+                ensure_ascii=False
+            )
         
         # TODO: Implement actual OpenAI API call
         # Example:
@@ -739,13 +913,63 @@ Responda com APENAS um objeto JSON válido (sem markdown):
         # return response.choices[0].message.content
         
         # Mock response for development
-        return '''{
-            "category": "📰 Informação Geral",
+        mock = {
+            "category": CAT_GENERAL,
             "summary": "Nova mensagem recebida",
             "routing": "digest",
             "reasoning": "Classificação padrão",
             "confidence": 0.7
-        }'''
+        }
+        return json.dumps(
+            mock if messages is None else [mock] * len(messages),
+            ensure_ascii=False
+        )
+    
+    def _keyword_classification(self, content: str, sender_name: str) -> Dict:
+        """
+        Keyword-based classification used while the LLM API is not configured.
+        
+        Args:
+            content: Message text
+            sender_name: Display name of the sender
+        
+        Returns:
+            Dict in the same shape as the LLM JSON response
+        """
+        content_lower = content.lower()
+        
+        # Classify category based on keywords
+        category = CAT_OTHER
+        if any(kw in content_lower for kw in ["trabalho", "reunião", "meeting", "projeto", "prazo", "deadline", "contrato"]):
+            category = CAT_WORK
+        elif any(kw in content_lower for kw in ["família", "mãe", "pai", "filho", "amigo", "querido"]):
+            category = CAT_FAMILY
+        elif any(kw in content_lower for kw in ["entrega", "pedido", "compra", "rastreio", "correios", "sedex"]):
+            category = CAT_DELIVERY
+        elif any(kw in content_lower for kw in ["pagamento", "boleto", "fatura", "pix", "transferência", "banco"]):
+            category = CAT_FINANCE
+        elif any(kw in content_lower for kw in ["médico", "consulta", "exame", "saúde", "hospital", "remédio"]):
+            category = CAT_HEALTH
+        elif any(kw in content_lower for kw in ["evento", "festa", "convite", "aniversário", "celebração"]):
+            category = CAT_EVENTS
+        elif any(kw in content_lower for kw in ["bot", "automático", "notificação", "alerta", "sistema"]):
+            category = CAT_AUTOMATION
+        else:
+            category = CAT_GENERAL
+        
+        # Generate summary
+        summary_text = content[:80].strip()
+        if len(content) > 80:
+            summary_text += "..."
+        
+        # Routing is refined later by _apply_routing_logic
+        return {
+            "category": category,
+            "summary": f"{sender_name}: {summary_text}",
+            "routing": "digest",
+            "reasoning": "Classificação baseada em análise de palavras-chave (API não configurada)",
+            "confidence": 0.7
+        }
     
     def _parse_classification_response(self, response: str) -> ClassificationResult:
         """
@@ -761,36 +985,7 @@ Responda com APENAS um objeto JSON válido (sem markdown):
             ValueError: If response is invalid
         """
         try:
-            data = json.loads(response)
-            
-            # Extract and validate fields
-            category = data.get("category", "❓ Outros")
-            if category not in self.CATEGORIES:
-                logger.warning(f"Invalid category '{category}', using default")
-                category = "❓ Outros"
-            
-            summary = data.get("summary", "Mensagem sem resumo")
-            # Truncate summary if too long
-            if len(summary) > 150:
-                summary = summary[:147] + "..."
-            
-            routing = data.get("routing", "digest").lower()
-            valid_routing = ["immediate", "digest", "spam"]
-            if routing not in valid_routing:
-                logger.warning(f"Invalid routing '{routing}', using 'digest'")
-                routing = "digest"
-            
-            reasoning = data.get("reasoning", "Sem justificativa")
-            confidence = float(data.get("confidence", 0.5))
-            confidence = max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
-            
-            return ClassificationResult(
-                category=category,
-                summary=summary,
-                routing=routing,
-                reasoning=reasoning,
-                confidence=confidence
-            )
+            return self._result_from_data(json.loads(response))
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse classification response: {e}")
@@ -799,6 +994,69 @@ Responda com APENAS um objeto JSON válido (sem markdown):
             logger.error(f"Error parsing classification response: {e}")
             raise
     
+    def _parse_batch_classification_response(
+        self,
+        response: str,
+        expected_count: int
+    ) -> List[ClassificationResult]:
+        """
+        Parse a batched LLM response (JSON array) into ClassificationResults.
+        
+        Args:
+            response: JSON array string from LLM, one object per message
+            expected_count: Number of messages sent in the batch
+        
+        Returns:
+            List of ClassificationResult in the same order as the batch
+        
+        Raises:
+            ValueError: If response is not a JSON array of the expected size
+        """
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse batch classification response: {e}")
+            raise ValueError(f"Invalid JSON response from LLM: {e}")
+        
+        if not isinstance(data, list) or len(data) != expected_count:
+            raise ValueError(
+                f"Expected JSON array with {expected_count} classifications from LLM"
+            )
+        
+        return [self._result_from_data(item) for item in data]
+    
+    def _result_from_data(self, data: Dict) -> ClassificationResult:
+        """Validate a decoded LLM classification object."""
+        # Extract and validate fields
+        raw_category = data.get("category", CAT_OTHER)
+        category = canonical_category(raw_category)
+        if category is None:
+            logger.warning(f"Invalid category '{raw_category}', using default")
+            category = CAT_OTHER
+        
+        summary = data.get("summary", "Mensagem sem resumo")
+        # Truncate summary if too long
+        if len(summary) > 150:
+            summary = summary[:147] + "..."
+        
+        routing = data.get("routing", "digest").lower()
+        valid_routing = ["immediate", "digest", "spam"]
+        if routing not in valid_routing:
+            logger.warning(f"Invalid routing '{routing}', using 'digest'")
+            routing = "digest"
+        
+        reasoning = data.get("reasoning", "Sem justificativa")
+        confidence = float(data.get("confidence", 0.5))
+        confidence = max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
+        
+        return ClassificationResult(
+            category=category,
+            summary=summary,
+            routing=routing,
+            reasoning=reasoning,
+            confidence=confidence
+        )
+    
     def _apply_routing_logic(
         self,
         result: ClassificationResult,
@@ -865,7 +1123,7 @@ Responda com APENAS um objeto JSON válido (sem markdown):
         routing = "immediate" if urgency_decision == UrgencyDecision.URGENT else "digest"
         
         return ClassificationResult(
-            category="❓ Outros",
+            category=CAT_OTHER,
             summary="Erro no processamento - mensagem preservada para digest",
             routing=routing,
             reasoning=f"Fallback devido a erro: {error_msg}",
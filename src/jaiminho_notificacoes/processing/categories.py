@@ -0,0 +1,46 @@
+"""Cognitive-friendly message categories.
+
+Shared by the classification agent, the orchestrator and the digest
+generator. The strings are interned so grouping and comparisons against
+these constants hit the identity fast path.
+"""
+
+import sys
+from typing import Dict, Optional, Tuple
+
+
+CAT_WORK = sys.intern("💼 Trabalho e Negócios")
+CAT_FAMILY = sys.intern("👨‍👩‍👧 Família e Amigos")
+CAT_DELIVERY = sys.intern("📦 Entregas e Compras")
+CAT_FINANCE = sys.intern("💰 Financeiro")
+CAT_HEALTH = sys.intern("🏥 Saúde")
+CAT_EVENTS = sys.intern("🎉 Eventos e Convites")
+CAT_GENERAL = sys.intern("📰 Informação Geral")
+CAT_AUTOMATION = sys.intern("🤖 Automação e Bots")
+CAT_OTHER = sys.intern("❓ Outros")
+
+ALL_CATEGORIES: Tuple[str, ...] = (
+    CAT_WORK,
+    CAT_FAMILY,
+    CAT_DELIVERY,
+    CAT_FINANCE,
+    CAT_HEALTH,
+    CAT_EVENTS,
+    CAT_GENERAL,
+    CAT_AUTOMATION,
+    CAT_OTHER,
+)
+
+_CANONICAL: Dict[str, str] = {category: category for category in ALL_CATEGORIES}
+
+
+def canonical_category(category: Optional[str]) -> Optional[str]:
+    """
+    Map a category string (e.g. parsed from LLM JSON) to its shared constant.
+
+    Returns:
+        The interned constant, or None if the category is unknown
+    """
+    if category is None:
+        return None
+    return _CANONICAL.get(category)
@@ -2,18 +2,20 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import cached_property
+from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 
 from jaiminho_notificacoes.core.logger import TenantContextLogger
 from jaiminho_notificacoes.core.tenant import TenantContext
+from jaiminho_notificacoes.processing.categories import CAT_OTHER
 from jaiminho_notificacoes.persistence.models import NormalizedMessage
 
 
 logger = TenantContextLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DigestMessage:
     """Simplified message for digest."""
     message_id: str
@@ -26,33 +28,41 @@ class DigestMessage:
     group_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class CategoryDigest:
     """Digest for a specific category."""
     category: str
     emoji: str
     message_count: int
-    messages: List[DigestMessage] = field(default_factory=list)
+    messages: Tuple[DigestMessage, ...] = ()
     
     def get_display_name(self) -> str:
         """Get display name with emoji."""
         return self.category
 
 
-@dataclass
+@dataclass(frozen=True)
 class UserDigest:
-    """Complete daily digest for a user."""
+    """Complete daily digest for a user (immutable once generated)."""
     user_id: str
     tenant_id: str
     date: str
     total_messages: int
-    categories: List[CategoryDigest] = field(default_factory=list)
+    categories: Tuple[CategoryDigest, ...] = ()
     generated_at: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_whatsapp_text(self) -> str:
+        """Return the WhatsApp-ready formatted text (rendered once per digest)."""
+        return self.whatsapp_text
+    
+    @cached_property
+    def whatsapp_text(self) -> str:
         """
         Generate WhatsApp-ready formatted text.
         
+        The text is cached on first access; the digest and its categories
+        are frozen, so previews, sends and retries reuse the same rendering.
+        
         Optimized for:
         - Mobile readability
         - Minimal cognitive load
@@ -173,7 +183,7 @@ class DigestAgent:
             
             self.logger.info(
                 "Generating digest",
-                user_id=user_id,
+                user_id=tenant_context.user_id,
                 message_count=len(messages),
                 date=date
             )
@@ -182,16 +192,15 @@ class DigestAgent:
             categories_dict = self._group_by_category(messages)
             
             # Create category digests
-            category_digests = []
-            for category, msgs in categories_dict.items():
-                category_digests.append(
-                    CategoryDigest(
-                        category=category,
-                        emoji=self._extract_emoji(category),
-                        message_count=len(msgs),
-                        messages=msgs
-                    )
+            category_digests = tuple(
+                CategoryDigest(
+                    category=category,
+                    emoji=self._extract_emoji(category),
+                    message_count=len(msgs),
+                    messages=tuple(msgs)
                 )
+                for category, msgs in categories_dict.items()
+            )
             
             # Create user digest
             digest = UserDigest(
@@ -221,6 +230,33 @@ class DigestAgent:
         finally:
             self.logger.clear_context()
     
+    async def generate_digests_for_users(
+        self,
+        user_batches: List[Tuple[TenantContext, List[NormalizedMessage]]],
+        date: Optional[str] = None
+    ) -> List[UserDigest]:
+        """
+        Generate digests for many users, one after another.
+        
+        Convenience wrapper for nightly jobs; generation is CPU-bound, so
+        users are processed sequentially.
+        
+        Args:
+            user_batches: (tenant_context, messages) pairs, one per user
+            date: Date for digests (default: today)
+        
+        Returns:
+            List of UserDigest in the same order as user_batches
+        
+        Security:
+            Each digest is still generated by generate_digest with its own
+            tenant context, so user isolation is validated per user.
+        """
+        return [
+            await self.generate_digest(tenant_context, messages, date)
+            for tenant_context, messages in user_batches
+        ]
+    
     def _validate_user_isolation(
         self,
         tenant_context: TenantContext,
@@ -269,7 +305,7 @@ class DigestAgent:
         for msg in messages:
             # Extract category from message metadata
             # Assuming classification results are stored in message
-            category = getattr(msg, 'classification_category', None) or "❓ Outros"
+            category = getattr(msg, 'classification_category', None) or CAT_OTHER
             
             # Create simplified digest message
             digest_msg = DigestMessage(
@@ -24,12 +24,15 @@ Event structure from SendPulse webhook:
 }
 """
 
+import asyncio
 import json
+import time
 import uuid
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 
 from jaiminho_notificacoes.core.logger import TenantContextLogger
 from jaiminho_notificacoes.core.tenant import TenantIsolationMiddleware, TenantContext
@@ -59,7 +62,7 @@ class SendPulseWebhookEvent:
     metadata: Dict[str, Any]  # Contains: message_id, wapi_instance_id, optional tenant_id
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackProcessingResult:
     """Result of feedback processing."""
     success: bool
@@ -72,6 +75,18 @@ class FeedbackProcessingResult:
     statistics_updated: bool = False
 
 
+_REQUIRED_EVENT_FIELDS = ('event', 'recipient', 'message_id', 'button_reply', 'timestamp')
+_REQUIRED_EVENT_FIELD_SET = frozenset(_REQUIRED_EVENT_FIELDS)
+_REQUIRED_METADATA_FIELDS = ('message_id', 'wapi_instance_id')
+_REQUIRED_METADATA_FIELD_SET = frozenset(_REQUIRED_METADATA_FIELDS)
+
+# Button ID -> feedback type; also the set of accepted button IDs (read-only)
+_BUTTON_FEEDBACK: Mapping[str, FeedbackType] = MappingProxyType({
+    SendPulseButtonType.IMPORTANT.value: FeedbackType.IMPORTANT,
+    SendPulseButtonType.NOT_IMPORTANT.value: FeedbackType.NOT_IMPORTANT,
+})
+
+
 class SendPulseWebhookValidator:
     """Validates SendPulse webhook events."""
 
@@ -86,21 +101,21 @@ class SendPulseWebhookValidator:
         Returns:
             Tuple of (valid, error_message)
         """
-        # Check required fields
-        required_fields = ['event', 'recipient', 'message_id', 'button_reply', 'timestamp']
-        for field in required_fields:
-            if field not in event:
-                return False, f"Missing required field: {field}"
+        # Check required fields (single subset check on the happy path)
+        if not _REQUIRED_EVENT_FIELD_SET.issubset(event):
+            for field in _REQUIRED_EVENT_FIELDS:
+                if field not in event:
+                    return False, f"Missing required field: {field}"
 
         # Check metadata
-        if 'metadata' not in event:
+        metadata = event.get('metadata')
+        if metadata is None:
             return False, "Missing metadata (should contain: message_id, wapi_instance_id, optional tenant_id)"
 
-        metadata = event['metadata']
-        required_metadata = ['message_id', 'wapi_instance_id']
-        for field in required_metadata:
-            if field not in metadata:
-                return False, f"Missing metadata field: {field}"
+        if not _REQUIRED_METADATA_FIELD_SET.issubset(metadata):
+            for field in _REQUIRED_METADATA_FIELDS:
+                if field not in metadata:
+                    return False, f"Missing metadata field: {field}"
 
         if 'user_id' in metadata:
             return False, "metadata must not include user_id"
@@ -111,9 +126,7 @@ class SendPulseWebhookValidator:
             return False, "Invalid button_reply structure"
 
         # Check button ID
-        try:
-            button_type = SendPulseButtonType(button_reply['id'])
-        except ValueError:
+        if button_reply['id'] not in _BUTTON_FEEDBACK:
             return False, f"Unknown button type: {button_reply['id']}"
 
         # Check timestamp
@@ -133,11 +146,7 @@ class SendPulseWebhookValidator:
         Returns:
             FeedbackType or None
         """
-        mapping = {
-            SendPulseButtonType.IMPORTANT.value: FeedbackType.IMPORTANT,
-            SendPulseButtonType.NOT_IMPORTANT.value: FeedbackType.NOT_IMPORTANT,
-        }
-        return mapping.get(button_id)
+        return _BUTTON_FEEDBACK.get(button_id)
 
 
 class FeedbackMessageResolver:
@@ -176,7 +185,7 @@ class FeedbackMessageResolver:
             'sender_phone': '+1234567890',  # Would get from DB
             'sender_name': 'System',
             'category': 'system_alert',
-            'sent_at': datetime.utcnow().isoformat()
+            'sent_at': int(time.time())  # epoch seconds
         }
 
 
@@ -234,7 +243,7 @@ class UserFeedbackProcessor:
                     reason='Feedback webhook failed tenant resolution',
                     instance_id=instance_id,
                     tenant_id=tenant_hint,
-                    details={'errors': validation_errors}
+                    details={'errors': dict(validation_errors)}
                 )
                 return FeedbackProcessingResult(
                     success=False,
@@ -356,11 +365,26 @@ class UserFeedbackProcessor:
             logger.clear_context()
 
     @staticmethod
-    def _calculate_response_time(sent_at: Optional[str], response_at: int) -> Optional[float]:
-        """Calculate time between message sent and response."""
+    def _calculate_response_time(
+        sent_at: Optional[Union[int, str]],
+        response_at: int
+    ) -> Optional[float]:
+        """
+        Calculate time between message sent and response.
+
+        Args:
+            sent_at: Send time as epoch seconds, or a legacy ISO-8601 string
+            response_at: Response time as epoch seconds
+
+        Returns:
+            Response time in seconds, or None if sent_at is missing/invalid
+        """
         if not sent_at:
             return None
 
+        if isinstance(sent_at, int):
+            return max(0.0, float(response_at - sent_at))
+
         try:
             sent_dt = datetime.fromisoformat(sent_at)
             sent_ts = int(sent_dt.timestamp())
@@ -424,10 +448,16 @@ class UserFeedbackProcessor:
 class FeedbackHandler:
     """High-level feedback handler."""
 
-    def __init__(self):
-        """Initialize handler."""
+    def __init__(self, batch_concurrency: int = 64):
+        """
+        Initialize handler.
+
+        Args:
+            batch_concurrency: Max webhooks processed concurrently per batch
+        """
         self.processor = UserFeedbackProcessor()
         self.middleware = TenantIsolationMiddleware()
+        self.batch_concurrency = batch_concurrency
 
     async def handle_webhook(
         self,
@@ -449,19 +479,24 @@ class FeedbackHandler:
         events: list[Dict[str, Any]]
     ) -> list[FeedbackProcessingResult]:
         """
-        Handle multiple webhook events.
+        Handle multiple webhook events concurrently.
+
+        At most ``batch_concurrency`` events are in flight at once.
+        process_feedback never raises, so each event yields a result.
 
         Args:
             events: List of webhook events
 
         Returns:
-            List of FeedbackProcessingResults
+            List of FeedbackProcessingResults, in input order
         """
-        results = []
-        for event in events:
-            result = await self.handle_webhook(event)
-            results.append(result)
-        return results
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def _handle_one(event: Dict[str, Any]) -> FeedbackProcessingResult:
+            async with semaphore:
+                return await self.handle_webhook(event)
+
+        return list(await asyncio.gather(*(_handle_one(e) for e in events)))
 
 
 # Singleton instance
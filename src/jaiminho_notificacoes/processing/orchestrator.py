@@ -13,6 +13,17 @@ from jaiminho_notificacoes.persistence.models import (
     ProcessingDecision,
     ProcessingResult
 )
+from jaiminho_notificacoes.processing.categories import (
+    CAT_AUTOMATION,
+    CAT_DELIVERY,
+    CAT_EVENTS,
+    CAT_FAMILY,
+    CAT_FINANCE,
+    CAT_GENERAL,
+    CAT_HEALTH,
+    CAT_OTHER,
+    CAT_WORK,
+)
 from jaiminho_notificacoes.processing.urgency_engine import (
     UrgencyRuleEngine,
     UrgencyDecision,
@@ -357,7 +368,7 @@ class MessageProcessingOrchestrator:
             from jaiminho_notificacoes.processing.agents import ClassificationResult
             
             fallback_result = ClassificationResult(
-                category="❓ Outros",
+                category=CAT_OTHER,
                 summary="Erro no processamento - mensagem preservada",
                 routing="digest" if urgency_decision != UrgencyDecision.URGENT else "immediate",
                 reasoning=f"Fallback devido a erro: {str(e)}",
@@ -391,24 +402,24 @@ class MessageProcessingOrchestrator:
         text_lower = text.lower()
         
         # Simple category classification based on keywords
-        category = "❓ Outros"
+        category = CAT_OTHER
         
         if any(kw in text_lower for kw in ["trabalho", "reunião", "meeting", "projeto", "prazo", "deadline", "contrato"]):
-            category = "💼 Trabalho e Negócios"
+            category = CAT_WORK
         elif any(kw in text_lower for kw in ["família", "mãe", "pai", "filho", "amigo", "querido"]):
-            category = "👨‍👩‍👧 Família e Amigos"
+            category = CAT_FAMILY
         elif any(kw in text_lower for kw in ["entrega", "pedido", "compra", "rastreio", "correios", "sedex"]):
-            category = "📦 Entregas e Compras"
+            category = CAT_DELIVERY
         elif any(kw in text_lower for kw in ["pagamento", "boleto", "fatura", "pix", "transferência", "banco"]):
-            category = "💰 Financeiro"
+            category = CAT_FINANCE
         elif any(kw in text_lower for kw in ["médico", "consulta", "exame", "saúde", "hospital", "remédio"]):
-            category = "🏥 Saúde"
+            category = CAT_HEALTH
         elif any(kw in text_lower for kw in ["evento", "festa", "convite", "aniversário", "celebração"]):
-            category = "🎉 Eventos e Convites"
+            category = CAT_EVENTS
         elif any(kw in text_lower for kw in ["bot", "automático", "notificação", "alerta", "sistema"]):
-            category = "🤖 Automação e Bots"
+            category = CAT_AUTOMATION
         else:
-            category = "📰 Informação Geral"
+            category = CAT_GENERAL
         
         # Generate simple summary
         sender_name = message.sender_name or "Contato"
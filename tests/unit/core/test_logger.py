@@ -0,0 +1,67 @@
+import json
+import logging
+
+from jaiminho_notificacoes.core.logger import JsonFormatter, TenantContextLogger, get_logger, log_execution
+
+
+def test_repeated_construction_attaches_single_handler():
+    for _ in range(3):
+        logger = TenantContextLogger("tests.logger.handlers")
+    assert len(logger.logger.handlers) == 1
+
+
+def test_get_logger_returns_cached_instance():
+    assert get_logger("tests.logger.cached") is get_logger("tests.logger.cached")
+
+
+def test_log_execution_does_not_add_handlers_per_call():
+    @log_execution
+    def decorated():
+        return 42
+
+    for _ in range(3):
+        assert decorated() == 42
+    assert len(get_logger(decorated.__module__).logger.handlers) == 1
+
+
+def test_json_formatter_timestamp_uses_record_time():
+    record = logging.LogRecord("tests", logging.INFO, __file__, 1, "hello", None, None)
+    record.created = 1705340400.123456
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["timestamp"] == "2024-01-15T17:40:00.123456"
+
+
+def test_json_formatter_copies_present_extra_fields_only():
+    record = logging.LogRecord("tests", logging.INFO, __file__, 1, "hello", None, None)
+    record.tenant_id = "tenant_1"
+    record.details = None
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["tenant_id"] == "tenant_1"
+    assert payload["details"] is None
+    assert "user_id" not in payload
+
+
+def test_logger_formats_percent_args_lazily(caplog):
+    logger = TenantContextLogger("tests.logger.lazy")
+
+    with caplog.at_level(logging.INFO, logger="tests.logger.lazy"):
+        logger.info("resolved %s", "instance-1", tenant_id="tenant_1")
+        logger.debug("skipped %s", "instance-1")
+
+    assert [r.getMessage() for r in caplog.records] == ["resolved instance-1"]
+    assert caplog.records[0].tenant_id == "tenant_1"
+
+
+def test_context_manager_restores_previous_context():
+    logger = TenantContextLogger("tests.logger.scoped")
+    logger.set_context(request_id="outer")
+
+    with logger.context(request_id="req-1") as ctx:
+        ctx.set_context(tenant_id="tenant_1")
+        assert logger._add_context() == {"request_id": "req-1", "tenant_id": "tenant_1"}
+
+    assert logger._add_context() == {"request_id": "outer"}
@@ -1,8 +1,15 @@
+import asyncio
+import pickle
+import threading
+from collections import OrderedDict
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
 
+from jaiminho_notificacoes.core import tenant as tenant_module
 from jaiminho_notificacoes.core.tenant import TenantContext, TenantIsolationMiddleware, TenantResolver
+from jaiminho_notificacoes.persistence.dynamodb import WAPIInstanceRepository
 from jaiminho_notificacoes.persistence.models import WAPIInstance
 
 
@@ -10,7 +17,9 @@ from jaiminho_notificacoes.persistence.models import WAPIInstance
 def resolver_stub():
     resolver = TenantResolver.__new__(TenantResolver)
     resolver.instances_repo = Mock()
-    resolver._cache = {}
+    resolver._cache = OrderedDict()
+    resolver._negative = OrderedDict()
+    resolver._inflight = {}
     resolver.rds_client = None
     return resolver
 
@@ -30,7 +39,8 @@ def test_detect_cross_tenant_attempt_blocks_payload_user(resolver_stub):
     assert resolver_stub.detect_cross_tenant_attempt(payload, "tenant-verified") is True
 
 
-def test_validate_phone_ownership_rejects_conflicting_owner(resolver_stub):
+@pytest.mark.asyncio
+async def test_validate_phone_ownership_rejects_conflicting_owner(resolver_stub):
     tenant_context = _make_tenant_context()
     conflicting_owner = WAPIInstance(
         tenant_id="tenant-2",
@@ -43,10 +53,11 @@ def test_validate_phone_ownership_rejects_conflicting_owner(resolver_stub):
     )
     resolver_stub.instances_repo.get_owner_by_phone.return_value = conflicting_owner
 
-    assert resolver_stub.validate_phone_ownership("15551234567@s.whatsapp.net", tenant_context) is False
+    assert await resolver_stub.validate_phone_ownership("15551234567@s.whatsapp.net", tenant_context) is False
 
 
-def test_validate_phone_ownership_accepts_same_user(resolver_stub):
+@pytest.mark.asyncio
+async def test_validate_phone_ownership_accepts_same_user(resolver_stub):
     tenant_context = _make_tenant_context()
     owner = WAPIInstance(
         tenant_id=tenant_context.tenant_id,
@@ -59,7 +70,7 @@ def test_validate_phone_ownership_accepts_same_user(resolver_stub):
     )
     resolver_stub.instances_repo.get_owner_by_phone.return_value = owner
 
-    assert resolver_stub.validate_phone_ownership("+1 555 123 4567", tenant_context) is True
+    assert await resolver_stub.validate_phone_ownership("+1 555 123 4567", tenant_context) is True
 
 
 @pytest.mark.asyncio
@@ -67,7 +78,7 @@ async def test_validate_and_resolve_rejects_payload_user_override(resolver_stub)
     tenant_context = _make_tenant_context()
 
     resolver_stub.resolve_from_instance = AsyncMock(return_value=tenant_context)
-    resolver_stub.validate_phone_ownership = Mock(return_value=True)
+    resolver_stub.validate_phone_ownership = AsyncMock(return_value=True)
 
     middleware = TenantIsolationMiddleware.__new__(TenantIsolationMiddleware)
     middleware.resolver = resolver_stub
@@ -80,3 +91,244 @@ async def test_validate_and_resolve_rejects_payload_user_override(resolver_stub)
 
     assert tenant is None
     assert errors.get("payload_forbidden_fields") == "Payload attempted to override tenant/user context"
+
+
+@pytest.mark.asyncio
+async def test_validate_and_resolve_returns_shared_read_only_errors(resolver_stub):
+    resolver_stub.resolve_from_instance = AsyncMock(return_value=_make_tenant_context())
+    middleware = TenantIsolationMiddleware.__new__(TenantIsolationMiddleware)
+    middleware.resolver = resolver_stub
+
+    tenant, errors = await middleware.validate_and_resolve(instance_id="instance-1")
+    assert tenant is not None
+    assert not errors
+
+    resolver_stub.resolve_from_instance = AsyncMock(return_value=None)
+    _, first = await middleware.validate_and_resolve(instance_id="instance-1")
+    _, second = await middleware.validate_and_resolve(instance_id="instance-1")
+    assert first is second
+    assert dict(first) == {"instance_id": "Invalid or unauthorized instance"}
+    with pytest.raises(TypeError):
+        first["instance_id"] = "tampered"
+
+
+def _make_instance(api_key_hash):
+    return WAPIInstance(
+        tenant_id="tenant-1",
+        user_id="user-1",
+        wapi_instance_id="instance-1",
+        instance_name="primary",
+        phone_number="+15551234567",
+        status="active",
+        api_key_hash=api_key_hash,
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolve_from_instance_validates_api_key_digest(resolver_stub):
+    resolver_stub.instances_repo.get_by_instance_id.return_value = _make_instance(
+        resolver_stub._hash_api_key("secret-key")
+    )
+
+    context = await resolver_stub.resolve_from_instance("instance-1", api_key="secret-key")
+    assert context is not None and context.user_id == "user-1"
+
+    # Cache hits re-check the key against the cached digest
+    assert await resolver_stub.resolve_from_instance("instance-1", api_key="secret-key") is context
+    assert await resolver_stub.resolve_from_instance("instance-1", api_key="wrong-key") is None
+    assert resolver_stub.instances_repo.get_by_instance_id.call_count == 1
+
+    resolver_stub._cache.clear()
+    assert await resolver_stub.resolve_from_instance("instance-1", api_key="wrong-key") is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_from_instance_rejects_malformed_stored_hash(resolver_stub):
+    resolver_stub.instances_repo.get_by_instance_id.return_value = _make_instance("hash")
+
+    assert await resolver_stub.resolve_from_instance("instance-1", api_key="secret-key") is None
+
+
+def test_tenant_cache_evicts_least_recently_used(resolver_stub, monkeypatch):
+    monkeypatch.setattr(tenant_module, "MAX_CACHE_SIZE", 2)
+    for name in ("a", "b"):
+        resolver_stub._add_to_cache(name, _make_tenant_context(instance_id=name))
+
+    assert resolver_stub._get_from_cache("a")[0] is True  # "b" is now LRU
+    resolver_stub._add_to_cache("c", _make_tenant_context(instance_id="c"))
+
+    assert list(resolver_stub._cache) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_from_instance_returns_none_on_lookup_errors(resolver_stub):
+    lookup = resolver_stub.instances_repo.get_by_instance_id
+    lookup.side_effect = ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException"}}, "Query"
+    )
+    assert await resolver_stub.resolve_from_instance("instance-1") is None
+
+    lookup.side_effect = EndpointConnectionError(endpoint_url="https://dynamodb")
+    assert await resolver_stub.resolve_from_instance("instance-1") is None
+
+    # Programming errors are not swallowed as an unknown tenant
+    lookup.side_effect = KeyError("tenant_id")
+    with pytest.raises(KeyError):
+        await resolver_stub.resolve_from_instance("instance-1")
+
+
+@pytest.mark.asyncio
+async def test_lookup_errors_are_not_negatively_cached(resolver_stub):
+    lookup = resolver_stub.instances_repo.get_by_instance_id
+    lookup.side_effect = ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException"}}, "Query"
+    )
+    assert await resolver_stub.resolve_from_instance("instance-1") is None
+
+    lookup.side_effect = None
+    lookup.return_value = _make_instance("hash")
+    context = await resolver_stub.resolve_from_instance("instance-1")
+    assert context is not None and context.tenant_id == "tenant-1"
+    assert lookup.call_count == 2
+
+    many = resolver_stub.instances_repo.get_many_by_instance_ids
+    many.side_effect = ClientError({"Error": {"Code": "InternalServerError"}}, "Query")
+    assert await resolver_stub.resolve_many(["instance-2"]) == {"instance-2": None}
+    assert resolver_stub._get_from_cache("instance-2")[0] is False
+
+
+def test_instance_lookup_raises_on_dynamodb_errors():
+    repo = WAPIInstanceRepository.__new__(WAPIInstanceRepository)
+    repo.table_name = "instances"
+    repo.instance_lookup_index = "instance-lookup"
+    repo.client = Mock()
+    repo.client.query.side_effect = ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException"}}, "Query"
+    )
+    with pytest.raises(ClientError):
+        repo.get_by_instance_id("instance-1")
+
+    # Only an empty result means the instance does not exist
+    repo.client.query.side_effect = None
+    repo.client.query.return_value = {"Items": []}
+    assert repo.get_by_instance_id("instance-1") is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_from_instance_caches_missing_instance_briefly(resolver_stub, monkeypatch):
+    resolver_stub.instances_repo.get_by_instance_id.return_value = None
+
+    assert await resolver_stub.resolve_from_instance("missing") is None
+    assert await resolver_stub.resolve_from_instance("missing") is None
+    assert resolver_stub.instances_repo.get_by_instance_id.call_count == 1
+
+    # Once the negative entry expires the repository is consulted again
+    now = tenant_module.time.monotonic()
+    monkeypatch.setattr(
+        tenant_module.time, "monotonic",
+        lambda: now + tenant_module.NEGATIVE_CACHE_TTL_SECONDS + 1
+    )
+    assert await resolver_stub.resolve_from_instance("missing") is None
+    assert resolver_stub.instances_repo.get_by_instance_id.call_count == 2
+
+
+def test_negative_cache_is_bounded_and_keeps_contexts(resolver_stub, monkeypatch):
+    monkeypatch.setattr(tenant_module, "MAX_NEGATIVE_CACHE_SIZE", 2)
+    resolver_stub._add_to_cache("good", _make_tenant_context(instance_id="good"))
+    for name in ("bad-1", "bad-2", "x" * 4096):
+        resolver_stub._add_to_cache(name, None)
+
+    assert len(resolver_stub._negative) == 2
+    assert all(len(key) == 8 for key in resolver_stub._negative)
+    assert resolver_stub._get_from_cache("bad-1")[0] is False
+    assert resolver_stub._get_from_cache("x" * 4096) == (True, None, None)
+    assert resolver_stub._get_from_cache("good")[1].instance_id == "good"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("+1 (555) 123-4567", "15551234567"),
+        ("15551234567@s.whatsapp.net", "15551234567"),
+        ("5511999999999", "5511999999999"),
+        (None, ""),
+    ],
+)
+def test_normalize_phone_keeps_digits_only(raw, expected):
+    assert TenantResolver._normalize_phone(raw) == expected
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_dedupes_and_uses_cache(resolver_stub):
+    resolver_stub._add_to_cache("cached", _make_tenant_context(instance_id="cached"))
+    resolver_stub.instances_repo.get_many_by_instance_ids.return_value = {
+        "instance-1": _make_instance(resolver_stub._hash_api_key("k")),
+        "missing": None,
+    }
+
+    results = await resolver_stub.resolve_many(["instance-1", "cached", "missing", "instance-1"])
+
+    resolver_stub.instances_repo.get_many_by_instance_ids.assert_called_once_with(
+        ["instance-1", "missing"]
+    )
+    assert results["instance-1"].user_id == "user-1"
+    assert results["cached"].instance_id == "cached"
+    assert results["missing"] is None
+
+
+def test_tenant_context_precomputes_normalized_phone():
+    context = _make_tenant_context(phone="+1 (555) 123-4567")
+
+    assert context.normalized_phone == "15551234567"
+    with pytest.raises(AttributeError):
+        context.user_id = "attacker"
+
+
+def test_detect_cross_tenant_attempt_allows_plain_payload(resolver_stub):
+    assert resolver_stub.detect_cross_tenant_attempt({"instance": "i-1", "data": {}}, "tenant-1") is False
+    assert resolver_stub.detect_cross_tenant_attempt({"tenant_id": "tenant-1"}, "tenant-1") is False
+    assert resolver_stub.detect_cross_tenant_attempt({"tenant_id": "tenant-2"}, "tenant-1") is True
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolves_share_one_lookup(resolver_stub):
+    release = threading.Event()
+
+    def slow_lookup(instance_id):
+        release.wait(timeout=5)
+        return _make_instance(resolver_stub._hash_api_key("k"))
+
+    resolver_stub.instances_repo.get_by_instance_id.side_effect = slow_lookup
+
+    tasks = [
+        asyncio.create_task(resolver_stub.resolve_from_instance("instance-1"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    release.set()
+    contexts = await asyncio.gather(*tasks)
+
+    assert all(c is not None and c.user_id == "user-1" for c in contexts)
+    assert resolver_stub.instances_repo.get_by_instance_id.call_count == 1
+    assert resolver_stub._inflight == {}
+
+
+def test_tenant_context_is_active_with_runtime_status_string():
+    status = "".join(["act", "ive"])  # not a compile-time constant
+    context = TenantContext(
+        tenant_id="tenant-1",
+        user_id="user-1",
+        instance_id="instance-1",
+        phone_number="5511999999999",
+        status=status,
+    )
+
+    assert context.is_active() is True
+    assert _make_tenant_context().is_active() is True
+
+
+def test_tenant_context_is_active_after_unpickle():
+    restored = pickle.loads(pickle.dumps(_make_tenant_context()))
+
+    assert restored.is_active() is True
+    assert restored.normalized_phone == "15551234567"
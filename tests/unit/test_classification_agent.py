@@ -8,6 +8,7 @@ from jaiminho_notificacoes.processing.agents import (
     ClassificationAgent,
     ClassificationResult
 )
+from jaiminho_notificacoes.processing.categories import CAT_WORK
 from jaiminho_notificacoes.processing.urgency_engine import UrgencyDecision
 from jaiminho_notificacoes.persistence.models import (
     NormalizedMessage,
@@ -278,6 +279,8 @@ class TestClassificationAgent:
         result = agent._parse_classification_response(response)
         
         assert result.category == "💼 Trabalho e Negócios"
+        # Parsed categories resolve to the shared interned constant
+        assert result.category is CAT_WORK
         assert result.summary == "Reunião confirmada para amanhã"
         assert result.routing == "digest"
         assert result.confidence == 0.85
@@ -399,6 +402,75 @@ class TestClassificationAgent:
         assert result is not None
         assert result.category in agent.CATEGORIES
 
+    @pytest.mark.asyncio
+    async def test_run_batch_single_llm_call(self, sample_message):
+        """Test that run_batch classifies all messages with one LLM call."""
+        agent = ClassificationAgent()
+        delivery_message = sample_message.model_copy(
+            update={"content": MessageContent(text="Seu pedido foi enviado pelos Correios")}
+        )
+
+        with patch.object(agent, '_call_llm', wraps=agent._call_llm) as batch_call:
+            results = await agent.run_batch(
+                [sample_message, delivery_message],
+                [UrgencyDecision.NOT_URGENT, UrgencyDecision.URGENT],
+                [0.8, 0.9]
+            )
+
+        assert batch_call.call_count == 1
+        assert len(results) == 2
+        assert results[0].category == "💼 Trabalho e Negócios"
+        assert results[1].category == "📦 Entregas e Compras"
+        assert results[0].routing == "digest"
+        assert results[1].routing == "immediate"
+
+    @pytest.mark.asyncio
+    async def test_run_batch_splits_large_batches(self, sample_message):
+        """Test that large batches are split into concurrent chunks."""
+        agent = ClassificationAgent()
+        agent.MAX_BATCH_SIZE = 2
+        messages = [sample_message] * 5
+
+        with patch.object(agent, '_call_llm', wraps=agent._call_llm) as batch_call:
+            results = await agent.run_batch(
+                messages,
+                [UrgencyDecision.NOT_URGENT] * 5,
+                [0.8] * 5,
+                concurrency_limit=2
+            )
+
+        assert batch_call.call_count == 3
+        assert len(results) == 5
+        assert all(r.category == "💼 Trabalho e Negócios" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_run_batch_rejects_mixed_users(self, sample_message):
+        """Test that a batch never mixes messages from different users."""
+        agent = ClassificationAgent()
+        other_user = sample_message.model_copy(update={"user_id": "other_user"})
+
+        with pytest.raises(ValueError, match="same tenant_id and user_id"):
+            await agent.run_batch(
+                [sample_message, other_user],
+                [UrgencyDecision.NOT_URGENT] * 2,
+                [0.7] * 2
+            )
+
+    @pytest.mark.asyncio
+    async def test_run_batch_fallback_on_invalid_response(self, sample_message):
+        """Test fallback when the batched response has the wrong size."""
+        agent = ClassificationAgent()
+
+        with patch.object(agent, '_call_llm', return_value='[]'):
+            results = await agent.run_batch(
+                [sample_message, sample_message],
+                [UrgencyDecision.NOT_URGENT, UrgencyDecision.URGENT],
+                [0.7, 0.9]
+            )
+
+        assert [r.category for r in results] == ["❓ Outros", "❓ Outros"]
+        assert [r.routing for r in results] == ["digest", "immediate"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,6 +1,7 @@
 """Unit tests for Daily Digest Agent."""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -200,7 +201,38 @@ class TestDigestAgent:
         # Check formatting
         assert "*" in text  # Bold markers
         assert "•" in text  # Bullet points
+
+        # Rendering is cached on the digest instance
+        assert digest.to_whatsapp_text() is text
+
+        # The digest is frozen, so the cached rendering cannot go stale
+        with pytest.raises(FrozenInstanceError):
+            digest.total_messages = 0
+        assert isinstance(digest.categories, tuple)
     
+    @pytest.mark.asyncio
+    async def test_generate_digests_for_users(self, tenant_context, sample_messages):
+        """Test batch digest generation keeps per-user order and isolation."""
+        agent = DigestAgent()
+        other_context = TenantContext(
+            tenant_id="tenant_1",
+            user_id="user_2",
+            instance_id="inst_2",
+            phone_number="5511888888888",
+            status="active"
+        )
+
+        digests = await agent.generate_digests_for_users(
+            [(tenant_context, sample_messages), (other_context, [])],
+            date="2026-01-03"
+        )
+
+        assert [d.user_id for d in digests] == ["user_1", "user_2"]
+        assert [d.total_messages for d in digests] == [3, 0]
+
+        with pytest.raises(ValueError, match="Cross-user data"):
+            await agent.generate_digests_for_users([(other_context, sample_messages)])
+
     def test_singleton_pattern(self):
         """Test that get_digest_agent returns singleton."""
         agent1 = get_digest_agent()
@@ -10,6 +10,7 @@ Tests cover:
 - Idempotency
 """
 
+import asyncio
 import json
 import pytest
 import os
@@ -339,6 +340,11 @@ class TestUserFeedbackProcessor:
 
         assert response_time == 300.0
 
+    def test_calculate_response_time_epoch_seconds(self):
+        """Test response time calculation with epoch-second sent_at."""
+        response_time = UserFeedbackProcessor._calculate_response_time(1705340100, 1705340400)
+        assert response_time == 300.0
+
     def test_calculate_response_time_no_sent_at(self):
         """Test response time calculation without sent_at."""
         response_time = UserFeedbackProcessor._calculate_response_time(None, 1705340400)
@@ -408,6 +414,29 @@ class TestFeedbackHandler:
             assert len(results) == 3
             assert all(r.success for r in results)
 
+    @pytest.mark.asyncio
+    async def test_handle_batch_webhooks_bounded_concurrency(self):
+        """Test batch webhooks run concurrently up to the configured cap."""
+        handler = FeedbackHandler(batch_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_process(event):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return FeedbackProcessingResult(success=True, message_id=event['message_id'])
+
+        events = [{'message_id': f'sendpulse_{i}'} for i in range(5)]
+
+        with patch.object(handler.processor, 'process_feedback', side_effect=fake_process):
+            results = await handler.handle_batch_webhooks(events)
+
+        assert [r.message_id for r in results] == [e['message_id'] for e in events]
+        assert max_in_flight == 2
+
 
 class TestSingleton:
     """Test singleton pattern."""
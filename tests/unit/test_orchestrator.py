@@ -17,7 +17,8 @@ from jaiminho_notificacoes.persistence.models import (
     MessageMetadata,
     MessageSecurity,
     MessageSource,
-    ProcessingDecision
+    ProcessingDecision,
+    ProcessingResult
 )
 
 
@@ -281,6 +282,27 @@ class TestAuditTrail:
         assert summary["tenant_id"] == base_message.tenant_id
         assert summary["message_id"] == base_message.message_id
 
+    def test_audit_by_step_index(self):
+        """Test that ProcessingResult indexes audit entries by step."""
+        result = ProcessingResult(
+            message_id="test-msg-001",
+            tenant_id="tenant-abc",
+            user_id="user-xyz",
+            decision=ProcessingDecision.DIGEST,
+            rule_engine_decision="undecided",
+            rule_confidence=0.0,
+            llm_used=True,
+            audit_trail=[
+                {"step": "rule_engine", "decision": "undecided"},
+                {"step": "classification_agent", "category": "work"},
+                {"step": "classification_agent", "category": "retry"},
+            ],
+            processed_at=datetime.now().isoformat(),
+        )
+
+        assert result.audit_by_step["classification_agent"]["category"] == "work"
+        assert result.audit_by_step.get("audit_log") is None
+
 
 class TestSingleton:
     """Test singleton pattern."""
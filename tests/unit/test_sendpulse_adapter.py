@@ -1,9 +1,11 @@
 """Unit tests for SendPulse adapter."""
 
+import asyncio
 import os
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import json
+import time
 from datetime import datetime
 
 from jaiminho_notificacoes.outbound.sendpulse import (
@@ -11,6 +13,7 @@ from jaiminho_notificacoes.outbound.sendpulse import (
     SendPulseContent,
     SendPulseMessage,
     SendPulseResponse,
+    SendPulseBatchResult,
     SendPulseAuthenticator,
     SendPulseUserResolver,
     SendPulseUrgentNotifier,
@@ -20,6 +23,9 @@ from jaiminho_notificacoes.outbound.sendpulse import (
     NotificationType,
     SendPulseNotificationFactory
 )
+from jaiminho_notificacoes.lambda_handlers.send_notifications import (
+    send_batch_notifications_async
+)
 
 
 class TestSendPulseButton:
@@ -36,6 +42,15 @@ class TestSendPulseButton:
         assert button.title == 'Yes'
         assert button.action == 'reply'
 
+    def test_button_is_immutable(self):
+        """Test buttons are frozen so templates can be shared."""
+        button = SendPulseButton(id='btn_1', title='Yes', action='reply')
+        with pytest.raises(AttributeError):
+            button.title = 'No'
+
+        content = SendPulseContent(text='Hi', buttons=(button,))
+        assert content.validate() == (True, "")
+
 
 class TestSendPulseContent:
     """Tests for SendPulseContent."""
@@ -241,6 +256,26 @@ class TestSendPulseAuthenticator:
                     assert creds['client_id'] == 'test_client'
                     assert creds['client_secret'] == 'test_secret'
 
+    @pytest.mark.asyncio
+    async def test_concurrent_token_requests_refresh_once(self):
+        """Concurrent callers share a single token refresh."""
+        auth = SendPulseAuthenticator()
+        calls = 0
+
+        async def fake_refresh():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            auth.token = 'token_123'
+            auth.token_expires_at = time.time() + 3600
+            return auth.token
+
+        with patch.object(auth, '_refresh_token', side_effect=fake_refresh):
+            tokens = await asyncio.gather(*(auth.get_token() for _ in range(5)))
+
+        assert tokens == ['token_123'] * 5
+        assert calls == 1
+
     @pytest.mark.asyncio
     async def test_token_caching(self):
         """Test token caching."""
@@ -577,6 +612,54 @@ class TestSendPulseManager:
             assert len(responses) == 2
             assert all(r.success for r in responses)
 
+    @pytest.mark.asyncio
+    async def test_send_batch_result_columns(self):
+        """Batch result exposes success/error columns parallel to responses."""
+        manager = SendPulseManager()
+
+        async def fake_send(tenant_id, user_id, content_text, message_type):
+            if user_id == 'user_2':
+                return SendPulseResponse(success=False, error='no phone')
+            return SendPulseResponse(success=True)
+
+        with patch.object(manager, 'send_notification', side_effect=fake_send):
+            result = await manager.send_batch(
+                tenant_id='tenant_1',
+                user_ids=['user_1', 'user_2', 'user_3'],
+                content_text='Digest'
+            )
+
+        assert result.success == [True, False, True]
+        assert result.errors == [None, 'no phone', None]
+        assert (result.successful, result.failed) == (2, 1)
+        assert result[1].error == 'no phone'
+
+    @pytest.mark.asyncio
+    async def test_send_batch_bounded_concurrency(self):
+        """Batch sends keep at most max_concurrency in flight, in order."""
+        manager = SendPulseManager()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_send(tenant_id, user_id, content_text, message_type):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return SendPulseResponse(success=True, message_id=user_id)
+
+        with patch.object(manager, 'send_notification', side_effect=fake_send):
+            responses = await manager.send_batch(
+                tenant_id='tenant_1',
+                user_ids=[f'user_{i}' for i in range(6)],
+                content_text='Digest',
+                max_concurrency=3
+            )
+
+        assert [r.message_id for r in responses] == [f'user_{i}' for i in range(6)]
+        assert max_in_flight == 3
+
     @pytest.mark.asyncio
     async def test_send_feedback_missing_instance(self):
         """Feedback notification without instance returns error."""
@@ -617,3 +700,83 @@ class TestSendPulseManager:
                 send_arg = mock_sender.send.call_args[0][0]
                 assert send_arg.wapi_instance_id == 'instance-abc'
                 assert 'wapi_instance_id' not in send_arg.metadata
+
+    @pytest.mark.asyncio
+    async def test_senders_share_pooled_session(self):
+        """Sends reuse one HTTP session until the manager is closed."""
+        manager = SendPulseManager()
+
+        with patch.object(manager.resolver, 'resolve_phone', return_value='554899999999'):
+            with patch('jaiminho_notificacoes.outbound.sendpulse.SendPulseNotificationFactory.get_sender') as mock_factory:
+                mock_sender = AsyncMock()
+                mock_sender.send = AsyncMock(return_value=SendPulseResponse(success=True))
+                mock_factory.return_value = mock_sender
+
+                for _ in range(2):
+                    await manager.send_notification(
+                        tenant_id='tenant_1',
+                        user_id='user_1',
+                        content_text='Hello'
+                    )
+
+                sessions = [c.kwargs['session'] for c in mock_factory.call_args_list]
+                assert sessions[0] is sessions[1]
+                assert all(
+                    c.kwargs['authenticator'] is manager.authenticator
+                    for c in mock_factory.call_args_list
+                )
+
+        await manager.aclose()
+        assert sessions[0].closed
+
+
+class TestSendBatchNotificationsHandler:
+    """Tests for the batch path of the send_notifications Lambda."""
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_reports_counts(self):
+        """Batch handler summarizes the batch result without erroring."""
+        manager = MagicMock()
+        manager.send_batch = AsyncMock(return_value=SendPulseBatchResult([
+            SendPulseResponse(success=True, message_id='msg_1'),
+            SendPulseResponse(success=False, error='no phone'),
+        ]))
+        manager.aclose = AsyncMock()
+
+        with patch(
+            'jaiminho_notificacoes.lambda_handlers.send_notifications.SendPulseManager',
+            return_value=manager
+        ):
+            response = await send_batch_notifications_async({
+                'tenant_id': 'tenant_1',
+                'user_ids': ['user_1', 'user_2'],
+                'content_text': 'Digest'
+            })
+
+        body = json.loads(response['body'])
+        assert response['statusCode'] == 207
+        assert (body['total'], body['successful'], body['failed']) == (2, 1, 1)
+        manager.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_all_successful(self):
+        """Fully successful batch returns 200."""
+        manager = MagicMock()
+        manager.send_batch = AsyncMock(return_value=SendPulseBatchResult([
+            SendPulseResponse(success=True, message_id='msg_1'),
+        ]))
+        manager.aclose = AsyncMock()
+
+        with patch(
+            'jaiminho_notificacoes.lambda_handlers.send_notifications.SendPulseManager',
+            return_value=manager
+        ):
+            response = await send_batch_notifications_async({
+                'tenant_id': 'tenant_1',
+                'user_ids': ['user_1'],
+                'content_text': 'Digest'
+            })
+
+        body = json.loads(response['body'])
+        assert response['statusCode'] == 200
+        assert (body['successful'], body['failed']) == (1, 0)
@@ -87,7 +87,21 @@ class TestWebhookSecurityValidator:
         assert error is None
         assert isinstance(event, WAPIWebhookEvent)
         assert event.instance == "test-instance-123"
-    
+
+    @pytest.mark.asyncio
+    async def test_parse_request_keeps_parsed_payload(
+        self,
+        api_gateway_event,
+        valid_webhook_payload
+    ):
+        """Test that the parsed body is returned alongside the event."""
+        validator = WebhookSecurityValidator()
+        event, payload, error = await validator.parse_request(api_gateway_event)
+
+        assert error is None
+        assert event.instance == "test-instance-123"
+        assert payload == valid_webhook_payload
+
     @pytest.mark.asyncio
     async def test_validate_invalid_json(self):
         """Test validation with invalid JSON."""
@@ -293,7 +307,47 @@ class TestMessageIngestionHandler:
         body = json.loads(response['body'])
         assert body['success'] is False
         assert 'Failed to queue' in body['error']
-    
+
+    @pytest.mark.asyncio
+    @patch('jaiminho_notificacoes.lambda_handlers.ingest_whatsapp.SQS_QUEUE_URL', 'queue-url')
+    @patch('jaiminho_notificacoes.lambda_handlers.ingest_whatsapp.sqs_client')
+    async def test_process_webhook_batch_sends_in_chunks(
+        self,
+        mock_sqs,
+        valid_webhook_payload,
+        lambda_context,
+        tenant_context
+    ):
+        """Test that accepted webhooks are queued 10 per SQS request."""
+        records = [
+            {"messageId": f"rec-{i}", "body": json.dumps(valid_webhook_payload)}
+            for i in range(11)
+        ]
+        records.append({"messageId": "rec-bad", "body": "invalid json {"})
+        mock_sqs.send_message_batch.side_effect = [
+            {'Successful': [], 'Failed': [{'Id': '3', 'Code': 'InternalError'}]},
+            {'Successful': [], 'Failed': []}
+        ]
+
+        handler = MessageIngestionHandler()
+
+        with patch.object(
+            handler.middleware,
+            'validate_and_resolve',
+            new_callable=AsyncMock
+        ) as mock_validate:
+            mock_validate.return_value = (tenant_context, {})
+
+            response = await handler.process_webhook_batch(records, lambda_context)
+
+        sizes = [
+            len(call.kwargs['Entries'])
+            for call in mock_sqs.send_message_batch.call_args_list
+        ]
+        assert sizes == [10, 1]
+        # Only the transient SQS failure is retried; bad JSON is dropped
+        assert response == {'batchItemFailures': [{'itemIdentifier': 'rec-3'}]}
+
     @pytest.mark.asyncio
     async def test_ignore_unsupported_event_types(
         self,
@@ -364,6 +418,8 @@ class TestSecurityScenarios:
             response = await handler.process_webhook(event, lambda_context)
         
         assert response['statusCode'] == 403
+        # The middleware sees the raw payload, not the schema-filtered model
+        assert mock_validate.call_args.kwargs['payload']['user_id'] == "injected-user-123"
     
     @pytest.mark.asyncio
     async def test_payload_with_injected_tenant_id(